@@ -3,20 +3,60 @@ title: Auto-Web-Search
 author: WillLiang713
 description: A tool for performing automated web searches.
 git_url: https://github.com/WillLiang713/Open-WebUI-Extensions
-version: 1.0.0
+version: 1.8.12
 required_open_webui_version: >= 0.6.0
 """
 
+import asyncio
+import codecs
 import json
-from typing import Any, Literal, Optional, cast
-from urllib.parse import urlparse
+import math
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from functools import partial
+from html.parser import HTMLParser
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Literal,
+    Optional,
+    cast,
+)
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
+import httpx
+from langchain_core.documents import Document
+from open_webui.env import DATA_DIR
 from open_webui.main import Request, app
 from open_webui.models.users import UserModel, Users
+from open_webui.retrieval.loaders.main import Loader
 from open_webui.retrieval.utils import get_content_from_url
+from open_webui.retrieval.web.utils import validate_url
 from open_webui.routers.retrieval import SearchForm, process_web_search
 from pydantic import BaseModel, Field
 
+try:
+    from owui_runtime import TTLCache, get_http_client, metrics, run_blocking, span
+except ImportError:
+    # Without the shared runtime: a client per fetch, a user cache of our
+    # own, the default thread pool and no metrics
+    TTLCache = get_http_client = metrics = None
+    run_blocking = asyncio.to_thread
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
 
 async def emit_status(
     description: str,
@@ -56,12 +96,852 @@ async def emit_status(
 
 
 async def get_request() -> Request:
+    """
+    Build a Request bound to the Open WebUI app. Each call gets its own, so
+    request.state is never shared between concurrent calls or users.
+    """
     return Request(scope={"type": "http", "app": app})
 
 
+# Upper bound on USER_CACHE_TTL, so a revoked or demoted user loses access quickly
+USER_CACHE_MAX_TTL = 30.0
+
+_user_cache = TTLCache(maxsize=1024, name="web_search.user") if TTLCache else None
+# user id -> (user, expires_at), used instead when the runtime is not installed
+_users: dict[str, tuple[UserModel, float]] = {}
+
+
+async def get_user(user_id: str, ttl: float) -> Optional[UserModel]:
+    """
+    Look up a user by id off the event loop, caching hits for ttl seconds
+    (at most USER_CACHE_MAX_TTL). A ttl of 0 disables the cache.
+    """
+    load = partial(run_blocking, Users.get_user_by_id, user_id)
+    if ttl <= 0:
+        return await load()
+    ttl = min(ttl, USER_CACHE_MAX_TTL)
+    if _user_cache is not None:
+        user = await _user_cache.get_or_load(user_id, load, ttl=ttl)
+        if user is None:
+            # Don't remember misses; the user may be created later
+            _user_cache.pop(user_id)
+        return user
+
+    entry = _users.get(user_id)
+    if entry is not None and time.time() < entry[1]:
+        return entry[0]
+    user = await load()
+    _users.pop(user_id, None)
+    if user is not None:
+        if len(_users) >= 1024:
+            _users.pop(next(iter(_users)))
+        _users[user_id] = (user, time.time() + ttl)
+    return user
+
+
+# Runs of CJK characters, or of any other letters/digits (Unicode-aware, so "café" stays whole)
+_TOKEN_RE = re.compile(r"[\u3400-\u9fff]+|[^\W_\u3400-\u9fff]+")
+_CJK_RE = re.compile(r"[\u3400-\u9fff]")
+_SENTENCE_RE = re.compile(r"(?<=[.!?。！？；;])\s*")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words and CJK character bigrams."""
+    terms: list[str] = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if _CJK_RE.match(run):
+            if len(run) == 1:
+                terms.append(run)
+            else:
+                terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            terms.append(run)
+    return terms
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: one per CJK character, one per four other characters."""
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + math.ceil((len(text) - cjk) / 4)
+
+
+def split_passages(text: str, max_chars: int) -> list[str]:
+    """Split page text into passages of roughly max_chars, on paragraph then sentence boundaries."""
+    passages: list[str] = []
+    current = ""
+    for block in re.split(r"\n\s*\n|\n", text):
+        block = block.strip()
+        if not block:
+            continue
+        pieces = [block]
+        if len(block) > max_chars:
+            pieces = [p for p in _SENTENCE_RE.split(block) if p.strip()]
+        for piece in pieces:
+            while len(piece) > max_chars:
+                passages.append(piece[:max_chars])
+                piece = piece[max_chars:]
+            if current and len(current) + len(piece) + 1 > max_chars:
+                passages.append(current)
+                current = ""
+            current = f"{current}\n{piece}" if current else piece
+    if current:
+        passages.append(current)
+    return passages
+
+
+class BM25Index:
+    """Minimal in-memory Okapi BM25 index over a list of passages."""
+
+    def __init__(self, passages: list[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(p)) for p in passages]
+        self.lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        doc_freq: Counter = Counter()
+        for tf in self.term_freqs:
+            doc_freq.update(tf.keys())
+        n = len(passages)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def score(self, query: str) -> list[float]:
+        terms = set(tokenize(query))
+        scores = []
+        for tf, length in zip(self.term_freqs, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    score += self.idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            scores.append(score)
+        return scores
+
+
+def select_passages(
+    text: str,
+    query: Optional[str],
+    top_k: int,
+    token_budget: int,
+    passage_chars: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Rank passages of text against query and keep the best top_k within token_budget.
+    Without a query, or when nothing matches, the leading passages are kept. Returns the selected passages in
+    document order and the total number of passages on the page.
+    """
+    passages = split_passages(text, passage_chars)
+    if not passages:
+        return [], 0
+
+    scores = BM25Index(passages).score(query) if query else [0.0] * len(passages)
+    ranked = sorted(range(len(passages)), key=lambda i: (-scores[i], i))
+    if scores[ranked[0]] > 0:
+        ranked = [i for i in ranked if scores[i] > 0]
+
+    selected: list[int] = []
+    used = 0
+    for i in ranked:
+        if len(selected) >= top_k:
+            break
+        cost = estimate_tokens(passages[i])
+        if selected and used + cost > token_budget:
+            continue
+        selected.append(i)
+        used += cost
+
+    return [
+        {"index": i, "score": round(scores[i], 3), "content": passages[i]}
+        for i in sorted(selected)
+    ], len(passages)
+
+
+_TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "mc_cid",
+    "mc_eid",
+    "igshid",
+    "ref_src",
+    "spm",
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key: lowercase scheme and host, drop default
+    ports, fragments and tracking parameters, and sort the remaining query string.
+    """
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or "http").lower()
+    host = (parsed.hostname or "").lower()
+    if parsed.port and not (
+        (scheme == "http" and parsed.port == 80)
+        or (scheme == "https" and parsed.port == 443)
+    ):
+        host = f"{host}:{parsed.port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parsed.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return urlunparse((scheme, host, path, "", urlencode(query), ""))
+
+
+_ALIAS_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.", "wap.")
+
+
+def _strip_alias_host(host: str) -> str:
+    for prefix in _ALIAS_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            return host[len(prefix) :]
+    return host
+
+
+def result_key(url: str) -> str:
+    """
+    Deduplication key for a search result: the canonical URL with the scheme
+    folded to https and www./m./mobile. style host prefixes removed. Only used
+    for comparison; a URL that cannot be canonicalized is its own key.
+    """
+    try:
+        parsed = urlparse(canonicalize_url(url))
+    except ValueError:
+        return url.strip()
+    return urlunparse(
+        ("https", _strip_alias_host(parsed.netloc), parsed.path, "", parsed.query, "")
+    )
+
+
+def _preferred_source(current: str, candidate: str) -> str:
+    """Prefer https over http, then the non-mobile host, between two equivalent URLs."""
+
+    def rank(url: str) -> tuple[bool, bool]:
+        try:
+            parsed = urlparse(url)
+            host = parsed.hostname or ""
+        except ValueError:
+            return False, False
+        return parsed.scheme == "https", _strip_alias_host(host) == host or host.startswith("www.")
+
+    return candidate if rank(candidate) > rank(current) else current
+
+
+def merge_search_results(
+    results: list[dict[str, Any]],
+    queries: list[str],
+    max_snippet_chars: int,
+    max_total_chars: int,
+) -> list[dict[str, Any]]:
+    """
+    Merge duplicate results that point to the same page, keeping the longest
+    snippet and recording which queries matched each page. Snippets are cut to
+    max_snippet_chars each and max_total_chars overall, in result order.
+    Results keep the URL the engine returned; the canonical form is only the
+    deduplication key.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for result in results:
+        source = result.get("source") or ""
+        key = result_key(source) if source else f"#{len(merged)}"
+        entry = merged.get(key)
+        if entry is None:
+            merged[key] = {
+                "source": source,
+                "title": result.get("title") or "",
+                "content": result.get("content") or "",
+                "queries": list(result.get("queries") or []),
+            }
+            continue
+        if source:
+            entry["source"] = _preferred_source(entry["source"], source)
+        if len(result.get("content") or "") > len(entry["content"]):
+            entry["content"] = result["content"]
+        if not entry["title"]:
+            entry["title"] = result.get("title") or ""
+        for query in result.get("queries") or []:
+            if query not in entry["queries"]:
+                entry["queries"].append(query)
+
+    query_terms = [(query, set(tokenize(query))) for query in queries]
+    remaining = max_total_chars
+    for entry in merged.values():
+        if not entry["queries"] and len(queries) > 1:
+            text_terms = set(tokenize(f"{entry['title']} {entry['content']}"))
+            entry["queries"] = [q for q, terms in query_terms if terms & text_terms]
+        content = entry["content"][: min(max_snippet_chars, remaining)]
+        if len(content) < len(entry["content"]):
+            content = content.rstrip() + "…" if content else ""
+        entry["content"] = content
+        remaining = max(0, remaining - len(content))
+        if not entry["queries"]:
+            del entry["queries"]
+
+    return list(merged.values())
+
+
+class PageCache:
+    """
+    On-disk cache of fetched pages stored as zlib-compressed JSON in SQLite.
+
+    WAL mode and a busy timeout make it safe to share between worker processes.
+    Total blob size is bounded by max_bytes with least-recently-used eviction.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM pages WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE pages SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        entry = json.loads(zlib.decompress(row[0]))
+        entry.update(etag=row[1], last_modified=row[2], fetched_at=row[3])
+        return entry
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        docs: list[dict[str, Any]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        body = zlib.compress(
+            json.dumps({"content": content, "docs": docs}, ensure_ascii=False).encode(),
+            6,
+        )
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), etag, last_modified, now, now),
+            )
+            self._evict(conn)
+
+    def refresh(self, key: str) -> None:
+        """Mark an entry as fresh again after a successful revalidation."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM pages ORDER BY accessed_at"
+        ):
+            victims.append((key,))
+            freed += size
+            if total - freed <= self.max_bytes:
+                break
+        conn.executemany("DELETE FROM pages WHERE key = ?", victims)
+
+
+_page_caches: dict[str, PageCache] = {}
+_page_caches_lock = threading.Lock()
+
+
+def get_page_cache(path: str, max_bytes: int) -> PageCache:
+    """Return the process-wide PageCache for path, creating it on first use."""
+    path = path or os.path.join(DATA_DIR, "cache", "auto_web_search", "pages.sqlite3")
+    with _page_caches_lock:
+        cache = _page_caches.get(path)
+        if cache is None:
+            cache = _page_caches[path] = PageCache(path, max_bytes)
+        cache.max_bytes = max_bytes
+        return cache
+
+
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+
+@asynccontextmanager
+async def open_url(
+    method: str,
+    url: str,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 30.0,
+) -> AsyncIterator[httpx.Response]:
+    """
+    Send a streaming request to a model-supplied URL. The URL and every
+    redirect target are checked with Open WebUI's validate_url (which rejects
+    private addresses unless local web fetch is enabled) before connecting.
+    """
+    if get_http_client is not None:
+        client_context = nullcontext(get_http_client())
+    else:
+        client_context = httpx.AsyncClient(trust_env=True)
+    async with client_context as client:
+        for _ in range(MAX_REDIRECTS + 1):
+            await run_blocking(validate_url, url)
+            request = client.build_request(method, url, headers=headers, timeout=timeout)
+            response = await client.send(request, stream=True, follow_redirects=False)
+            location = response.headers.get("Location")
+            if response.status_code not in _REDIRECT_STATUSES or not location:
+                break
+            await response.aclose()
+            url = urljoin(str(response.url), location)
+        else:
+            raise ValueError(f"{url} redirected more than {MAX_REDIRECTS} times")
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+
+async def fetch_validators(
+    url: str, etag: Optional[str] = None, last_modified: Optional[str] = None
+) -> tuple[int, Optional[str], Optional[str]]:
+    """
+    Issue a (conditional) HEAD request and return the status code with the
+    ETag and Last-Modified headers. Failures are reported as status 0.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        async with open_url("HEAD", url, headers=headers, timeout=5) as response:
+            return (
+                response.status_code,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+    except Exception:
+        return 0, None, None
+
+
+class TextExtractor(HTMLParser):
+    """
+    Incremental HTML (or plain text) to text converter that stops collecting
+    once max_chars characters have been extracted.
+    """
+
+    _SKIP_TAGS = set("script style noscript template svg head iframe".split())
+    _BLOCK_TAGS = set(
+        "p div br li tr h1 h2 h3 h4 h5 h6 section article header footer "
+        "blockquote pre table ul ol dd dt hr".split()
+    )
+
+    def __init__(self, max_chars: int, html: bool = True):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.html = html
+        self.parts: list[str] = []
+        self.length = 0
+        self.title = ""
+        self.full = False
+        self._skip_depth = 0
+        self._in_title = False
+
+    def feed(self, data: str) -> None:
+        if self.html:
+            super().feed(data)
+        else:
+            self._append(data)
+
+    def handle_starttag(self, tag: str, attrs: Any) -> None:
+        if tag == "title":
+            self._in_title = True
+        elif tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self._BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+            self.title = self.title.strip()
+        elif tag in self._SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self._BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            # The title may arrive in pieces; strip it once it is complete
+            self.title = (self.title + data)[:300]
+        elif not self._skip_depth:
+            self._append(re.sub(r"[ \t\r\f\v]+", " ", data))
+
+    def _append(self, text: str) -> None:
+        if self.full or not text:
+            return
+        remaining = self.max_chars - self.length
+        if len(text) > remaining:
+            text = text[:remaining]
+            self.full = True
+        self.parts.append(text)
+        self.length += len(text)
+
+    def text(self) -> str:
+        # Runs of spaces can span two fed chunks
+        text = re.sub(r"[ \t\r\f\v]+", " ", "".join(self.parts))
+        text = re.sub(r" *\n[ \n]*", "\n", text)
+        return re.sub(r"\n{2,}", "\n\n", text).strip()
+
+
+_TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+# Content extraction settings passed through to Open WebUI's document Loader
+_LOADER_SETTINGS = (
+    "PDF_EXTRACT_IMAGES",
+    "TIKA_SERVER_URL",
+    "DOCLING_SERVER_URL",
+    "DOCLING_PARAMS",
+    "EXTERNAL_DOCUMENT_LOADER_URL",
+    "EXTERNAL_DOCUMENT_LOADER_API_KEY",
+    "DOCUMENT_INTELLIGENCE_ENDPOINT",
+    "DOCUMENT_INTELLIGENCE_KEY",
+    "MISTRAL_OCR_API_KEY",
+    "DATALAB_MARKER_API_KEY",
+    "DATALAB_MARKER_API_BASE_URL",
+    "MINERU_API_MODE",
+    "MINERU_API_URL",
+    "MINERU_API_KEY",
+    "MINERU_PARAMS",
+)
+
+
+async def load_native_page(url: str, max_chars: int) -> tuple[str, list[Any]]:
+    """Load a page with Open WebUI's configured web loader, truncated to max_chars."""
+    content, docs = await run_blocking(
+        get_content_from_url, await get_request(), url
+    )
+    return truncate_docs(content, docs, max_chars)
+
+
+def truncate_docs(
+    content: str, docs: list[Any], max_chars: int
+) -> tuple[str, list[Any]]:
+    """
+    Cut content and its documents down to max_chars. Documents that fit are
+    kept as they are; the one that is cut is marked "truncated" and the rest
+    are dropped.
+    """
+    if len(content or "") <= max_chars:
+        return content, docs
+
+    remaining = max_chars
+    kept = []
+    for doc in docs:
+        if remaining <= 0:
+            break
+        if len(doc.page_content) <= remaining:
+            kept.append(doc)
+        else:
+            kept.append(
+                Document(
+                    page_content=doc.page_content[:remaining],
+                    metadata={**(doc.metadata or {}), "truncated": True},
+                )
+            )
+        remaining -= len(doc.page_content)
+    return content[:max_chars], kept
+
+
+def extract_document(
+    data: bytes, url: str, content_type: str
+) -> tuple[str, list[Any]]:
+    """Extract text from a downloaded file with the admin's content extraction engine."""
+    config = app.state.config
+    try:
+        engine = config.CONTENT_EXTRACTION_ENGINE
+    except (AttributeError, KeyError):
+        engine = ""
+    settings = {}
+    for name in _LOADER_SETTINGS:
+        try:
+            settings[name] = getattr(config, name)
+        except (AttributeError, KeyError):
+            pass
+
+    filename = os.path.basename(urlparse(url).path) or "download"
+    suffix = os.path.splitext(filename)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as file:
+        file.write(data)
+        file.flush()
+        docs = Loader(engine=engine, **settings).load(
+            filename, content_type, file.name
+        )
+    return " ".join(doc.page_content for doc in docs), docs
+
+
+async def load_streaming_page(
+    url: str, max_bytes: int, max_chars: int, timeout: float
+) -> tuple[str, list[Any]]:
+    """
+    Download a page with at most max_bytes read from the network. HTML and
+    plain text are extracted incrementally and stop at max_chars; other
+    content types are downloaded once and handed to Open WebUI's document
+    Loader, and are rejected rather than cut off when they exceed max_bytes.
+    """
+    async with open_url("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        final_url = str(response.url)
+        validators = response.headers
+        content_type = (
+            response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        )
+        extractor = None
+        body = bytearray()
+        downloaded = 0
+        truncated = False
+        if not content_type.startswith(_TEXT_CONTENT_TYPES):
+            length = response.headers.get("Content-Length")
+            if length is not None and length.isdigit() and int(length) > max_bytes:
+                raise ValueError(
+                    f"{content_type} of {length} bytes exceeds the {max_bytes} byte download limit"
+                )
+            async for chunk in response.aiter_bytes(64 * 1024):
+                if len(body) + len(chunk) > max_bytes:
+                    raise ValueError(
+                        f"{content_type} exceeds the {max_bytes} byte download limit"
+                    )
+                body.extend(chunk)
+            downloaded = len(body)
+        else:
+            try:
+                decoder = codecs.getincrementaldecoder(
+                    response.charset_encoding or "utf-8"
+                )(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            extractor = TextExtractor(max_chars, html=content_type != "text/plain")
+            async for chunk in response.aiter_bytes(64 * 1024):
+                # Only a byte beyond max_bytes means the page was cut off
+                if downloaded + len(chunk) > max_bytes:
+                    chunk = chunk[: max_bytes - downloaded]
+                    truncated = True
+                downloaded += len(chunk)
+                extractor.feed(decoder.decode(chunk))
+                if truncated or extractor.full:
+                    break
+            extractor.feed(decoder.decode(b"", final=True))
+            if extractor.html:
+                extractor.close()
+            truncated = truncated or extractor.full
+
+    metadata: dict[str, Any] = {"source": final_url, "downloaded_bytes": downloaded}
+    # Cache validators come from this response rather than a separate HEAD
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        if validators.get(header):
+            metadata[key] = validators[header]
+
+    if extractor is None:
+        content, docs = await run_blocking(
+            extract_document, bytes(body), final_url, content_type
+        )
+        docs = [
+            Document(
+                page_content=doc.page_content,
+                metadata={**(doc.metadata or {}), **metadata},
+            )
+            for doc in docs
+        ]
+        return truncate_docs(content, docs, max_chars)
+
+    content = extractor.text()
+    if extractor.title:
+        metadata["title"] = extractor.title
+    if truncated:
+        metadata["truncated"] = True
+    return content, [Document(page_content=content, metadata=metadata)]
+
+
+async def load_page(
+    url: str,
+    cache: Optional[PageCache] = None,
+    max_age: int = 0,
+    loader: Optional[Callable[[str], Awaitable[tuple[str, list[Any]]]]] = None,
+) -> tuple[str, list[Any]]:
+    """
+    Load a page with loader (the native web loader by default), going through
+    cache when given.
+
+    Fresh entries are served directly. Only the streaming loader records
+    ETag/Last-Modified (Open WebUI's native loader returns no response
+    headers), so only its stale entries are revalidated with a conditional
+    HEAD request; everything else is fetched again once max_age has passed.
+    A miss costs exactly one origin request.
+    """
+    if loader is None:
+        loader = partial(load_native_page, max_chars=sys.maxsize)
+    if cache is None:
+        return await loader(url)
+
+    try:
+        key = canonicalize_url(url)
+    except ValueError:
+        # Malformed URL (e.g. a non-numeric port): cache it under the raw string
+        key = url
+    entry = await run_blocking(cache.get, key)
+    if entry is not None:
+        fresh = time.time() - entry["fetched_at"] < max_age
+        if not fresh and (entry["etag"] or entry["last_modified"]):
+            status, _, _ = await fetch_validators(
+                url, entry["etag"], entry["last_modified"]
+            )
+            if status == 304:
+                await run_blocking(cache.refresh, key)
+                fresh = True
+        if fresh:
+            return entry["content"], [
+                Document(page_content=d["page_content"], metadata=d["metadata"])
+                for d in entry["docs"]
+            ]
+
+    content, docs = await loader(url)
+    first = (docs[0].metadata or {}) if docs else {}
+    await run_blocking(
+        cache.put,
+        key,
+        content,
+        [{"page_content": d.page_content, "metadata": d.metadata or {}} for d in docs],
+        first.get("etag"),
+        first.get("last_modified"),
+    )
+    return content, docs
+
+
+def last_user_message(messages: Optional[list[dict]]) -> Optional[str]:
+    """Return the text of the latest user message, if any."""
+    for message in reversed(messages or []):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(
+                str(part.get("text", ""))
+                for part in content
+                if isinstance(part, dict) and part.get("type") == "text"
+            )
+        return str(content or "").strip() or None
+    return None
+
+
 class Tools:
     class Valves(BaseModel):
-        pass
+        FETCH_MODE: Literal["full", "passages"] = Field(
+            default="full",
+            description="full: return the whole page; passages: return only the passages most relevant to the focus (or the latest user message).",
+        )
+        PASSAGE_TOP_K: int = Field(
+            default=8, description="Maximum number of passages returned per page."
+        )
+        PASSAGE_TOKEN_BUDGET: int = Field(
+            default=3000,
+            description="Approximate token budget for the passages returned per page.",
+        )
+        PASSAGE_CHARS: int = Field(
+            default=800, description="Target passage size in characters."
+        )
+        PAGE_CACHE_ENABLED: bool = Field(
+            default=True,
+            description="Cache fetched pages on disk, shared by all worker processes.",
+        )
+        PAGE_CACHE_PATH: str = Field(
+            default="",
+            description="SQLite file for the page cache. Defaults to DATA_DIR/cache/auto_web_search/pages.sqlite3.",
+        )
+        PAGE_CACHE_MAX_AGE: int = Field(
+            default=3600,
+            description="Seconds a cached page is served as is. After that, pages fetched with the streaming loader are revalidated with ETag/Last-Modified; others are fetched again.",
+        )
+        PAGE_CACHE_MAX_BYTES: int = Field(
+            default=256 * 1024 * 1024,
+            description="Upper bound on compressed page cache size in bytes; least recently used pages are evicted.",
+        )
+        FETCH_LOADER: Literal["native", "streaming"] = Field(
+            default="native",
+            description="native: use Open WebUI's configured web loader; streaming: validate the URL and each redirect with Open WebUI's URL check, then download at most the byte limit and extract text incrementally.",
+        )
+        FETCH_MAX_BYTES: int = Field(
+            default=5 * 1024 * 1024,
+            description="Maximum bytes downloaded per page by the streaming loader.",
+        )
+        FETCH_MAX_CHARS: int = Field(
+            default=200_000,
+            description="Maximum characters of extracted text kept per page.",
+        )
+        FETCH_TIMEOUT: float = Field(
+            default=30.0, description="Timeout in seconds for the streaming loader."
+        )
+        SEARCH_SNIPPET_CHARS: int = Field(
+            default=500,
+            description="Maximum snippet length per search result, in characters.",
+        )
+        SEARCH_TOTAL_CHARS: int = Field(
+            default=6000,
+            description="Maximum combined snippet length across all search results, in characters.",
+        )
+        USER_CACHE_TTL: float = Field(
+            default=5.0,
+            description="Seconds a user lookup is reused across tool calls (at most 30), so role or access changes apply quickly. 0 disables the cache.",
+        )
+        SEARCH_MODE: Literal["per_query", "batch"] = Field(
+            default="per_query",
+            description="per_query: run each query concurrently and emit results as each finishes; batch: send all queries in one request.",
+        )
+        SEARCH_DEADLINE: float = Field(
+            default=20.0,
+            description="Overall seconds to wait for search results; whatever has arrived is returned. 0 disables the deadline.",
+        )
 
     def __init__(self):
         self.valves = self.Valves()
@@ -101,7 +981,11 @@ class Tools:
                             "url": {
                                 "type": "string",
                                 "description": "The URL to browse and retrieve content from.",
-                            }
+                            },
+                            "focus": {
+                                "type": "string",
+                                "description": "Optional description of the information needed from the page. When passage mode is enabled, only the most relevant passages are returned.",
+                            },
                         },
                         "required": ["url"],
                     },
@@ -115,46 +999,108 @@ class Tools:
         queries: Optional[list[str]] = None,
         __event_emitter__: Any = None,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> str:
         """Search the web for a query."""
-        if __user__ is None:
-            raise ValueError("User information is required")
-
-        merged_queries: list[str] = []
-        if search_queries:
-            merged_queries.extend(search_queries)
-        if queries:
-            merged_queries.extend(queries)
-        if not merged_queries:
-            raise ValueError("search_queries is required")
-
-        user = Users.get_user_by_id(__user__["id"])
-        if user is None:
-            raise ValueError("User not found")
+        with span("web_search.web_search", __metadata__ or {}):
+            if __user__ is None:
+                raise ValueError("User information is required")
 
-        return await native_web_search(
-            merged_queries, emitter=__event_emitter__, user=user
-        )
+            merged_queries: list[str] = []
+            if search_queries:
+                merged_queries.extend(search_queries)
+            if queries:
+                merged_queries.extend(queries)
+            if not merged_queries:
+                raise ValueError("search_queries is required")
+
+            with span("web_search.user_lookup"):
+                user = await get_user(__user__["id"], self.valves.USER_CACHE_TTL)
+            if user is None:
+                raise ValueError("User not found")
+
+            return await native_web_search(
+                merged_queries,
+                emitter=__event_emitter__,
+                user=user,
+                max_snippet_chars=self.valves.SEARCH_SNIPPET_CHARS,
+                max_total_chars=self.valves.SEARCH_TOTAL_CHARS,
+                per_query=self.valves.SEARCH_MODE == "per_query",
+                deadline=self.valves.SEARCH_DEADLINE,
+            )
 
     async def fetch_url_content(
         self,
         url: str,
+        focus: Optional[str] = None,
         __event_emitter__: Any = None,
         __user__: Optional[dict] = None,
+        __messages__: Optional[list[dict]] = None,
+        __metadata__: Optional[dict] = None,
     ) -> str:
         """Fetch content from a URL."""
-        if __user__ is None:
-            raise ValueError("User information is required")
+        with span("web_search.fetch_url_content", __metadata__ or {}, url=url):
+            if __user__ is None:
+                raise ValueError("User information is required")
 
-        user = Users.get_user_by_id(__user__["id"])
-        if user is None:
-            raise ValueError("User not found")
+            with span("web_search.user_lookup"):
+                user = await get_user(__user__["id"], self.valves.USER_CACHE_TTL)
+            if user is None:
+                raise ValueError("User not found")
 
-        return await fetch_url(url, emitter=__event_emitter__, user=user)
+            cache = None
+            if self.valves.PAGE_CACHE_ENABLED:
+                cache = get_page_cache(
+                    self.valves.PAGE_CACHE_PATH, self.valves.PAGE_CACHE_MAX_BYTES
+                )
 
+            if self.valves.FETCH_LOADER == "streaming":
+                loader = partial(
+                    load_streaming_page,
+                    max_bytes=self.valves.FETCH_MAX_BYTES,
+                    max_chars=self.valves.FETCH_MAX_CHARS,
+                    timeout=self.valves.FETCH_TIMEOUT,
+                )
+            else:
+                loader = partial(load_native_page, max_chars=self.valves.FETCH_MAX_CHARS)
+
+            passage_query = None
+            if self.valves.FETCH_MODE == "passages":
+                passage_query = focus or last_user_message(__messages__) or ""
+
+            return await fetch_url(
+                url,
+                emitter=__event_emitter__,
+                user=user,
+                cache=cache,
+                cache_max_age=self.valves.PAGE_CACHE_MAX_AGE,
+                loader=loader,
+                passage_query=passage_query,
+                top_k=self.valves.PASSAGE_TOP_K,
+                token_budget=self.valves.PASSAGE_TOKEN_BUDGET,
+                passage_chars=self.valves.PASSAGE_CHARS,
+            )
+
+
+async def fetch_url(
+    url: str,
+    emitter: Any,
+    user: UserModel,
+    cache: Optional[PageCache] = None,
+    cache_max_age: int = 0,
+    loader: Optional[Callable[[str], Awaitable[tuple[str, list[Any]]]]] = None,
+    passage_query: Optional[str] = None,
+    top_k: int = 8,
+    token_budget: int = 3000,
+    passage_chars: int = 800,
+) -> str:
+    """
+    Fetch content from a URL using loader (the native web loader by default).
 
-async def fetch_url(url: str, emitter: Any, user: UserModel) -> str:
-    """Fetch content from a URL using the native web loader."""
+    When passage_query is not None, only the top-ranked passages are returned
+    instead of the full content. Pages cut short by the loader's size limits
+    are reported with "truncated": true.
+    """
     try:
         # Extract domain name from URL
         parsed_url = urlparse(url)
@@ -167,25 +1113,28 @@ async def fetch_url(url: str, emitter: Any, user: UserModel) -> str:
             done=False,
         )
 
-        request = await get_request()
-        content, docs = get_content_from_url(request, url)
+        timer = metrics.timer("web_search.fetch") if metrics else nullcontext()
+        with timer, span("web_search.fetch", url=url):
+            content, docs = await load_page(
+                url, cache=cache, max_age=cache_max_age, loader=loader
+            )
+        truncated = any((doc.metadata or {}).get("truncated") for doc in docs)
 
-        for doc in docs:
-            metadata = doc.metadata or {}
-            await emitter(
-                {
-                    "type": "citation",
-                    "data": {
-                        "document": [doc.page_content],
-                        "metadata": [metadata],
-                        "source": {
-                            "name": metadata.get("title")
-                            or metadata.get("source")
-                            or url
+        if docs:
+            first = docs[0].metadata or {}
+            with span("web_search.citation", documents=len(docs)):
+                await emitter(
+                    {
+                        "type": "citation",
+                        "data": {
+                            "document": [doc.page_content for doc in docs],
+                            "metadata": [doc.metadata or {} for doc in docs],
+                            "source": {
+                                "name": first.get("title") or first.get("source") or url
+                            },
                         },
-                    },
-                }
-            )
+                    }
+                )
 
         await emit_status(
             f"read webpage from {domain}",
@@ -194,16 +1143,39 @@ async def fetch_url(url: str, emitter: Any, user: UserModel) -> str:
             extra_data={"url": url},
         )
 
+        if passage_query is not None:
+            passages, total = select_passages(
+                content or "\n\n".join(doc.page_content for doc in docs),
+                passage_query,
+                top_k=top_k,
+                token_budget=token_budget,
+                passage_chars=passage_chars,
+            )
+            title = next(
+                (d.metadata.get("title") for d in docs if (d.metadata or {}).get("title")),
+                None,
+            )
+            return json.dumps(
+                {
+                    "status": "success",
+                    "url": url,
+                    "title": title,
+                    "truncated": truncated,
+                    "total_passages": total,
+                    "passages": passages,
+                },
+                ensure_ascii=False,
+            )
+
         return json.dumps(
             {
                 "status": "success",
                 "url": url,
-                "content": content,
-                "documents": [
-                    {"content": doc.page_content, "metadata": doc.metadata}
-                    for doc in docs
-                ],
-            }
+                "truncated": truncated,
+                "content": content or "\n\n".join(doc.page_content for doc in docs),
+                "documents": [{"metadata": doc.metadata} for doc in docs],
+            },
+            ensure_ascii=False,
         )
 
     except Exception as e:
@@ -222,10 +1194,170 @@ async def fetch_url(url: str, emitter: Any, user: UserModel) -> str:
         )
 
 
+def extract_search_results(result: dict[str, Any]) -> list[dict[str, Any]]:
+    """Normalize a process_web_search response into source/title/content dicts."""
+    result_items = cast(list[dict[str, Any]], result.get("items") or [])
+    docs = cast(list[dict[str, Any]], result.get("docs") or [])
+
+    if result_items:
+        return [
+            {
+                "source": item.get("link") or item.get("url") or item.get("source") or "",
+                "title": item.get("title") or item.get("name") or "",
+                "content": item.get("snippet")
+                or item.get("content")
+                or item.get("text")
+                or "",
+            }
+            for item in result_items
+            if item
+        ]
+
+    return [
+        {
+            "source": (item.get("metadata") or {}).get("source")
+            or (item.get("metadata") or {}).get("link")
+            or (item.get("metadata") or {}).get("url")
+            or "",
+            "title": (item.get("metadata") or {}).get("title") or "",
+            "content": (item.get("metadata") or {}).get("snippet")
+            or item.get("content")
+            or "",
+        }
+        for item in docs
+        if item
+    ]
+
+
+async def emit_search_citations(
+    emitter: Any, search_results: list[dict[str, Any]], max_snippet_chars: int
+) -> None:
+    """Emit one citation event covering every linked search result."""
+    if not emitter:
+        return
+
+    documents = []
+    metadata = []
+    for sr in search_results:
+        link = sr.get("source", "")
+        if not link:
+            continue
+        title = sr.get("title", "")
+        snippet = (sr.get("content") or "")[:max_snippet_chars]
+        documents.append(f"{title}\n{snippet}".strip())
+        metadata.append({"source": link, "name": title, "url": link})
+
+    if documents:
+        with span("web_search.citation", documents=len(documents)):
+            await emitter(
+                {
+                    "type": "citation",
+                    "data": {
+                        "source": {"name": "search_web", "id": "search_web"},
+                        "document": documents,
+                        "metadata": metadata,
+                    },
+                }
+            )
+
+
+async def search(request: Request, queries: list[str], user: UserModel) -> dict:
+    """Run one search request through Open WebUI's configured engine."""
+    with span("web_search.search", queries=len(queries)):
+        return await process_web_search(
+            request=request,
+            form_data=SearchForm.model_validate({"queries": queries}),
+            user=user,
+        )
+
+
+async def stream_web_search(
+    search_queries: list[str],
+    emitter: Any,
+    user: UserModel,
+    deadline: float,
+    max_snippet_chars: int,
+) -> tuple[list[dict[str, Any]], list[str], list[str]]:
+    """
+    Run every query as its own search concurrently, emitting status and
+    citations as each one completes. Stops waiting once deadline seconds have
+    passed (0 waits for all). Returns the results tagged with their query,
+    the queries that failed and the queries still pending at the deadline.
+    """
+    tasks = {
+        asyncio.create_task(search(await get_request(), [query], user)): query
+        for query in search_queries
+    }
+
+    loop = asyncio.get_running_loop()
+    end = loop.time() + deadline if deadline > 0 else None
+    results: list[dict[str, Any]] = []
+    failed: list[str] = []
+    cited: set[str] = set()
+    pending = set(tasks)
+    finished = 0
+    try:
+        while pending:
+            timeout = None if end is None else max(0.0, end - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                query = tasks[task]
+                finished += 1
+                if task.exception() is not None:
+                    failed.append(query)
+                else:
+                    items = [
+                        {**item, "queries": [query]}
+                        for item in extract_search_results(task.result())
+                    ]
+                    results.extend(items)
+
+                    new_items = []
+                    for item in items:
+                        key = result_key(item["source"]) if item["source"] else ""
+                        if key and key not in cited:
+                            cited.add(key)
+                            new_items.append(item)
+                    await emit_search_citations(emitter, new_items, max_snippet_chars)
+                await emit_status(
+                    f"searched {finished}/{len(tasks)} queries",
+                    status="in_progress",
+                    done=False,
+                    extra_data={"query": query},
+                    emitter=emitter,
+                )
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if failed and len(failed) == len(tasks):
+        raise RuntimeError("all search queries failed")
+
+    return results, failed, [query for task, query in tasks.items() if task in pending]
+
+
 async def native_web_search(
-    search_queries: list[str], emitter: Any, user: UserModel
+    search_queries: list[str],
+    emitter: Any,
+    user: UserModel,
+    max_snippet_chars: int = 500,
+    max_total_chars: int = 6000,
+    per_query: bool = False,
+    deadline: float = 0,
 ) -> str:
-    """Search using the native search engine."""
+    """
+    Search using the native search engine.
+
+    With per_query, each query runs as a separate concurrent search and
+    citations are emitted incrementally; otherwise all queries are sent in
+    one request. A positive deadline bounds the total wait in both modes;
+    when it passes before any result arrives, a timeout status naming the
+    pending queries is returned.
+    """
     try:
         await emit_status(
             "searching the web",
@@ -235,84 +1367,54 @@ async def native_web_search(
             emitter=emitter,
         )
 
-        form = SearchForm.model_validate({"queries": search_queries})
-        result = await process_web_search(
-            request=await get_request(), form_data=form, user=user
-        )
-
-        result_items = cast(list[dict[str, Any]], result.get("items") or [])
-        docs = cast(list[dict[str, Any]], result.get("docs") or [])
-
-        if result_items:
-            search_results = cast(
-                list[dict[str, str]],
-                [
-                    {
-                        "source": item.get("link")
-                        or item.get("url")
-                        or item.get("source")
-                        or "",
-                        "title": item.get("title") or item.get("name") or "",
-                        "content": item.get("snippet")
-                        or item.get("content")
-                        or item.get("text")
-                        or "",
-                    }
-                    for item in result_items
-                    if item
-                ],
+        failed: list[str] = []
+        timed_out: list[str] = []
+        if per_query and len(search_queries) > 1:
+            search_results, failed, timed_out = await stream_web_search(
+                search_queries,
+                emitter=emitter,
+                user=user,
+                deadline=deadline,
+                max_snippet_chars=max_snippet_chars,
             )
         else:
-            search_results = cast(
-                list[dict[str, str]],
-                [
-                    {
-                        "source": (item.get("metadata") or {}).get("source")
-                        or (item.get("metadata") or {}).get("link")
-                        or (item.get("metadata") or {}).get("url")
-                        or "",
-                        "title": (item.get("metadata") or {}).get("title") or "",
-                        "content": (item.get("metadata") or {}).get("snippet")
-                        or item.get("content")
-                        or "",
-                    }
-                    for item in docs
-                    if item
-                ],
+            try:
+                result = await asyncio.wait_for(
+                    search(await get_request(), search_queries, user),
+                    timeout=deadline if deadline > 0 else None,
+                )
+            except asyncio.TimeoutError:
+                result, timed_out = {}, list(search_queries)
+            search_results = extract_search_results(result)
+
+        if timed_out and not search_results:
+            # Nothing arrived before the deadline: report it rather than an empty success
+            await emit_status(
+                "web search timed out",
+                status="web_search",
+                done=True,
+                error=True,
+                emitter=emitter,
             )
+            response: dict[str, Any] = {
+                "status": "web search timed out",
+                "error": f"no results within {deadline:g} seconds",
+                "timed_out_queries": timed_out,
+            }
+            if failed:
+                response["failed_queries"] = failed
+            return json.dumps(response, ensure_ascii=False)
 
+        search_results = merge_search_results(
+            search_results,
+            search_queries,
+            max_snippet_chars=max_snippet_chars,
+            max_total_chars=max_total_chars,
+        )
         item_count = len(search_results)
 
-        if emitter:
-            documents = []
-            metadata = []
-            for sr in search_results:
-                link = sr.get("source", "")
-                if not link:
-                    continue
-                title = sr.get("title", "")
-                snippet = sr.get("content", "")
-                doc = f"{title}\n{snippet}".strip()
-                documents.append(doc)
-                metadata.append(
-                    {
-                        "source": link,
-                        "name": title,
-                        "url": link,
-                    }
-                )
-
-            if documents:
-                await emitter(
-                    {
-                        "type": "citation",
-                        "data": {
-                            "source": {"name": "search_web", "id": "search_web"},
-                            "document": documents,
-                            "metadata": metadata,
-                        },
-                    }
-                )
+        if not (per_query and len(search_queries) > 1):
+            await emit_search_citations(emitter, search_results, max_snippet_chars)
 
         await emit_status(
             f"searched {item_count} website{'s' if item_count != 1 else ''}",
@@ -324,13 +1426,16 @@ async def native_web_search(
             emitter=emitter,
         )
 
-        return json.dumps(
-            {
-                "status": "web search completed successfully!",
-                "result_count": item_count,
-                "results": search_results,
-            }
-        )
+        response = {
+            "status": "web search completed successfully!",
+            "result_count": item_count,
+            "results": search_results,
+        }
+        if failed:
+            response["failed_queries"] = failed
+        if timed_out:
+            response["timed_out_queries"] = timed_out
+        return json.dumps(response, ensure_ascii=False)
 
     except Exception as e:
         await emit_status(
@@ -0,0 +1,447 @@
+"""
+title: Background Tasks
+author: Open-WebUI-Extensions
+description: 作为任务模型使用，一次调用同时生成标题、标签和追问；标题和标签优先在本地生成，并跳过已有标题/标签的会话
+version: 0.2.1
+licence: MIT
+required_open_webui_version: >= 0.6.0
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from fastapi import Request
+from open_webui.models.chats import Chats
+from open_webui.models.users import Users
+from open_webui.utils.chat import generate_chat_completion
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# 与 Prompts/combined.md 保持一致
+DEFAULT_PROMPT = """### 任务:
+  根据聊天记录，一次性生成对话标题、主题标签和后续追问。
+### 要求:
+  - 标题：简洁概括对话主旨（建议 6-12 个中文字符或 4-8 个中文词），不要使用 emoji、引号、特殊格式；宁可准确清晰，不要过度创意。
+  - 标签：先给出 1-3 个高层领域标签（如：科学、技术、哲学、艺术、政治、商业、健康、体育、娱乐、教育），若有明显子领域再补充 1-3 个更具体的标签；如果内容过短（少于 3 条消息）或过于分散，仅输出 ["通用"]。
+  - 追问：3-5 条用户可能会自然提出的后续问题，从用户视角提问、面向助手，简洁清晰、紧扣主题、不重复已覆盖内容；对话过短时给出更通用但相关的追问。
+  - 使用对话的主要语言；中文优先。
+  - 你的回复必须只包含单个原始 JSON 对象，不要任何前后解释，不要使用 Markdown 代码块。
+### 输出:
+  JSON 格式: { "title": "你的简洁标题", "tags": ["标签1", "标签2"], "follow_ups": ["问题1？", "问题2？", "问题3？"] }
+### 聊天记录:
+  <chat_history>
+  {{MESSAGES:END:6}}
+  </chat_history>"""
+
+# Open WebUI 的任务名 -> 合并结果中对应的字段
+TASK_FIELDS = {
+    "title_generation": "title",
+    "tags_generation": "tags",
+    "follow_up_generation": "follow_ups",
+}
+
+MESSAGES_RE = re.compile(r"\{\{MESSAGES(?::END:(\d+))?\}\}")
+DETAILS_RE = re.compile(r"<details\b[^>]*>.*?</details>", re.S)
+
+
+def message_text(content: Any) -> str:
+    """取出消息中的文本（兼容多模态列表格式），并去掉思考过程、工具调用等折叠块"""
+    if isinstance(content, list):
+        content = "\n".join(
+            str(part.get("text", ""))
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return DETAILS_RE.sub("", str(content or "")).strip()
+
+
+def render_messages(messages: list, last: Optional[int]) -> str:
+    """按 Open WebUI 的 {{MESSAGES}} 格式渲染聊天记录"""
+    messages = [m for m in messages if m.get("role") in ("user", "assistant")]
+    if last:
+        messages = messages[-last:]
+    return "\n".join(
+        f"{m['role'].upper()}: {message_text(m.get('content'))}" for m in messages
+    )
+
+
+def parse_json_object(text: str) -> dict:
+    """从模型输出中取出第一个 JSON 对象（容忍代码块和前后多余文字）"""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        data = json.loads(text[start : end + 1])
+    except json.JSONDecodeError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# 本地标题/标签生成：高层领域 -> 子主题 -> 关键词（英文按单词匹配，中文按子串匹配）
+TAXONOMY = {
+    "技术": {
+        "编程": ["代码", "编程", "函数", "报错", "调试", "接口", "算法", "数据结构", "python", "java", "javascript", "typescript", "golang", "rust", "c++", "sql", "api", "bug", "debug", "code", "function", "git", "docker", "linux", "前端", "后端", "数据库", "框架"],
+        "人工智能": ["人工智能", "大模型", "机器学习", "深度学习", "神经网络", "提示词", "ai", "llm", "gpt", "prompt", "embedding", "transformer", "模型训练"],
+        "硬件": ["显卡", "cpu", "gpu", "内存", "硬盘", "主板", "芯片", "电脑配置", "hardware"],
+        "网络": ["网络", "路由器", "服务器", "域名", "dns", "http", "https", "代理", "vpn", "network"],
+    },
+    "科学": {
+        "数学": ["数学", "方程", "积分", "导数", "概率", "矩阵", "证明", "几何", "math", "equation", "integral", "probability"],
+        "物理": ["物理", "量子", "相对论", "力学", "电磁", "physics", "quantum"],
+        "化学": ["化学", "分子", "化合物", "反应式", "chemistry", "molecule"],
+        "生物": ["生物", "基因", "细胞", "进化", "dna", "biology", "gene"],
+        "天文": ["天文", "宇宙", "黑洞", "行星", "恒星", "astronomy", "galaxy"],
+    },
+    "健康": {
+        "医疗": ["医生", "医院", "症状", "疾病", "药物", "治疗", "感冒", "发烧", "disease", "symptom", "medicine"],
+        "健身": ["健身", "减肥", "锻炼", "增肌", "跑步", "fitness", "workout"],
+        "营养": ["饮食", "营养", "热量", "蛋白质", "维生素", "nutrition", "diet"],
+        "心理": ["焦虑", "抑郁", "心理", "情绪", "压力", "anxiety", "mental health"],
+    },
+    "商业": {
+        "投资": ["股票", "基金", "投资", "理财", "收益率", "利率", "stock", "invest", "crypto", "比特币"],
+        "营销": ["营销", "推广", "品牌", "广告", "用户增长", "marketing", "seo"],
+        "创业": ["创业", "融资", "商业模式", "startup", "business plan"],
+        "职场": ["面试", "简历", "跳槽", "薪资", "职场", "interview", "resume", "career"],
+    },
+    "教育": {
+        "语言学习": ["英语", "日语", "单词", "语法", "雅思", "托福", "grammar", "vocabulary", "ielts", "toefl"],
+        "考试": ["考试", "高考", "考研", "复习", "exam"],
+        "学术写作": ["论文", "文献", "引用", "摘要", "paper", "thesis", "citation"],
+    },
+    "艺术": {
+        "文学": ["小说", "诗歌", "散文", "文学", "作家", "novel", "poem", "poetry"],
+        "音乐": ["音乐", "歌曲", "乐器", "吉他", "钢琴", "music", "song"],
+        "绘画": ["绘画", "素描", "油画", "插画", "painting", "drawing"],
+        "设计": ["设计稿", "配色", "字体", "排版", "ui设计", "logo"],
+    },
+    "娱乐": {
+        "游戏": ["游戏", "steam", "switch", "原神", "game", "gaming"],
+        "影视": ["电影", "电视剧", "动漫", "综艺", "movie", "film", "anime"],
+    },
+    "体育": {
+        "球类": ["足球", "篮球", "网球", "乒乓球", "羽毛球", "nba", "football", "soccer", "basketball"],
+        "赛事": ["比赛", "世界杯", "奥运", "联赛", "olympics", "league"],
+    },
+    "哲学": {
+        "哲学思辨": ["哲学", "存在主义", "伦理", "道德", "意识", "形而上学", "philosophy", "ethics"],
+    },
+    "政治": {
+        "时政": ["政治", "政府", "选举", "政策", "外交", "法律", "politics", "election", "policy"],
+    },
+    "生活": {
+        "烹饪": ["菜谱", "做饭", "烹饪", "食谱", "烘焙", "recipe", "cooking", "baking"],
+        "旅行": ["旅游", "旅行", "景点", "签证", "机票", "酒店", "travel", "visa"],
+        "家居": ["装修", "家具", "收纳", "家电"],
+    },
+}
+
+GREETING_RE = re.compile(
+    r"^\s*(hi|hello|hey|你好|您好|嗨|哈喽|在吗|早上好|晚上好)[\s!！,，.。~～?？]*$", re.IGNORECASE
+)
+TITLE_PREFIX_RE = re.compile(
+    r"^(请问|请你|请|麻烦你?|帮我|帮忙|你好[,，]?|我想知道|我想问一下|我想|能不能|可不可以|可以|"
+    r"please|can you|could you|would you|help me|how (?:do|can|should) i|i want to|i need to|i'd like to)\s*",
+    re.IGNORECASE,
+)
+TITLE_SUFFIX_RE = re.compile(r"[\s?？!！。.,，~～]*(吗|呢|吧|啊)?[\s?？!！。.,，~～]*$")
+CJK_RE = re.compile(r"[㐀-鿿]")
+# 保留 C++、C#、Node.js 这类词内符号，但不带上句末的 “.” “-”
+WORD_RE = re.compile(r"[A-Za-z](?:[A-Za-z0-9+#.\-]*[A-Za-z0-9+#])?")
+EN_STOPWORDS = set(
+    "a an the and or but if then of to in on at for from by with about as into over under is are was were be been "
+    "being do does did doing have has had i you he she it we they me my your our their this that these those what "
+    "which who whom how why when where can could would should will shall may might must not no yes so than too very "
+    "just also please help want need like get make use using some any there here its it's i'm don't tell give show "
+    "explain know".split()
+)
+CJK_POS = ("n", "nr", "ns", "nt", "nz", "vn", "eng")
+
+_jieba = None
+
+
+def get_jieba():
+    """按需加载 jieba（可选依赖），未安装时返回 None"""
+    global _jieba
+    if _jieba is None:
+        try:
+            import jieba
+            import jieba.analyse
+
+            jieba.setLogLevel(logging.WARNING)
+            _jieba = jieba.analyse
+        except ImportError:
+            _jieba = False
+    return _jieba or None
+
+
+def _title_case(words: list[str]) -> str:
+    small = {"a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "per", "vs"}
+    return " ".join(
+        w if (w.isupper() or any(c.isupper() for c in w[1:])) else (w.lower() if i and w.lower() in small else w.capitalize())
+        for i, w in enumerate(words)
+    )
+
+
+def _join_keywords(words: list[str]) -> str:
+    """中文之间直接拼接，与英文相邻时加空格"""
+    out = ""
+    for word in words:
+        if out and not (CJK_RE.match(out[-1]) and CJK_RE.match(word[0])):
+            out += " "
+        out += word
+    return out
+
+
+def local_title(messages: list) -> tuple[Optional[str], float]:
+    """用首条用户消息在本地生成标题，返回 (标题, 置信度)"""
+    first = next((message_text(m.get("content")) for m in messages if m.get("role") == "user"), "")
+    text = first.strip()
+    if not text:
+        return None, 0.0
+    cjk = bool(CJK_RE.search(text))
+    if GREETING_RE.match(text):
+        return ("日常问候" if cjk else "Greeting"), 0.9
+
+    # 短而干净的提问本身就是好标题
+    cleaned = TITLE_SUFFIX_RE.sub("", TITLE_PREFIX_RE.sub("", text.splitlines()[0].strip()))
+    if "\n" not in text.strip() and "```" not in text:
+        if cjk and 4 <= len(cleaned) <= 16:
+            return cleaned, 0.9
+        words = cleaned.split()
+        if not cjk and 2 <= len(words) <= 8:
+            return _title_case(words), 0.85
+
+    # 较长的消息：取关键词（按原文顺序）拼成标题
+    if len(text) > 400:
+        return None, 0.2
+    if cjk:
+        analyse = get_jieba()
+        if analyse is None:
+            return None, 0.2
+        keywords = analyse.extract_tags(text, topK=3, allowPOS=CJK_POS)
+        keywords = sorted(keywords, key=lambda w: text.find(w))
+        title = _join_keywords(keywords)
+        confident = len(keywords) >= 2 and 4 <= len(title) <= 20
+        return (title, 0.7) if confident else (None, 0.3)
+
+    tokens = WORD_RE.findall(text)
+    phrases: list[list[str]] = []
+    run: list[str] = []
+    for token in tokens + [""]:
+        if token and token.lower() not in EN_STOPWORDS:
+            run.append(token)
+            continue
+        if run:
+            phrases.append(run[:3])
+        run = []
+    counts: dict[str, int] = {}
+    for token in tokens:
+        counts[token.lower()] = counts.get(token.lower(), 0) + 1
+
+    def score(phrase: list[str]) -> float:
+        # 高频词、专有名词/缩写、多词短语优先
+        return sum(counts[w.lower()] + (1 if w[0].isupper() or w.isupper() else 0) for w in phrase) + 0.5 * len(phrase)
+
+    # 取得分最高的两个短语，跳过与已选短语有重复词的（如 “Docker build” 出现多次）
+    best: list[list[str]] = []
+    chosen: set[str] = set()
+    for phrase in sorted(phrases, key=score, reverse=True):
+        lowered = {w.lower() for w in phrase}
+        if lowered & chosen:
+            continue
+        best.append(phrase)
+        chosen |= lowered
+        if len(best) == 2:
+            break
+    best.sort(key=lambda p: tokens.index(p[0]))
+    words = [w for phrase in best for w in phrase]
+    if 2 <= len(words) <= 8:
+        return _title_case(words), 0.7
+    return None, 0.3
+
+
+def local_tags(messages: list) -> tuple[Optional[list[str]], float]:
+    """按领域词表在本地生成标签，返回 (标签, 置信度)"""
+    messages = [m for m in messages if m.get("role") in ("user", "assistant")]
+    # 与 Prompts/tags.md 的规则一致：少于 3 条消息时仅输出 通用
+    if len(messages) < 3:
+        return ["通用"], 1.0
+
+    text = "\n".join(message_text(m.get("content")) for m in messages).lower()
+    words = set(WORD_RE.findall(text))
+    hits: dict[tuple[str, str], int] = {}
+    for domain, subtopics in TAXONOMY.items():
+        for subtopic, keywords in subtopics.items():
+            count = sum(
+                (text.count(k) if CJK_RE.search(k) or not k.isalnum() else (k in words))
+                for k in keywords
+            )
+            if count:
+                hits[(domain, subtopic)] = count
+
+    domains: dict[str, int] = {}
+    for (domain, _), count in hits.items():
+        domains[domain] = domains.get(domain, 0) + count
+    ranked = sorted(domains.items(), key=lambda item: item[1], reverse=True)
+    if not ranked or ranked[0][1] < 2:
+        return None, 0.2
+
+    top, top_hits = ranked[0]
+    second_hits = ranked[1][1] if len(ranked) > 1 else 0
+    confidence = min(1.0, top_hits / 4) * (1 - second_hits / top_hits)
+    subtopic = max((s for d, s in hits if d == top), key=lambda s: hits[(top, s)])
+    return [top, subtopic], confidence
+
+
+class Pipe:
+    class Valves(BaseModel):
+        task_model: str = Field(
+            default="",
+            title="任务模型",
+            description="实际执行生成的模型 ID（不能是本 Pipe 自身）",
+        )
+        prompt: str = Field(
+            default=DEFAULT_PROMPT,
+            title="合并提示词",
+            description="支持 {{MESSAGES}} 与 {{MESSAGES:END:N}} 占位符",
+        )
+        skip_existing: bool = Field(
+            default=True,
+            title="跳过已有标题/标签",
+            description="会话已有标题和标签时直接返回现有值，不再重新生成",
+        )
+        local_generation: bool = Field(
+            default=True,
+            title="本地生成标题/标签",
+            description="先用本地规则（分词关键词 + 领域词表）生成标题和标签，置信度不足时才调用模型",
+        )
+        local_min_confidence: float = Field(
+            default=0.6,
+            title="本地生成最低置信度",
+            description="本地结果置信度低于该值时改为调用模型",
+        )
+        cache_ttl: int = Field(
+            default=600,
+            title="结果缓存时间 (秒)",
+            description="同一段聊天记录的合并结果在该时间内供标题/标签/追问任务复用",
+        )
+
+    def __init__(self):
+        self.valves = self.Valves()
+        # 聊天记录指纹 -> (生成时间, 合并结果)
+        self._results: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        # 聊天记录指纹 -> 进行中的生成任务，保证同一段记录只调用一次模型
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def pipes(self):
+        return [{"id": "background-tasks", "name": "Background Tasks"}]
+
+    async def pipe(
+        self,
+        body: dict,
+        __user__: dict,
+        __request__: Request,
+        __task__: Optional[str] = None,
+        __task_body__: Optional[dict] = None,
+    ) -> Any:
+        if not self.valves.task_model or self.valves.task_model == body.get("model"):
+            return "Background Tasks: 请在 Valves 中配置 task_model（不能指向本 Pipe）"
+
+        user = await asyncio.to_thread(Users.get_user_by_id, __user__["id"])
+        field = TASK_FIELDS.get(__task__ or "")
+        if field is None or not __task_body__:
+            # 其他任务或普通对话：直接转发给任务模型
+            return await generate_chat_completion(
+                __request__,
+                {**body, "model": self.valves.task_model},
+                user,
+                bypass_filter=True,
+            )
+
+        chat_id = __task_body__.get("chat_id")
+        if self.valves.skip_existing and field in ("title", "tags") and chat_id:
+            existing = await self._existing(chat_id, field)
+            if existing:
+                return json.dumps({field: existing}, ensure_ascii=False)
+
+        messages = __task_body__.get("messages", [])
+        if self.valves.local_generation and field in ("title", "tags"):
+            # 已有同一段记录的模型结果时直接复用，否则先尝试本地生成
+            prompt, key = self._prompt(messages)
+            if key not in self._results and key not in self._inflight:
+                # 首次分词需要加载词典，放到线程中执行
+                generate = local_title if field == "title" else local_tags
+                value, confidence = await asyncio.to_thread(generate, messages)
+                if value and confidence >= self.valves.local_min_confidence:
+                    logger.info("[BackgroundTasks] local %s (%.2f): %s", field, confidence, value)
+                    return json.dumps({field: value}, ensure_ascii=False)
+
+        result = await self._combined(__request__, user, messages)
+        # 生成失败时返回空对象，由 Open WebUI 使用默认值
+        value = result.get(field)
+        return json.dumps({field: value} if value else {}, ensure_ascii=False)
+
+    async def _existing(self, chat_id: str, field: str) -> Any:
+        """会话已有的标题或标签，没有时返回 None"""
+        chat = await asyncio.to_thread(Chats.get_chat_by_id, chat_id)
+        if chat is None:
+            return None
+        if field == "title":
+            title = (chat.title or "").strip()
+            return title if title and title != "New Chat" else None
+        tags = (chat.meta or {}).get("tags") or []
+        return tags or None
+
+    def _prompt(self, messages: list) -> tuple[str, str]:
+        """渲染合并提示词，返回 (提示词, 缓存键)"""
+        prompt = MESSAGES_RE.sub(
+            lambda m: render_messages(messages, int(m.group(1)) if m.group(1) else None),
+            self.valves.prompt,
+        )
+        return prompt, hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+
+    async def _combined(self, request: Request, user: Any, messages: list) -> dict:
+        prompt, key = self._prompt(messages)
+
+        now = time.monotonic()
+        cached = self._results.get(key)
+        if cached is not None and now - cached[0] < self.valves.cache_ttl:
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(request, user, prompt))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        result = await asyncio.shield(task)
+
+        if result:
+            self._results[key] = (time.monotonic(), result)
+            while len(self._results) > 256:
+                self._results.popitem(last=False)
+        return result
+
+    async def _generate(self, request: Request, user: Any, prompt: str) -> dict:
+        form_data = {
+            "model": self.valves.task_model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+        }
+        try:
+            res = await generate_chat_completion(request, form_data, user, bypass_filter=True)
+            content = res["choices"][0]["message"]["content"]
+        except Exception as err:
+            logger.exception("[BackgroundTasks] generation failed: %s", err)
+            return {}
+        result = parse_json_object(content or "")
+        if not result:
+            logger.warning("[BackgroundTasks] unparseable output: %s", content)
+        return result
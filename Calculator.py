@@ -1,21 +1,663 @@
+"""
+title: Calculator
+author: @WillLiang713
+description: A calculator with a fast path for plain arithmetic and vectorized batch evaluation. Symbolic expressions are parsed with a restricted SymPy namespace and evaluated in a pool of worker processes with time and memory limits.
+version: 1.3.2
+required_open_webui_version: >= 0.6.0
+"""
+
+import ast
+import asyncio
+import json
+import math
+import operator
+import queue
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from fractions import Fraction
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field
+
+# SymPy takes hundreds of milliseconds to import; only load it in this process
+# when the worker pool is disabled and an expression needs it.
+_sp = None
+
+
+def get_sympy():
+    global _sp
+    if _sp is None:
+        import sympy
+
+        _sp = sympy
+    return _sp
+
+
+_batch = None
+
+
+def get_batch_evaluator():
+    """Compile BATCH_SOURCE in this process (only used without the worker pool)."""
+    global _batch
+    if _batch is None:
+        namespace: dict = {}
+        exec(BATCH_SOURCE, namespace)
+        _batch = namespace
+    return _batch
+
+
+# Safe parsing and batch evaluation, shared by the workers and the inline (pool disabled)
+# path. Kept as source so it can be prepended to WORKER_SOURCE.
+BATCH_SOURCE = r"""
+import io
+import math
+import re
+import tokenize
+
+
+class BatchError(Exception):
+    pass
+
+
+# Plain helper functions allowed in expressions; SymPy's classes (sin, log,
+# Integer, Symbol, ...) and constants (pi, E, oo) are allowed as well
+SAFE_FUNCTIONS = (
+    "sqrt cbrt root real_root diff integrate limit summation product "
+    "simplify expand factor nsimplify N"
+).split()
+
+_namespace = None
+
+
+def _safe_namespace(sp):
+    global _namespace
+    if _namespace is None:
+        namespace = {"__builtins__": {}}
+        for name in dir(sp):
+            obj = getattr(sp, name)
+            if not name.startswith("_") and (
+                isinstance(obj, sp.Basic) or (isinstance(obj, type) and issubclass(obj, sp.Basic))
+            ):
+                namespace[name] = obj
+        namespace.update((name, getattr(sp, name)) for name in SAFE_FUNCTIONS)
+        _namespace = namespace
+    return _namespace
+
+
+def safe_parse(sp, expression):
+    # sympify() runs eval() on its input. Reject dunders, string literals and
+    # attribute access up front, then evaluate without builtins and with only
+    # SymPy's math names in scope.
+    if "__" in expression or "'" in expression or '"' in expression:
+        raise ValueError("Invalid equation")
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(expression).readline))
+    except (tokenize.TokenError, SyntaxError):
+        raise SyntaxError("Invalid equation")
+    for token in tokens:
+        if token.string in (".", "...", "lambda"):
+            raise ValueError("Invalid equation")
+
+    from sympy.parsing.sympy_parser import convert_xor, parse_expr, standard_transformations
+
+    return parse_expr(
+        expression,
+        local_dict={},
+        global_dict=dict(_safe_namespace(sp)),
+        transformations=standard_transformations + (convert_xor,),
+    )
+
+
+def _range_values(np, start, stop, step=None, num=None, max_points=0):
+    if num is not None:
+        num = int(num)
+        if num < 1 or num > max_points:
+            raise BatchError(f"num must be between 1 and {max_points}")
+        return np.linspace(float(start), float(stop), num)
+    step = float(step if step is not None else 1)
+    if step == 0 or (float(stop) - float(start)) / step < 0:
+        raise BatchError(f"Empty range {start}..{stop} step {step:g}")
+    count = math.floor((float(stop) - float(start)) / step + 1e-9) + 1
+    if count > max_points:
+        raise BatchError(f"Range {start}..{stop} step {step:g} has more than {max_points} points")
+    return float(start) + step * np.arange(count)
+
+
+def _parse_values(np, name, spec, max_points):
+    # Accepts a number, a list, {"start", "stop", "step" | "num"}, or a string
+    # such as "1..100", "0..1..0.1" (inclusive) or "1, 2, 5"
+    if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+        return np.array([float(spec)])
+    if isinstance(spec, list):
+        if not spec or len(spec) > max_points:
+            raise BatchError(f"{name} must have between 1 and {max_points} values")
+        return np.asarray(spec, dtype=float)
+    if isinstance(spec, dict):
+        if "start" not in spec or "stop" not in spec:
+            raise BatchError(f"Range for {name} needs start and stop")
+        return _range_values(
+            np, spec["start"], spec["stop"], spec.get("step"), spec.get("num"), max_points
+        )
+    if isinstance(spec, str):
+        parts = re.split(r"\s*(?:\.\.|:)\s*", spec.strip())
+        if len(parts) in (2, 3) and all(parts):
+            return _range_values(np, *parts, max_points=max_points)
+        return _parse_values(np, name, [float(v) for v in re.split(r"[,\s]+", spec.strip()) if v], max_points)
+    raise BatchError(f"Unsupported values for {name}")
+
+
+def _fmt(value):
+    return f"{value:.10g}"
+
+
+def _row(columns, values, i):
+    return " | ".join(_fmt(v) for v in (*(c[i] for c in columns), values[i]))
+
+
+def evaluate_batch(expression, variables, grid=False, output="auto", max_points=100000, table_rows=50):
+    import numpy as np
+    import sympy as sp
+
+    if not isinstance(variables, dict) or not variables:
+        raise BatchError("variables must map each variable name to its values")
+    try:
+        expr = safe_parse(sp, expression)
+    except (sp.SympifyError, ValueError, TypeError, SyntaxError):
+        raise BatchError("Invalid equation")
+
+    names = list(variables)
+    symbols = [sp.Symbol(name) for name in names]
+    unbound = sorted(str(s) for s in expr.free_symbols if s not in symbols)
+    if unbound:
+        raise BatchError(f"No values given for: {', '.join(unbound)}")
+
+    columns = [_parse_values(np, name, variables[name], max_points) for name in names]
+    if grid:
+        if math.prod(len(c) for c in columns) > max_points:
+            raise BatchError(f"Grid has more than {max_points} points")
+        columns = [c.ravel() for c in np.meshgrid(*columns, indexing="ij")]
+    else:
+        try:
+            columns = list(np.broadcast_arrays(*columns))
+        except ValueError:
+            sizes = ", ".join(f"{n}={len(c)}" for n, c in zip(names, columns))
+            raise BatchError(f"Value lists must have the same length or a single value ({sizes}); use grid for all combinations")
+
+    # Compile once, evaluate every point in one vectorized pass
+    func = sp.lambdify(symbols, expr, modules="numpy")
+    with np.errstate(all="ignore"):
+        try:
+            values = np.asarray(func(*columns))
+        except Exception as e:
+            raise BatchError(f"Evaluation failed: {type(e).__name__}: {e}")
+    if np.iscomplexobj(values):
+        values = np.where(np.abs(values.imag) < 1e-12, values.real, np.nan)
+    values = np.broadcast_to(values.astype(float), columns[0].shape)
+
+    count = len(values)
+    if output == "table" or (output == "auto" and count <= table_rows):
+        header = " | ".join(names + [str(expr)])
+        rows = [_row(columns, values, i) for i in range(min(count, table_rows))]
+        if count > table_rows:
+            rows.append(f"... {count - table_rows} more rows")
+        return "\n".join([header] + rows)
+
+    finite = np.isfinite(values)
+    lines = [f"{expression} over {count} points" + (" (grid)" if grid else "")]
+    if finite.any():
+        valid = values[finite]
+        lo = int(np.nanargmin(np.where(finite, values, np.nan)))
+        hi = int(np.nanargmax(np.where(finite, values, np.nan)))
+        at = lambda i: ", ".join(f"{n}={_fmt(c[i])}" for n, c in zip(names, columns))
+        lines += [
+            f"min: {_fmt(values[lo])} at {at(lo)}",
+            f"max: {_fmt(values[hi])} at {at(hi)}",
+            f"mean: {_fmt(valid.mean())}, std: {_fmt(valid.std())}, sum: {_fmt(valid.sum())}",
+        ]
+    if not finite.all():
+        lines.append(f"undefined (nan/inf/complex): {int((~finite).sum())} points")
+    head = min(5, count)
+    lines.append(" | ".join(names + [str(expr)]))
+    for i in list(range(head)) + (["..."] if count > 2 * head else []) + list(range(max(head, count - head), count)):
+        lines.append("..." if i == "..." else _row(columns, values, i))
+    return "\n".join(lines)
+"""
+
+# Source of the worker processes. It runs via `python -c` rather than
+# multiprocessing so it works no matter how Open WebUI loaded this module.
+WORKER_SOURCE = BATCH_SOURCE + r"""
+import json
+import os
+import sys
+
+# Keep numpy's thread pools from reserving memory under the address space limit
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+limit = int(sys.argv[1]) * 1024 * 1024
+if limit > 0:
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except Exception:
+        pass
+
 import sympy as sp
 
+sys.stdout.write("ready\n")
+sys.stdout.flush()
+
+for line in sys.stdin:
+    try:
+        request = json.loads(line)
+        if isinstance(request, dict):
+            reply = {"result": evaluate_batch(**request)}
+        else:
+            reply = {"result": str(safe_parse(sp, request).evalf())}
+    except BatchError as e:
+        reply = {"error": str(e)}
+    except MemoryError:
+        reply = {"error": "Memory limit exceeded"}
+    except (sp.SympifyError, ValueError, TypeError, SyntaxError):
+        reply = {"error": "Invalid equation"}
+    except Exception as e:
+        reply = {"error": f"Evaluation failed: {type(e).__name__}"}
+    sys.stdout.write(json.dumps(reply) + "\n")
+    sys.stdout.flush()
+"""
+
+STARTUP_TIMEOUT = 30.0
+
+
+class Unsupported(Exception):
+    """The expression needs SymPy."""
+
+
+Number = Union[int, Fraction, float]
+
+# Names and functions whose meaning is the same as in SymPy. Anything else
+# (symbols, complex results, lowercase e which SymPy treats as a symbol)
+# falls back to SymPy.
+CONSTANTS = {"pi": math.pi, "E": math.e}
+
+FUNCTIONS = {
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "ln": math.log,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "atan2": math.atan2,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "floor": math.floor,
+    "ceiling": math.ceil,
+    "Abs": abs,
+    "abs": abs,
+    "Min": min,
+    "Max": max,
+    "min": min,
+    "max": max,
+}
+
+BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+MAX_EXPONENT = 1000
+MAX_INT_BITS = 4096
+MAX_FACTORIAL = 1000
+
+
+def _log(x: Number, base: Optional[Number] = None) -> float:
+    return math.log(x) if base is None else math.log(x, base)
+
+
+def _factorial(n: Number) -> int:
+    if isinstance(n, Fraction) and n.denominator == 1:
+        n = n.numerator
+    if not isinstance(n, int) or not 0 <= n <= MAX_FACTORIAL:
+        raise Unsupported
+    return math.factorial(n)
+
+
+FUNCTIONS.update({"log": _log, "factorial": _factorial})
+
+
+def _power(base: Number, exponent: Number) -> Number:
+    if isinstance(exponent, Fraction) and exponent.denominator == 1:
+        exponent = exponent.numerator
+    if isinstance(exponent, int):
+        if abs(exponent) > MAX_EXPONENT and abs(base) not in (0, 1):
+            raise Unsupported
+        if exponent < 0:
+            return Fraction(base) ** exponent if not isinstance(base, float) else base**exponent
+        return base**exponent
+    if base < 0:
+        raise Unsupported  # complex result
+    return float(base) ** float(exponent)
+
+
+def _check(value: Number) -> Number:
+    if isinstance(value, bool):
+        raise Unsupported
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            value = value.numerator
+        elif max(value.numerator.bit_length(), value.denominator.bit_length()) > MAX_INT_BITS:
+            raise Unsupported
+    if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+        raise Unsupported
+    if isinstance(value, float) and not math.isfinite(value):
+        raise Unsupported
+    return value
+
+
+def _eval_node(node: ast.AST) -> Number:
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        # Float literals become exact fractions, so 0.1 + 0.2 == 0.3
+        return Fraction(Decimal(repr(value))) if isinstance(value, float) else value
+    if isinstance(node, ast.Name) and node.id in CONSTANTS:
+        return CONSTANTS[node.id]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _eval_node(node.operand)
+        return value if isinstance(node.op, ast.UAdd) else -value
+    if isinstance(node, ast.BinOp):
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        # SymPy reads ^ as power
+        if isinstance(node.op, (ast.Pow, ast.BitXor)):
+            return _check(_power(left, right))
+        op = BINARY_OPS.get(type(node.op))
+        if op is None:
+            raise Unsupported
+        if isinstance(node.op, ast.Div) and not isinstance(left, float) and not isinstance(right, float):
+            return _check(Fraction(left) / Fraction(right))
+        return _check(op(left, right))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in FUNCTIONS
+        and not node.keywords
+    ):
+        args = [_eval_node(arg) for arg in node.args]
+        return _check(FUNCTIONS[node.func.id](*args))
+    raise Unsupported
+
+
+def format_result(value: Number) -> str:
+    """Format like str(expr.evalf()) in SymPy: 15 significant digits, trailing zeros kept."""
+    # mpmath ships with SymPy and imports in a fraction of the time
+    from mpmath.libmp import from_float, from_rational, round_nearest, to_str
+
+    if value == 0:
+        return "0"
+    if isinstance(value, float):
+        mpf = from_float(value)
+    else:
+        value = Fraction(value)
+        mpf = from_rational(value.numerator, value.denominator, 53, round_nearest)
+    return to_str(mpf, 15, strip_zeros=False)
+
+
+def fast_evaluate(equation: str) -> Optional[str]:
+    """Evaluate plain arithmetic without SymPy; None when SymPy is needed."""
+    try:
+        tree = ast.parse(equation.strip(), mode="eval")
+        return format_result(_eval_node(tree))
+    except (Unsupported, SyntaxError, ValueError, TypeError, ZeroDivisionError, OverflowError, RecursionError):
+        # Domain errors (sqrt(-1)), division by zero (zoo) and the like are
+        # left to SymPy so the answer matches the symbolic path.
+        return None
+
+
+class WorkerPool:
+    """Pre-warmed worker processes; a worker that times out or dies is replaced.
+
+    Workers are driven from threads rather than the event loop, so the pool
+    does not depend on any particular loop and a cancelled call never loses
+    a worker.
+    """
+
+    def __init__(self, size: int, memory_mb: int):
+        self.size = max(1, size)
+        self.memory_mb = memory_mb
+        self._idle: queue.Queue = queue.Queue()
+        self._workers: set = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        for _ in range(self.size):
+            self._replace()
+
+    def _replace(self) -> None:
+        if not self._closed:
+            threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self) -> None:
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, "-c", WORKER_SOURCE, str(self.memory_mb)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception as e:
+            print(f"Calculator worker failed to start: {e}")
+            return
+        timer = threading.Timer(STARTUP_TIMEOUT, proc.kill)
+        timer.start()
+        ready = proc.stdout.readline()
+        timer.cancel()
+        if ready.strip() != b"ready":
+            self._kill(proc)
+            print("Calculator worker failed to start")
+            return
+        with self._lock:
+            if self._closed:
+                self._kill(proc)
+                return
+            self._workers.add(proc)
+        self._idle.put(proc)
+
+    def _kill(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._workers.discard(proc)
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+
+    def _call(self, request: Union[str, dict], timeout: float) -> dict:
+        try:
+            proc = self._idle.get(timeout=STARTUP_TIMEOUT)
+        except queue.Empty:
+            return {"error": "Calculator is busy, please retry"}
+
+        expired = threading.Event()
+
+        def expire():
+            # Killing the worker unblocks the readline below
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, expire)
+        healthy = False
+        try:
+            proc.stdin.write(json.dumps(request).encode() + b"\n")
+            proc.stdin.flush()
+            timer.start()
+            line = proc.stdout.readline()
+            timer.cancel()
+            if line:
+                healthy = True
+                return json.loads(line)
+            if expired.is_set():
+                return {"error": f"Evaluation exceeded the {timeout:g}s time limit"}
+            return {"error": "Evaluation aborted (memory limit exceeded)"}
+        except (OSError, ValueError):
+            return {"error": "Evaluation aborted (memory limit exceeded)"}
+        finally:
+            timer.cancel()
+            if healthy:
+                self._idle.put(proc)
+            else:
+                self._kill(proc)
+                self._replace()
+
+    async def evaluate(self, request: Union[str, dict], timeout: float) -> dict:
+        """Evaluate an expression (str) or a batch request (dict) in a worker."""
+        return await asyncio.to_thread(self._call, request, timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+        for proc in workers:
+            self._kill(proc)
+
+
+_pool: Optional[WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(size: int, memory_mb: int) -> WorkerPool:
+    """Return the shared pool, recreating it if the settings changed."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and (_pool.size != max(1, size) or _pool.memory_mb != memory_mb):
+            _pool.close()
+            _pool = None
+        if _pool is None:
+            _pool = WorkerPool(size, memory_mb)
+            _pool.start()
+        return _pool
+
 
 class Tools:
+    class Valves(BaseModel):
+        SANDBOX_ENABLED: bool = Field(
+            default=True,
+            description="Evaluate expressions in separate worker processes (killed on timeout, memory-capped) instead of the server process.",
+        )
+        POOL_SIZE: int = Field(
+            default=2, description="Number of pre-warmed worker processes."
+        )
+        TIMEOUT: float = Field(
+            default=5.0,
+            description="Wall-clock time limit per evaluation in seconds; the worker is killed and replaced when exceeded.",
+        )
+        MEMORY_LIMIT_MB: int = Field(
+            default=512,
+            description="Address space limit of each worker in MB (0 disables it; not enforced on Windows).",
+        )
+        FAST_PATH_ENABLED: bool = Field(
+            default=True,
+            description="Evaluate plain numeric expressions in-process without SymPy.",
+        )
+        CACHE_SIZE: int = Field(
+            default=256, description="Number of recent results to memoize (0 disables it)."
+        )
+        BATCH_MAX_POINTS: int = Field(
+            default=100000, description="Maximum number of points in one calculate_batch call."
+        )
+        BATCH_TABLE_ROWS: int = Field(
+            default=50,
+            description="calculate_batch returns a full table up to this many points, summary statistics beyond it.",
+        )
+
     def __init__(self):
-        pass
+        self.valves = self.Valves()
+        self._cache: OrderedDict[str, str] = OrderedDict()
 
-    def calculator(self, equation: str) -> str:
+    async def calculator(self, equation: str) -> str:
         """
         Calculate the result of an equation safely.
         :param equation: The equation to calculate.
         :return: The result of the equation.
         """
+        cached = self._cache.get(equation)
+        if cached is not None:
+            self._cache.move_to_end(equation)
+            return cached
+
+        result = fast_evaluate(equation) if self.valves.FAST_PATH_ENABLED else None
+        if result is None:
+            reply = await self._sympy_evaluate(equation)
+            if "error" in reply:
+                return reply["error"]
+            result = reply["result"]
+
+        answer = f"{equation} = {result}"
+        if self.valves.CACHE_SIZE > 0:
+            self._cache[equation] = answer
+            while len(self._cache) > self.valves.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return answer
+
+    async def _sympy_evaluate(self, equation: str) -> dict:
+        """Evaluate with SymPy, returning {"result": ...} or {"error": ...}."""
+        if self.valves.SANDBOX_ENABLED:
+            pool = get_pool(self.valves.POOL_SIZE, self.valves.MEMORY_LIMIT_MB)
+            return await pool.evaluate(equation, self.valves.TIMEOUT)
+
+        sp = get_sympy()
+        try:
+            expr = get_batch_evaluator()["safe_parse"](sp, equation)
+            return {"result": str(expr.evalf())}
+        except (sp.SympifyError, ValueError, TypeError, SyntaxError) as e:
+            print(e)
+            return {"error": "Invalid equation"}
+
+    async def calculate_batch(
+        self,
+        expression: str,
+        variables: dict,
+        grid: bool = False,
+        output: str = "auto",
+    ) -> str:
+        """
+        Evaluate one expression for many variable values at once, instead of calling calculator repeatedly.
+        :param expression: The expression, e.g. "P*r/12/(1-(1+r/12)**(-n))".
+        :param variables: Values for each variable: a list ([0.03, 0.035]), a range string ("1..1000" or "0..1..0.05", inclusive) or {"start": 0, "stop": 1, "num": 11}. Single values are broadcast.
+        :param grid: Evaluate every combination of the variables instead of pairing them element-wise.
+        :param output: "table" for every row, "summary" for statistics, "auto" to choose by size.
+        :return: A compact table or summary statistics.
+        """
+        request = {
+            "expression": expression,
+            "variables": variables,
+            "grid": bool(grid),
+            "output": output if output in ("auto", "table", "summary") else "auto",
+            "max_points": self.valves.BATCH_MAX_POINTS,
+            "table_rows": self.valves.BATCH_TABLE_ROWS,
+        }
+        if self.valves.SANDBOX_ENABLED:
+            pool = get_pool(self.valves.POOL_SIZE, self.valves.MEMORY_LIMIT_MB)
+            reply = await pool.evaluate(request, self.valves.TIMEOUT)
+            return reply.get("error") or reply["result"]
+
+        batch = get_batch_evaluator()
         try:
-            # Parse the equation using sympy
-            expr = sp.sympify(equation)
-            result = expr.evalf()
-            return f"{equation} = {result}"
-        except (sp.SympifyError, ValueError) as e:
+            return await asyncio.to_thread(batch["evaluate_batch"], **request)
+        except batch["BatchError"] as e:
+            return str(e)
+        except (ValueError, TypeError, MemoryError) as e:
             print(e)
             return "Invalid equation"
@@ -1,19 +1,99 @@
 """
 title: 开启深度思考
 author: Open-WebUI-Extensions
-description: 开启深度思考模式
-version: 0.0.5
+description: 开启深度思考模式，可按请求复杂度自适应选择思考预算
+version: 0.1.2
 licence: MIT
 """
 
-from typing import Optional
+import logging
+import re
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+try:
+    from owui_runtime import span
+except ImportError:
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
+logger = logging.getLogger(__name__)
+
+# 会话内指令：/think off|low|high|auto，对当前会话持续生效
+DIRECTIVE_RE = re.compile(r"^\s*/think\s+(off|low|high|auto)\b\s*", re.IGNORECASE)
+
+# 寒暄、确认等无需思考的消息
+TRIVIAL_RE = re.compile(
+    r"^\s*(thanks?( you)?|thx|ok(ay)?|got it|cool|nice|great|yes|no|好的?|好的呢|谢谢|多谢|感谢|嗯+|哦+|收到|明白了?|可以|不错|是的?|对的?|不用了?)[\s!！。.~～]*$",
+    re.IGNORECASE,
+)
+CODE_RE = re.compile(
+    r"```|^\s*(def|class|import|from \S+ import|function|const|let|var|public|#include|SELECT|CREATE TABLE)\b"
+    r"|Traceback \(most recent call last\)|\bException\b|=>|\{\s*$|;\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+MATH_RE = re.compile(
+    r"\$[^$]+\$|\\(frac|int|sum|lim|sqrt|begin)|[∫∑√∂≤≥≠]|\d\s*[+\-*/^=]\s*\(?\d"
+    r"|\b(prove|proof|derive|integral|derivative|probability|equation|theorem|matrix)\b"
+    r"|证明|推导|求解|方程|积分|导数|概率|矩阵|定理",
+    re.IGNORECASE,
+)
+REASONING_RE = re.compile(
+    r"\b(why|how (do|does|can|should|would)|explain|compare|analy[sz]e|design|optimi[sz]e|debug|trade-?offs?|step by step|plan|prove|derive)\b"
+    r"|证明|推导|为什么|为何|如何|怎么|怎样|分析|比较|对比|设计|优化|调试|排查|方案|原理|权衡|规划",
+    re.IGNORECASE,
+)
+TRANSFORM_RE = re.compile(
+    r"\b(translate|rewrite|rephrase|summari[sz]e|format|proofread|fix (the )?typos?)\b"
+    r"|翻译|改写|润色|总结|概括|格式化|转换成|纠正错别字",
+    re.IGNORECASE,
+)
+
+
+def message_text(content: Any) -> str:
+    """取出消息中的文本（兼容多模态列表格式）"""
+    if isinstance(content, list):
+        return "\n".join(
+            str(part.get("text", ""))
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content or "")
+
 
 class Filter:
     class Valves(BaseModel):
         priority: int = Field(default=0, description="Filter priority")
+        mode: Literal["always", "adaptive"] = Field(
+            default="always",
+            description="always=每条消息都开启思考；adaptive=按请求复杂度选择关闭/低/高预算",
+        )
+        low_budget_tokens: int = Field(
+            default=2048, description="低档思考预算 budget_tokens（0 表示不指定预算）"
+        )
+        high_budget_tokens: int = Field(
+            default=16384, description="高档思考预算 budget_tokens（0 表示不指定预算）"
+        )
+        low_threshold: int = Field(
+            default=2, description="复杂度得分达到该值时使用低档预算，低于则关闭思考"
+        )
+        high_threshold: int = Field(
+            default=4, description="复杂度得分达到该值时使用高档预算"
+        )
+        long_prompt_chars: int = Field(
+            default=800, description="超过该字符数视为长提示（+2 分，超过三分之一 +1 分）"
+        )
+        deep_conversation_turns: int = Field(
+            default=6, description="用户轮次达到该值视为深层对话（+1 分）"
+        )
+        log_decisions: bool = Field(
+            default=True, description="记录每次决策及响应耗时，用于评估节省的延迟"
+        )
 
     def __init__(self):
         self.valves = self.Valves()
@@ -27,13 +107,159 @@ class Filter:
             "MCAxMy41IDB2LTUuNzZDMzUuMDcgMjcuODcgMzggMjMuMjc5IDM4IDE4YzAtNy43MzItNi"
             "4yNjgtMTQtMTQtMTRaIi8+PHBhdGggZD0iTTE4IDQ0aDEyIi8+PC9zdmc+"
         )
+        # chat_id -> 会话内覆盖的档位（off/low/high）
+        self._overrides: OrderedDict[str, str] = OrderedDict()
+        # chat_id -> (档位, inlet 时间)，用于在 outlet 中统计耗时
+        self._pending: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # 档位 -> [次数, 累计耗时]
+        self.stats: dict[str, list] = {}
+
+    def classify(self, messages: list) -> tuple[int, list[str]]:
+        """用本地启发式规则为最新的用户消息打分，返回 (得分, 命中原因)"""
+        user_messages = [m for m in messages if m.get("role") == "user"]
+        text = message_text(user_messages[-1].get("content")) if user_messages else ""
+        reasons: list[str] = []
+        score = 0
+
+        if TRIVIAL_RE.match(text):
+            return -1, ["trivial"]
+
+        length = len(text)
+        if length >= self.valves.long_prompt_chars:
+            score += 2
+            reasons.append("long")
+        elif length >= self.valves.long_prompt_chars // 3:
+            score += 1
+            reasons.append("medium")
+
+        if CODE_RE.search(text):
+            score += 2
+            reasons.append("code")
+        if MATH_RE.search(text):
+            score += 2
+            reasons.append("math")
+        if REASONING_RE.search(text):
+            score += 2
+            reasons.append("reasoning")
+        if TRANSFORM_RE.search(text):
+            score -= 2
+            reasons.append("transform")
+
+        if len(user_messages) >= self.valves.deep_conversation_turns and score > 0:
+            score += 1
+            reasons.append("deep")
+
+        return score, reasons
+
+    def _level(self, score: int) -> str:
+        if score >= self.valves.high_threshold:
+            return "high"
+        if score >= self.valves.low_threshold:
+            return "low"
+        return "off"
+
+    def _apply_directive(self, messages: list, chat_id: Optional[str]) -> Optional[str]:
+        """处理并移除最新用户消息中的 /think 指令，返回当前会话的覆盖档位"""
+        for msg in reversed(messages):
+            if msg.get("role") != "user":
+                continue
+            content = msg.get("content")
+            text = content if isinstance(content, str) else None
+            if isinstance(content, list):
+                parts = [p for p in content if isinstance(p, dict) and p.get("type") == "text"]
+                text = parts[0].get("text", "") if parts else None
+            match = DIRECTIVE_RE.match(text or "")
+            if match:
+                stripped = text[match.end():]
+                if isinstance(content, str):
+                    msg["content"] = stripped
+                else:
+                    parts[0]["text"] = stripped
+                value = match.group(1).lower()
+                if chat_id:
+                    if value == "auto":
+                        self._overrides.pop(chat_id, None)
+                    else:
+                        self._overrides[chat_id] = value
+                        while len(self._overrides) > 1024:
+                            self._overrides.popitem(last=False)
+                elif value != "auto":
+                    return value
+            break
+        return self._overrides.get(chat_id) if chat_id else None
+
+    def _thinking(self, level: str) -> dict:
+        if level == "off":
+            return {"type": "disabled"}
+        budget = self.valves.high_budget_tokens if level == "high" else self.valves.low_budget_tokens
+        return {"type": "enabled", "budget_tokens": budget} if budget > 0 else {"type": "enabled"}
 
     def inlet(
         self,
         body: dict,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+    ) -> dict:
+        with span("deep_thinking.inlet", __metadata__ or {}):
+            return self._inlet(body, __metadata__)
+
+    def _inlet(self, body: dict, __metadata__: Optional[dict]) -> dict:
+        if self.valves.mode == "always":
+            body["thinking"] = {
+                "type": "enabled"
+            }
+            return body
+
+        messages = body.get("messages", [])
+        chat_id = (__metadata__ or {}).get("chat_id")
+        override = self._apply_directive(messages, chat_id)
+        if override:
+            level, score, reasons = override, None, ["override"]
+        else:
+            score, reasons = self.classify(messages)
+            level = self._level(score)
+
+        body["thinking"] = self._thinking(level)
+
+        if self.valves.log_decisions:
+            logger.info(
+                "[DeepThinking] chat=%s level=%s score=%s reasons=%s",
+                chat_id,
+                level,
+                score,
+                ",".join(reasons) or "-",
+            )
+            if chat_id:
+                self._pending[chat_id] = (level, time.monotonic())
+                while len(self._pending) > 1024:
+                    self._pending.popitem(last=False)
+        return body
+
+    def outlet(
+        self,
+        body: dict,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> dict:
-        body["thinking"] = {
-            "type": "enabled"
-        }
+        with span("deep_thinking.outlet", __metadata__ or {}):
+            return self._outlet(body, __metadata__)
+
+    def _outlet(self, body: dict, __metadata__: Optional[dict]) -> dict:
+        chat_id = (__metadata__ or {}).get("chat_id") or body.get("chat_id")
+        pending = self._pending.pop(chat_id, None) if chat_id else None
+        if pending:
+            level, started = pending
+            elapsed = time.monotonic() - started
+            count_total = self.stats.setdefault(level, [0, 0.0])
+            count_total[0] += 1
+            count_total[1] += elapsed
+            logger.info(
+                "[DeepThinking] chat=%s level=%s elapsed=%.2fs avg(%s)=%.2fs over %d",
+                chat_id,
+                level,
+                elapsed,
+                level,
+                count_total[1] / count_total[0],
+                count_total[0],
+            )
         return body
@@ -0,0 +1,316 @@
+"""
+title: 历史对话压缩
+author: Open-WebUI-Extensions
+description: 长对话只保留最近若干轮原文，更早的轮次替换为滚动摘要；摘要在回复结束后异步生成并按会话缓存
+version: 0.1.1
+licence: MIT
+requirements: tiktoken
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Optional
+
+import tiktoken
+from fastapi import Request
+from open_webui.models.users import Users
+from open_webui.utils.chat import generate_chat_completion
+from pydantic import BaseModel, Field
+
+try:
+    from owui_runtime import span
+except ImportError:
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROMPT = """### 任务:
+  将下面的早期聊天记录压缩为一份摘要，后续对话只会看到这份摘要而看不到原文。
+### 要求:
+  - 若提供了“已有摘要”，将其与新的聊天记录合并为一份完整摘要，不要丢失已有摘要中仍然有效的信息。
+  - 保留：用户的目标与约束、已确认的事实和决定、关键数字/名称/代码标识符/链接、尚未解决的问题。
+  - 省略寒暄、重复内容和已被推翻的方案。
+  - 使用条目列表，使用对话的主要语言；中文优先。
+  - 只输出摘要本身，不要任何前后解释。
+### 已有摘要:
+  {{PREVIOUS_SUMMARY}}
+### 聊天记录:
+  <chat_history>
+  {{MESSAGES}}
+  </chat_history>"""
+
+SUMMARY_TAG = "conversation_summary"
+DETAILS_RE = re.compile(r"<details\b[^>]*>.*?</details>", re.S)
+
+
+def message_text(content: Any) -> str:
+    """取出消息中的文本（兼容多模态列表格式）"""
+    if isinstance(content, list):
+        return "\n".join(
+            str(part.get("text", ""))
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content or "")
+
+
+def render_messages(messages: list) -> str:
+    """按 Open WebUI 的 {{MESSAGES}} 格式渲染聊天记录，去掉思考过程等折叠块"""
+    return "\n".join(
+        f"{m.get('role', '').upper()}: {DETAILS_RE.sub('', message_text(m.get('content'))).strip()}"
+        for m in messages
+    )
+
+
+def fingerprint(messages: list) -> str:
+    """一段消息的指纹，用于确认缓存的摘要仍对应同一段历史（编辑或重新生成后失效）"""
+    digest = hashlib.sha1()
+    for m in messages:
+        digest.update(str(m.get("role", "")).encode())
+        digest.update(b"\0")
+        digest.update(message_text(m.get("content")).encode())
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+
+def get_encoding(model: str):
+    """与 Live-Token 一致：按模型取 tiktoken 编码，未知模型使用 cl100k_base"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class Filter:
+    class Valves(BaseModel):
+        priority: int = Field(
+            default=-10, description="Filter priority（应先于其他修改消息的过滤器执行）"
+        )
+        keep_turns: int = Field(
+            default=4, description="始终原样保留的最近用户轮次数（每轮从用户消息开始）"
+        )
+        trigger_tokens: int = Field(
+            default=8000, description="对话历史超过该 token 数时才使用摘要替换早期轮次"
+        )
+        min_new_tokens: int = Field(
+            default=2000,
+            description="摘要之后新增的早期历史达到该 token 数时，回复结束后重新生成摘要",
+        )
+        summary_model: str = Field(
+            default="", description="生成摘要使用的模型 ID，留空则使用当前对话的模型"
+        )
+        summary_input_tokens: int = Field(
+            default=12000, description="单次摘要请求最多输入的聊天记录 token 数，超出时分段滚动摘要"
+        )
+        prompt: str = Field(
+            default=DEFAULT_PROMPT,
+            description="摘要提示词，支持 {{PREVIOUS_SUMMARY}} 与 {{MESSAGES}}",
+        )
+        log_compaction: bool = Field(
+            default=True, description="记录每次压缩前后的 token 数"
+        )
+
+    def __init__(self):
+        self.valves = self.Valves()
+        # chat_id -> {"covered": 已摘要的消息数, "fingerprint": 这些消息的指纹, "summary": 摘要}
+        self._summaries: OrderedDict[str, dict] = OrderedDict()
+        # 正在生成摘要的会话，同一会话同时只生成一次
+        self._inflight: set[str] = set()
+        # 持有后台任务的引用，避免被垃圾回收
+        self._tasks: set[asyncio.Task] = set()
+        # 文本 -> token 数，历史消息在每轮请求中重复出现，只需编码一次
+        self._token_counts: OrderedDict[int, int] = OrderedDict()
+
+    def _count(self, text: str, encoding) -> int:
+        key = hash((encoding.name, text))
+        count = self._token_counts.get(key)
+        if count is None:
+            count = len(encoding.encode(text, disallowed_special=()))
+            self._token_counts[key] = count
+            while len(self._token_counts) > 8192:
+                self._token_counts.popitem(last=False)
+        else:
+            self._token_counts.move_to_end(key)
+        return count
+
+    def _message_tokens(self, messages: list, encoding) -> list[int]:
+        return [self._count(message_text(m.get("content")), encoding) for m in messages]
+
+    def _split(self, messages: list) -> tuple[list, list, list]:
+        """拆分为 (开头的系统消息, 可被摘要的早期消息, 原样保留的最近轮次)"""
+        start = 0
+        while start < len(messages) and messages[start].get("role") == "system":
+            start += 1
+        conversation = messages[start:]
+        user_indexes = [i for i, m in enumerate(conversation) if m.get("role") == "user"]
+        if len(user_indexes) <= self.valves.keep_turns:
+            return messages[:start], [], conversation
+        cut = user_indexes[-self.valves.keep_turns] if self.valves.keep_turns > 0 else len(conversation)
+        return messages[:start], conversation[:cut], conversation[cut:]
+
+    def _cached(self, chat_id: Optional[str], older: list) -> Optional[dict]:
+        """仍然有效的缓存摘要：覆盖的消息必须是当前早期历史的前缀且内容未变"""
+        entry = self._summaries.get(chat_id) if chat_id else None
+        if entry is None or entry["covered"] > len(older):
+            return None
+        if fingerprint(older[: entry["covered"]]) != entry["fingerprint"]:
+            return None
+        self._summaries.move_to_end(chat_id)
+        return entry
+
+    def inlet(
+        self,
+        body: dict,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+    ) -> dict:
+        with span("history_compaction.inlet", __metadata__ or {}):
+            return self._inlet(body, __metadata__)
+
+    def _inlet(self, body: dict, __metadata__: Optional[dict]) -> dict:
+        messages = body.get("messages", [])
+        chat_id = (__metadata__ or {}).get("chat_id")
+        system, older, recent = self._split(messages)
+        if not older:
+            return body
+
+        encoding = get_encoding(body.get("model", ""))
+        counts = self._message_tokens(messages, encoding)
+        total = sum(counts)
+        if total < self.valves.trigger_tokens:
+            return body
+
+        # 只使用已缓存的摘要，请求路径上不调用模型；尚无摘要时本轮原样发送
+        entry = self._cached(chat_id, older)
+        if entry is None:
+            return body
+
+        summary_message = {
+            "role": "system",
+            "content": f"<{SUMMARY_TAG}>\n以下是本次对话早期内容的摘要：\n{entry['summary']}\n</{SUMMARY_TAG}>",
+        }
+        body["messages"] = system + [summary_message] + older[entry["covered"] :] + recent
+
+        if self.valves.log_compaction:
+            kept = sum(self._message_tokens(body["messages"], encoding))
+            logger.info(
+                "[HistoryCompaction] chat=%s summarized %d messages, tokens %d -> %d",
+                chat_id,
+                entry["covered"],
+                total,
+                kept,
+            )
+        return body
+
+    async def outlet(
+        self,
+        body: dict,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+        __request__: Optional[Request] = None,
+    ) -> dict:
+        chat_id = (__metadata__ or {}).get("chat_id") or body.get("chat_id")
+        if not chat_id or not __user__ or chat_id in self._inflight:
+            return body
+
+        messages = body.get("messages", [])
+        _, older, _ = self._split(messages)
+        if not older:
+            return body
+
+        encoding = get_encoding(body.get("model", ""))
+        if sum(self._message_tokens(messages, encoding)) < self.valves.trigger_tokens:
+            return body
+
+        entry = self._cached(chat_id, older)
+        covered = entry["covered"] if entry else 0
+        pending = older[covered:]
+        # 已有摘要时，新增的早期历史积累到一定量才重新摘要
+        if not pending or (
+            entry and sum(self._message_tokens(pending, encoding)) < self.valves.min_new_tokens
+        ):
+            return body
+
+        # 在回复结束后后台生成，不阻塞本轮响应；下一轮请求开始使用
+        self._inflight.add(chat_id)
+        task = asyncio.create_task(
+            self._summarize(
+                __request__,
+                __user__["id"],
+                body.get("model", ""),
+                chat_id,
+                older,
+                entry["summary"] if entry else "",
+                covered,
+                __metadata__,
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return body
+
+    async def _summarize(
+        self,
+        request: Optional[Request],
+        user_id: str,
+        model: str,
+        chat_id: str,
+        older: list,
+        summary: str,
+        covered: int,
+        metadata: Optional[dict],
+    ) -> None:
+        try:
+            with span("history_compaction.summarize", metadata or {}):
+                user = await asyncio.to_thread(Users.get_user_by_id, user_id)
+                encoding = get_encoding(model)
+                counts = self._message_tokens(older, encoding)
+                # 分段滚动摘要：每段不超过 summary_input_tokens，逐段并入已有摘要
+                while covered < len(older):
+                    end, budget = covered, self.valves.summary_input_tokens
+                    while end < len(older) and (end == covered or counts[end] <= budget):
+                        budget -= counts[end]
+                        end += 1
+                    result = await self._generate(
+                        request, user, self.valves.summary_model or model, summary, older[covered:end]
+                    )
+                    if not result:
+                        return
+                    summary, covered = result, end
+
+                self._summaries[chat_id] = {
+                    "covered": covered,
+                    "fingerprint": fingerprint(older[:covered]),
+                    "summary": summary,
+                }
+                self._summaries.move_to_end(chat_id)
+                while len(self._summaries) > 1024:
+                    self._summaries.popitem(last=False)
+                logger.info(
+                    "[HistoryCompaction] chat=%s summary now covers %d messages", chat_id, covered
+                )
+        except Exception as err:
+            logger.exception("[HistoryCompaction] summarization failed: %s", err)
+        finally:
+            self._inflight.discard(chat_id)
+
+    async def _generate(
+        self, request: Optional[Request], user: Any, model: str, summary: str, messages: list
+    ) -> str:
+        prompt = self.valves.prompt.replace("{{PREVIOUS_SUMMARY}}", summary or "（无）").replace(
+            "{{MESSAGES}}", render_messages(messages)
+        )
+        form_data = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "stream": False,
+        }
+        res = await generate_chat_completion(request, form_data, user, bypass_filter=True)
+        content = res["choices"][0]["message"]["content"]
+        return DETAILS_RE.sub("", content or "").strip()
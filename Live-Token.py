@@ -3,7 +3,7 @@ title: Live Token
 description: Tracks token usage and timing for the Chat (supports multimodal content)
 author: WillLiang713
 git_url: https://github.com/WillLiang713/Open-WebUI-Extensions
-version: 1.1.0
+version: 1.2.1
 requirements: tiktoken, pydantic
 environment_variables:
 disclaimer: Provided as-is without warranties.
@@ -11,11 +11,19 @@ disclaimer: Provided as-is without warranties.
 """
 
 import time
+from contextlib import nullcontext
 from typing import Any, Awaitable, Callable, Optional
 
 import tiktoken
 from pydantic import BaseModel
 
+try:
+    from owui_runtime import span
+except ImportError:
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
 
 class Config:
     DEBUG = False
@@ -142,12 +150,19 @@ class Filter:
         __event_emitter__: Callable[[Any], Awaitable[None]],
         __model__: Optional[dict] = None,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> dict:
         """
         Called before the main generation step:
          - Count input tokens
          - Mark start_time
         """
+        with span("live_token.inlet", __metadata__ or {}):
+            return await self._inlet(body, __event_emitter__)
+
+    async def _inlet(
+        self, body: dict, __event_emitter__: Callable[[Any], Awaitable[None]]
+    ) -> dict:
         # Sync config with valves each call (in case UI toggles change at runtime)
         Config.DEBUG = self.valves.debug
         Config.COUNT_IMAGES_AS_PLACEHOLDER = self.valves.count_images_as_placeholder
@@ -156,8 +171,9 @@ class Filter:
         content_str = self._messages_to_text(messages)
         cleaned_text = self._remove_roles(content_str)
 
-        enc = get_encoding_for_model(body.get("model", "unknown-model"))
-        self.input_tokens = len(enc.encode(cleaned_text))
+        with span("live_token.encode"):
+            enc = get_encoding_for_model(body.get("model", "unknown-model"))
+            self.input_tokens = len(enc.encode(cleaned_text))
 
         self.start_time = time.time()
 
@@ -180,12 +196,19 @@ class Filter:
         __event_emitter__: Callable[[Any], Awaitable[None]],
         __model__: Optional[dict] = None,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> dict:
         """
         Called after the generation step:
          - Count output tokens (prefer API usage if available)
          - Emit stats
         """
+        with span("live_token.outlet", __metadata__ or {}):
+            return await self._outlet(body, __event_emitter__)
+
+    async def _outlet(
+        self, body: dict, __event_emitter__: Callable[[Any], Awaitable[None]]
+    ) -> dict:
         end_time = time.time()
         elapsed = end_time - self.start_time if self.start_time else 0.0
 
@@ -220,8 +243,9 @@ class Filter:
             last_msg_raw = messages[-1].get("content", "") if messages else ""
             last_msg_text = self._content_to_text(last_msg_raw)
 
-            enc = get_encoding_for_model(body.get("model", "unknown-model"))
-            output_tokens = len(enc.encode(last_msg_text))
+            with span("live_token.encode"):
+                enc = get_encoding_for_model(body.get("model", "unknown-model"))
+                output_tokens = len(enc.encode(last_msg_text))
             debug_print(f"Using tiktoken estimation: input={input_tokens}, output={output_tokens}")
 
         total_tokens = input_tokens + output_tokens
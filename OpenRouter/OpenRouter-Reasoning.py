@@ -2,7 +2,7 @@
 title: OpenRouter Inference Control
 author: Open-WebUI-Extensions
 description: 为 OpenRouter 的 GPT-5 / Gemini 3 系列推理模型提供思考强度控制
-version: 0.0.3
+version: 0.0.6
 licence: MIT
 """
 
@@ -10,6 +10,7 @@ import json
 import logging
 import time
 import uuid
+from contextlib import nullcontext
 from typing import Any, AsyncIterable, Dict, List, Literal, Optional, Tuple
 
 import httpx
@@ -18,6 +19,12 @@ from open_webui.env import GLOBAL_LOG_LEVEL
 from pydantic import BaseModel, Field
 from starlette.responses import StreamingResponse
 
+try:
+    from owui_runtime import get_http_client, metrics, tracer
+except ImportError:
+    # 未安装公共运行时：每次请求使用独立的客户端，不记录耗时
+    get_http_client = metrics = tracer = None
+
 logger = logging.getLogger(__name__)
 logger.setLevel(GLOBAL_LOG_LEVEL)
 
@@ -52,6 +59,22 @@ class Pipe:
     def __init__(self):
         self.valves = self.Valves()
 
+    def _client(self) -> Any:
+        """共享客户端（不随请求关闭），或未安装公共运行时时的一次性客户端"""
+        if get_http_client is not None:
+            return nullcontext(get_http_client(self.valves.proxy))
+        return httpx.AsyncClient(proxy=self.valves.proxy or None, trust_env=True)
+
+    @staticmethod
+    def _record(
+        name: str, started: float, started_ns: int, metadata: Optional[dict], **attributes: Any
+    ) -> None:
+        """记录一个阶段的耗时与 span；流式生成器跨越多次 yield，各阶段按起止时间单独记录"""
+        if metrics is None:
+            return
+        metrics.observe(name, time.perf_counter() - started)
+        tracer.record(name, started_ns, time.time_ns(), metadata, **attributes)
+
     def pipes(self):
         result = []
         for model in self.valves.models.split(","):
@@ -69,99 +92,113 @@ class Pipe:
         body: dict,
         __user__: dict,
         __request__: Request,
+        __metadata__: Optional[dict] = None,
     ) -> StreamingResponse:
         return StreamingResponse(
-            self._pipe(body=body, __user__=__user__, __request__=__request__)
+            self._pipe(
+                body=body,
+                __user__=__user__,
+                __request__=__request__,
+                __metadata__=__metadata__,
+            )
         )
 
     async def _pipe(
-        self, body: dict, __user__: dict, __request__: Request
+        self,
+        body: dict,
+        __user__: dict,
+        __request__: Request,
+        __metadata__: Optional[dict] = None,
     ) -> AsyncIterable:
         user_valves: Pipe.UserValves = __user__["valves"]
         model, payload = await self._build_payload(body=body, user_valves=user_valves)
         
         try:
-            async with httpx.AsyncClient(
-                base_url=self.valves.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.valves.api_key}",
-                    "HTTP-Referer": "https://open-webui.com",
-                    "X-Title": "Open WebUI",
-                },
-                proxy=self.valves.proxy or None,
-                trust_env=True,
-                timeout=self.valves.timeout,
-            ) as client:
-                async with client.stream(**payload) as response:
-                    if response.status_code != 200:
-                        text = ""
-                        async for line in response.aiter_lines():
-                            text += line
-                        logger.error(
-                            "response invalid with %d: %s", response.status_code, text
-                        )
+            started = time.perf_counter()
+            started_ns = time.time_ns()
+            async with self._client() as client, client.stream(**payload) as response:
+                self._record(
+                    "openrouter.connect",
+                    started,
+                    started_ns,
+                    __metadata__,
+                    model=model,
+                    status_code=response.status_code,
+                )
+                if response.status_code != 200:
+                    text = ""
+                    async for line in response.aiter_lines():
+                        text += line
+                    logger.error(
+                        "response invalid with %d: %s", response.status_code, text
+                    )
+                    yield self._format_data(
+                        model=model,
+                        content=f"Error {response.status_code}: {text}",
+                        finish_reason="stop",
+                    )
+                    return
+
+                # 处理流式响应
+                is_thinking = False
+                has_started_content = False
+                first_token = True
+                
+                async for raw_line in response.aiter_lines():
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    if not line.startswith("data:"):
+                        continue
+                    
+                    data_line = line[5:].strip()
+                    if data_line == "[DONE]":
+                        break
+                    
+                    try:
+                        data = json.loads(data_line)
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    choices = data.get("choices", [])
+                    if not choices:
+                        continue
+                    
+                    choice = choices[0]
+                    delta = choice.get("delta", {})
+                    finish_reason = choice.get("finish_reason")
+                    if first_token and (delta.get("reasoning") or delta.get("content")):
+                        first_token = False
+                        self._record("openrouter.ttft", started, started_ns, __metadata__, model=model)
+                    
+                    # 处理 reasoning 内容（思考过程）
+                    reasoning = delta.get("reasoning")
+                    if reasoning:
+                        if not is_thinking:
+                            is_thinking = True
+                            yield self._format_data(model=model, content="<think>")
+                        yield self._format_data(model=model, content=reasoning)
+                        continue
+                    
+                    # 处理正文内容
+                    content = delta.get("content")
+                    if content:
+                        if is_thinking and not has_started_content:
+                            is_thinking = False
+                            has_started_content = True
+                            yield self._format_data(model=model, content="</think>")
+                        yield self._format_data(model=model, content=content)
+                    
+                    # 处理结束
+                    if finish_reason:
+                        if is_thinking:
+                            yield self._format_data(model=model, content="</think>")
                         yield self._format_data(
                             model=model,
-                            content=f"Error {response.status_code}: {text}",
-                            finish_reason="stop",
+                            content="",
+                            finish_reason=finish_reason,
                         )
-                        return
-
-                    # 处理流式响应
-                    is_thinking = False
-                    has_started_content = False
-                    
-                    async for raw_line in response.aiter_lines():
-                        line = raw_line.strip()
-                        if not line:
-                            continue
-                        if not line.startswith("data:"):
-                            continue
-                        
-                        data_line = line[5:].strip()
-                        if data_line == "[DONE]":
-                            break
-                        
-                        try:
-                            data = json.loads(data_line)
-                        except json.JSONDecodeError:
-                            continue
-                        
-                        choices = data.get("choices", [])
-                        if not choices:
-                            continue
-                        
-                        choice = choices[0]
-                        delta = choice.get("delta", {})
-                        finish_reason = choice.get("finish_reason")
-                        
-                        # 处理 reasoning 内容（思考过程）
-                        reasoning = delta.get("reasoning")
-                        if reasoning:
-                            if not is_thinking:
-                                is_thinking = True
-                                yield self._format_data(model=model, content="<think>")
-                            yield self._format_data(model=model, content=reasoning)
-                            continue
-                        
-                        # 处理正文内容
-                        content = delta.get("content")
-                        if content:
-                            if is_thinking and not has_started_content:
-                                is_thinking = False
-                                has_started_content = True
-                                yield self._format_data(model=model, content="</think>")
-                            yield self._format_data(model=model, content=content)
-                        
-                        # 处理结束
-                        if finish_reason:
-                            if is_thinking:
-                                yield self._format_data(model=model, content="</think>")
-                            yield self._format_data(
-                                model=model,
-                                content="",
-                                finish_reason=finish_reason,
-                            )
+            self._record("openrouter.stream", started, started_ns, __metadata__, model=model)
 
         except Exception as err:
             logger.exception("[GPTReasoningPipe] failed: %s", err)
@@ -207,10 +244,17 @@ class Pipe:
             if key in body:
                 data[key] = body[key]
         
+        # 使用进程共享的连接池，base_url、请求头与超时随每次请求传入
         payload = {
             "method": "POST",
-            "url": "/chat/completions",
+            "url": f"{self.valves.base_url.rstrip('/')}/chat/completions",
+            "headers": {
+                "Authorization": f"Bearer {self.valves.api_key}",
+                "HTTP-Referer": "https://open-webui.com",
+                "X-Title": "Open WebUI",
+            },
             "json": data,
+            "timeout": httpx.Timeout(self.valves.timeout),
         }
         
         return model, payload
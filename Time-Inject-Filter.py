@@ -2,15 +2,102 @@
 title: 时间信息注入
 author: Open-WebUI-Extensions
 description: 自动为用户消息注入当前时间信息（日期、时间、时区、星期）
-version: 0.0.1
+version: 0.0.6
 licence: MIT
 """
 
-from datetime import datetime
-from typing import Optional
+import re
+from contextlib import nullcontext
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+try:
+    from zoneinfo import ZoneInfo
+except Exception:
+    ZoneInfo = None
+
+try:
+    from owui_runtime import span
+except ImportError:
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
+
+# 本过滤器注入的文本块，格式与 _get_time_info / _get_precise_time 的输出（及旧版本未加标记的输出）严格一致
+_DATE = r"\d{4}-\d{2}-\d{2}"
+_TIME_INFO_BODY = (
+    rf"# 以下是时间信息参考\n当前日期：{_DATE}\n(?:当前时间：\d{{2}}:\d{{2}}(?::\d{{2}})?\n)?"
+    r"当前时区：[^\n]+\n当前星期：星期[一二三四五六日]"
+)
+TIME_INFO_BLOCK = rf"(?:<time_info>\n{_TIME_INFO_BODY}\n</time_info>|{_TIME_INFO_BODY})"
+PRECISE_TIME_BLOCK = (
+    rf"(?:<current_time>{_DATE} \d{{2}}:\d{{2}}（[^）\n]+）</current_time>"
+    rf"|（当前时间：{_DATE} \d{{2}}:\d{{2}}:\d{{2}}，[^）\n]+）)"
+)
+# 只在注入的位置整块匹配：系统消息与用户消息的末尾（追加）、用户消息的开头（插入）
+APPENDED_TIME_INFO_RE = re.compile(rf"(?:\A|\n\n){TIME_INFO_BLOCK}\Z")
+PREPENDED_TIME_INFO_RE = re.compile(rf"\A{TIME_INFO_BLOCK}(?:\n\n|\Z)")
+APPENDED_PRECISE_TIME_RE = re.compile(rf"(?:\A|\n\n){PRECISE_TIME_BLOCK}\Z")
+
+
+@lru_cache(maxsize=32)
+def resolve_timezone(name: str) -> Optional[tzinfo]:
+    """解析并缓存时区，无效时返回 None（使用本地时间）"""
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+def strip_system(text: str) -> str:
+    """移除之前追加在系统消息末尾的时间信息"""
+    return APPENDED_TIME_INFO_RE.sub("", text)
+
+
+def strip_user(text: str) -> str:
+    """移除之前追加在用户消息末尾的精确时间，以及插入在开头的时间信息"""
+    text = APPENDED_PRECISE_TIME_RE.sub("", text)
+    return PREPENDED_TIME_INFO_RE.sub("", text)
+
+
+def map_text(content: Any, fn: Callable[[str], str]) -> Any:
+    """对消息内容中的文本执行 fn，支持字符串与多模态列表两种格式"""
+    if isinstance(content, str):
+        return fn(content)
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                text = fn(str(part.get("text", "")))
+                if not text:
+                    continue
+                part = {**part, "text": text}
+            parts.append(part)
+        return parts
+    return content
+
+
+def append_text(content: Any, text: str) -> Any:
+    """在消息内容末尾追加文本"""
+    if isinstance(content, list):
+        return content + [{"type": "text", "text": text}]
+    content = str(content or "")
+    return f"{content}\n\n{text}" if content else text
+
+
+def prepend_text(content: Any, text: str) -> Any:
+    """在消息内容开头插入文本"""
+    if isinstance(content, list):
+        return [{"type": "text", "text": text}] + content
+    content = str(content or "")
+    return f"{text}\n\n{content}" if content else text
+
 
 class Filter:
     class Valves(BaseModel):
@@ -19,64 +106,118 @@ class Filter:
         inject_to_system: bool = Field(
             default=True, description="是否注入到系统消息中（否则注入到用户消息前）"
         )
+        system_time_granularity: Literal["date", "hour", "minute", "second"] = Field(
+            default="date",
+            description="系统消息中时间的精度。越粗系统提示越稳定，越利于上游的提示词前缀缓存（date 表示只注入日期）",
+        )
+        precise_time_in_user: bool = Field(
+            default=True,
+            description="系统消息精度低于秒时，是否在最新一条用户消息末尾附上精确（到分钟）时间",
+        )
 
     def __init__(self):
         self.valves = self.Valves()
-
-    def _get_time_info(self) -> str:
-        """获取当前时间信息"""
-        try:
-            import zoneinfo
-
-            tz = zoneinfo.ZoneInfo(self.valves.timezone)
-        except Exception:
-            tz = None
-
-        now = datetime.now(tz)
-
-        # 星期映射
-        weekday_names = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-        weekday = weekday_names[now.weekday()]
-
-        # 格式化时间信息
-        time_info = f"""# 以下是时间信息参考
-当前日期：{now.strftime("%Y-%m-%d")}
-当前时间：{now.strftime("%H:%M:%S")}
-当前时区：{self.valves.timezone}
-当前星期：{weekday}"""
-
-        return time_info
+        # (类型, 时区, 精度, 时间键) -> 已格式化的时间信息，同一分钟内直接复用
+        self._cache: dict[tuple[str, str, str, str], str] = {}
+
+    # 各精度下 “当前时间” 的格式，None 表示不注入时间
+    TIME_FORMATS = {"date": None, "hour": "%H:00", "minute": "%H:%M", "second": "%H:%M:%S"}
+
+    def _now(self) -> datetime:
+        return datetime.now(resolve_timezone(self.valves.timezone))
+
+    def _cached(self, kind: str, granularity: str, build: Callable[[datetime], str]) -> str:
+        """按分钟（秒级精度时按秒）缓存格式化结果"""
+        now = self._now()
+        key_format = "%Y-%m-%d %H:%M:%S" if granularity == "second" else "%Y-%m-%d %H:%M"
+        key = (kind, self.valves.timezone, granularity, now.strftime(key_format))
+        text = self._cache.get(key)
+        if text is None:
+            if len(self._cache) > 16:
+                self._cache.clear()
+            text = self._cache[key] = build(now)
+        return text
+
+    def _get_time_info(self, granularity: str = "second") -> str:
+        """获取当前时间信息，granularity 控制时间精度"""
+
+        def build(now: datetime) -> str:
+            # 星期映射
+            weekday_names = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
+            weekday = weekday_names[now.weekday()]
+
+            # 格式化时间信息
+            lines = ["<time_info>", "# 以下是时间信息参考", f"当前日期：{now.strftime('%Y-%m-%d')}"]
+            time_format = self.TIME_FORMATS.get(granularity, "%H:%M:%S")
+            if time_format:
+                lines.append(f"当前时间：{now.strftime(time_format)}")
+            lines += [f"当前时区：{self.valves.timezone}", f"当前星期：{weekday}", "</time_info>"]
+            return "\n".join(lines)
+
+        return self._cached("info", granularity, build)
+
+    def _get_precise_time(self) -> str:
+        """附加在用户消息末尾的精确时间"""
+        return self._cached(
+            "precise",
+            "minute",
+            lambda now: f"<current_time>{now.strftime('%Y-%m-%d %H:%M')}（{self.valves.timezone}）</current_time>",
+        )
 
     def inlet(
         self,
         body: dict,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> dict:
-        time_info = self._get_time_info()
+        with span("time_inject.inlet", __metadata__ or {}):
+            return self._inject(body)
+
+    def _inject(self, body: dict) -> dict:
         messages = body.get("messages", [])
 
         if not messages:
             return body
 
+        # 先移除之前注入过的时间信息（客户端回传历史、重新生成时会带上），保证多次注入结果一致
+        for msg in messages:
+            if msg.get("role") == "system":
+                msg["content"] = map_text(msg.get("content", ""), strip_system)
+            elif msg.get("role") == "user":
+                msg["content"] = map_text(msg.get("content", ""), strip_user)
+
         if self.valves.inject_to_system:
+            # 系统消息只放粗粒度时间，使其在较长时间内保持字节级不变，
+            # 从而命中上游的提示词前缀缓存；精确时间放到最新的用户消息末尾
+            granularity = self.valves.system_time_granularity
+            time_info = self._get_time_info(granularity)
             # 注入到系统消息中
             system_message_exists = False
             for msg in messages:
                 if msg.get("role") == "system":
                     # 在现有系统消息末尾追加时间信息
-                    msg["content"] = msg.get("content", "") + "\n\n" + time_info
+                    msg["content"] = append_text(msg.get("content", ""), time_info)
                     system_message_exists = True
                     break
 
             if not system_message_exists:
                 # 如果没有系统消息，创建一个
                 messages.insert(0, {"role": "system", "content": time_info})
+
+            if granularity != "second" and self.valves.precise_time_in_user:
+                # 追加在末尾而不是开头：上一轮请求中该消息之前的内容仍可复用缓存
+                for i in range(len(messages) - 1, -1, -1):
+                    if messages[i].get("role") == "user":
+                        messages[i]["content"] = append_text(
+                            messages[i].get("content", ""), self._get_precise_time()
+                        )
+                        break
         else:
+            time_info = self._get_time_info()
             # 注入到最后一条用户消息前
             for i in range(len(messages) - 1, -1, -1):
                 if messages[i].get("role") == "user":
-                    original_content = messages[i].get("content", "")
-                    messages[i]["content"] = time_info + "\n\n" + original_content
+                    messages[i]["content"] = prepend_text(messages[i].get("content", ""), time_info)
                     break
 
         body["messages"] = messages
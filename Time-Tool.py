@@ -1,13 +1,17 @@
 """
 title: Timezone Time Tool
 author: @WillLiang713 (patched by ChatGPT)
-description: A tool that returns the current time for a configured timezone.
-version: 1.0.1
+description: A tool that returns the current time for a configured timezone, or for several timezones at once with optional conversion.
+version: 1.1.2
 required_open_webui_version: >= 0.6.0
 """
 
+import difflib
 import json
-from datetime import datetime, timezone
+import re
+import threading
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -17,6 +21,216 @@ try:
 except Exception:
     ZoneInfo = None
 
+try:
+    from zoneinfo import available_timezones
+except Exception:
+    available_timezones = None
+
+
+# Common abbreviations and city names that are not IANA keys themselves.
+# Abbreviations are ambiguous by nature; each maps to its most common zone
+# for this tool's users (CST is China Standard Time; use CT or CDT for US Central).
+ZONE_ALIASES = {
+    "utc": "UTC",
+    "gmt": "UTC",
+    "z": "UTC",
+    "zulu": "UTC",
+    "est": "America/New_York",
+    "edt": "America/New_York",
+    "et": "America/New_York",
+    "cst": "Asia/Shanghai",
+    "cdt": "America/Chicago",
+    "ct": "America/Chicago",
+    "mst": "America/Denver",
+    "mdt": "America/Denver",
+    "mt": "America/Denver",
+    "pst": "America/Los_Angeles",
+    "pdt": "America/Los_Angeles",
+    "pt": "America/Los_Angeles",
+    "akst": "America/Anchorage",
+    "hst": "Pacific/Honolulu",
+    "bst": "Europe/London",
+    "wet": "Europe/Lisbon",
+    "cet": "Europe/Paris",
+    "cest": "Europe/Paris",
+    "eet": "Europe/Athens",
+    "msk": "Europe/Moscow",
+    "ist": "Asia/Kolkata",
+    "pkt": "Asia/Karachi",
+    "ict": "Asia/Bangkok",
+    "wib": "Asia/Jakarta",
+    "sgt": "Asia/Singapore",
+    "hkt": "Asia/Hong_Kong",
+    "bjt": "Asia/Shanghai",
+    "chst": "Asia/Shanghai",
+    "jst": "Asia/Tokyo",
+    "kst": "Asia/Seoul",
+    "awst": "Australia/Perth",
+    "acst": "Australia/Adelaide",
+    "aest": "Australia/Sydney",
+    "aedt": "Australia/Sydney",
+    "nzst": "Pacific/Auckland",
+    "nzdt": "Pacific/Auckland",
+    "beijing": "Asia/Shanghai",
+    "peking": "Asia/Shanghai",
+    "china": "Asia/Shanghai",
+    "shenzhen": "Asia/Shanghai",
+    "guangzhou": "Asia/Shanghai",
+    "hangzhou": "Asia/Shanghai",
+    "chengdu": "Asia/Shanghai",
+    "japan": "Asia/Tokyo",
+    "korea": "Asia/Seoul",
+    "india": "Asia/Kolkata",
+    "mumbai": "Asia/Kolkata",
+    "bombay": "Asia/Kolkata",
+    "delhi": "Asia/Kolkata",
+    "new delhi": "Asia/Kolkata",
+    "bangalore": "Asia/Kolkata",
+    "san francisco": "America/Los_Angeles",
+    "seattle": "America/Los_Angeles",
+    "silicon valley": "America/Los_Angeles",
+    "washington": "America/New_York",
+    "boston": "America/New_York",
+    "miami": "America/New_York",
+    "atlanta": "America/New_York",
+    "dallas": "America/Chicago",
+    "houston": "America/Chicago",
+    "uk": "Europe/London",
+    "germany": "Europe/Berlin",
+    "france": "Europe/Paris",
+    "munich": "Europe/Berlin",
+    "frankfurt": "Europe/Berlin",
+    "milan": "Europe/Rome",
+    "barcelona": "Europe/Madrid",
+    "北京": "Asia/Shanghai",
+    "上海": "Asia/Shanghai",
+    "中国": "Asia/Shanghai",
+    "香港": "Asia/Hong_Kong",
+    "澳门": "Asia/Macau",
+    "台北": "Asia/Taipei",
+    "东京": "Asia/Tokyo",
+    "日本": "Asia/Tokyo",
+    "首尔": "Asia/Seoul",
+    "新加坡": "Asia/Singapore",
+    "曼谷": "Asia/Bangkok",
+    "迪拜": "Asia/Dubai",
+    "孟买": "Asia/Kolkata",
+    "新德里": "Asia/Kolkata",
+    "莫斯科": "Europe/Moscow",
+    "伦敦": "Europe/London",
+    "巴黎": "Europe/Paris",
+    "柏林": "Europe/Berlin",
+    "罗马": "Europe/Rome",
+    "马德里": "Europe/Madrid",
+    "纽约": "America/New_York",
+    "华盛顿": "America/New_York",
+    "芝加哥": "America/Chicago",
+    "丹佛": "America/Denver",
+    "洛杉矶": "America/Los_Angeles",
+    "旧金山": "America/Los_Angeles",
+    "西雅图": "America/Los_Angeles",
+    "多伦多": "America/Toronto",
+    "温哥华": "America/Vancouver",
+    "圣保罗": "America/Sao_Paulo",
+    "悉尼": "Australia/Sydney",
+    "墨尔本": "Australia/Melbourne",
+    "奥克兰": "Pacific/Auckland",
+}
+
+OFFSET_RE = re.compile(
+    r"^(?:utc|gmt)?\s*([+-])\s*(\d{1,2})(?::?(\d{2}))?$", re.IGNORECASE
+)
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[\s_\-]+", " ", name.strip()).lower()
+
+
+@lru_cache(maxsize=512)
+def load_zone(key: str) -> Optional[tzinfo]:
+    if key == "UTC":
+        return timezone.utc
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(key)
+    except Exception:
+        return None
+
+
+class ZoneRegistry:
+    """Lazily built lookup from IANA keys, city names and aliases to zones."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: Optional[dict[str, str]] = None
+        self._cities: dict[str, str] = {}
+        # name -> resolved zone, cleared when it grows past 512 entries
+        self._resolved: dict[str, Optional[tuple[str, tzinfo]]] = {}
+
+    def _build(self) -> dict[str, str]:
+        with self._lock:
+            if self._keys is not None:
+                return self._keys
+            keys: dict[str, str] = {}
+            cities: dict[str, str] = {}
+            zones = available_timezones() if available_timezones else set()
+            for key in sorted(zones):
+                keys[key.lower()] = key
+                # America/Argentina/Buenos_Aires -> "buenos aires"; prefer
+                # canonical Area/City keys over legacy aliases like "US/..."
+                city = _normalize(key.rsplit("/", 1)[-1])
+                if "/" in key and (city not in cities or key.count("/") == 1):
+                    cities.setdefault(city, key)
+            self._cities = cities
+            self._keys = keys
+            return keys
+
+    def resolve(self, name: str) -> Optional[tuple[str, tzinfo]]:
+        """Resolve an IANA key, city, abbreviation or UTC offset; None if unknown."""
+        if name in self._resolved:
+            return self._resolved[name]
+        if len(self._resolved) > 512:
+            self._resolved.clear()
+        result = self._resolved[name] = self._resolve(name)
+        return result
+
+    def _resolve(self, name: str) -> Optional[tuple[str, tzinfo]]:
+        raw = (name or "").strip()
+        if not raw:
+            return None
+        keys = self._build()
+        norm = _normalize(raw)
+
+        match = OFFSET_RE.match(raw)
+        if match:
+            sign, hours, minutes = match.groups()
+            delta = timedelta(hours=int(hours), minutes=int(minutes or 0))
+            if delta > timedelta(hours=14):
+                return None
+            delta = -delta if sign == "-" else delta
+            label = f"UTC{sign}{int(hours):02d}:{int(minutes or 0):02d}"
+            return label, timezone(delta, label)
+
+        # Aliases come first: tzdata's legacy EST, MST and HST keys are fixed
+        # offsets without daylight saving time
+        key = (
+            ZONE_ALIASES.get(norm)
+            or keys.get(raw.lower())
+            or keys.get(raw.replace(" ", "_").lower())
+            or self._cities.get(norm)
+        )
+        if key is None:
+            close = difflib.get_close_matches(norm, list(self._cities), n=1, cutoff=0.8)
+            key = self._cities[close[0]] if close else None
+        if key is None:
+            return None
+        tz = load_zone(key)
+        return (key, tz) if tz is not None else None
+
+
+_registry = ZoneRegistry()
+
 
 class Tools:
     class Valves(BaseModel):
@@ -24,9 +238,14 @@ class Tools:
             default="Asia/Shanghai",
             description="Default IANA time zone name (e.g., Asia/Shanghai).",
         )
+        MAX_TIMEZONES: int = Field(
+            default=20,
+            description="Maximum number of timezones accepted by a single get_times call.",
+        )
 
     def __init__(self):
         self.valves = self.Valves()
+        self.registry = _registry
         self.tools = [
             {
                 "type": "function",
@@ -39,17 +258,70 @@ class Tools:
                         "required": [],
                     },
                 },
-            }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_times",
+                    "description": (
+                        "Get the current time in several timezones at once, or convert "
+                        "a given time into them. Accepts IANA names, city names, "
+                        "abbreviations (EST, JST) and UTC offsets (UTC+8)."
+                    ),
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "timezones": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Timezones to report, e.g. [\"Asia/Tokyo\", \"New York\", \"CET\"].",
+                            },
+                            "time": {
+                                "type": "string",
+                                "description": "Optional time to convert instead of now, e.g. \"2025-03-01 09:30\" or \"15:00\" (today).",
+                            },
+                            "source_timezone": {
+                                "type": "string",
+                                "description": "Timezone of `time` when it has no offset; defaults to the configured timezone.",
+                            },
+                        },
+                        "required": ["timezones"],
+                    },
+                },
+            },
         ]
 
-    def _resolve_timezone(self) -> timezone:
+    def _resolve_timezone(self) -> tzinfo:
         name = (self.valves.DEFAULT_TIMEZONE or "").strip() or "UTC"
-        if ZoneInfo is None:
-            return timezone.utc
+        resolved = self.registry.resolve(name)
+        return resolved[1] if resolved else timezone.utc
+
+    @staticmethod
+    def _parse_time(value: str, tz: tzinfo) -> Optional[datetime]:
+        value = value.strip()
         try:
-            return ZoneInfo(name)
-        except Exception:
-            return timezone.utc
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            parsed = None
+            for fmt in ("%H:%M", "%H:%M:%S", "%Y/%m/%d %H:%M", "%Y-%m-%d %H:%M"):
+                try:
+                    parsed = datetime.strptime(value, fmt)
+                    break
+                except ValueError:
+                    continue
+            if parsed is None:
+                return None
+            if parsed.year == 1900:
+                today = datetime.now(tz)
+                parsed = parsed.replace(year=today.year, month=today.month, day=today.day)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=tz)
+        return parsed
+
+    @staticmethod
+    def _format(moment: datetime) -> str:
+        offset = moment.strftime("%z")
+        return f"{moment.strftime('%Y-%m-%d %H:%M %a')} {offset[:3]}:{offset[3:]}"
 
     async def get_time(
         self,
@@ -66,3 +338,48 @@ class Tools:
                 "formatted": now.strftime("%Y-%m-%d %H:%M:%S %Z%z"),
             }
         )
+
+    async def get_times(
+        self,
+        timezones: list[str],
+        time: Optional[str] = None,
+        source_timezone: Optional[str] = None,
+        __event_emitter__: Optional[object] = None,
+        __user__: Optional[dict] = None,
+    ) -> str:
+        if isinstance(timezones, str):
+            timezones = re.split(r"[,;，、]", timezones)
+        names = [str(name).strip() for name in timezones or [] if str(name).strip()]
+        names = list(dict.fromkeys(names))[: max(1, self.valves.MAX_TIMEZONES)]
+
+        result: dict = {}
+        source_name = (source_timezone or "").strip()
+        source = self.registry.resolve(source_name) if source_name else None
+        if source_name and source is None:
+            return json.dumps({"error": f"Unknown timezone: {source_name}"}, ensure_ascii=False)
+        source_tz = source[1] if source else self._resolve_timezone()
+
+        if time:
+            moment = self._parse_time(str(time), source_tz)
+            if moment is None:
+                return json.dumps({"error": f"Unrecognized time: {time}"}, ensure_ascii=False)
+            label = source[0] if source else getattr(moment.tzinfo, "key", None) or str(moment.tzinfo)
+            result["source"] = f"{label} {self._format(moment)}"
+        else:
+            moment = datetime.now(timezone.utc)
+
+        times: dict[str, str] = {}
+        unresolved: list[str] = []
+        for name in names:
+            resolved = self.registry.resolve(name)
+            if resolved is None:
+                unresolved.append(name)
+                continue
+            key, tz = resolved
+            label = key if key == name else f"{name} ({key})"
+            times[label] = self._format(moment.astimezone(tz))
+
+        result["times"] = times
+        if unresolved:
+            result["unresolved"] = unresolved
+        return json.dumps(result, ensure_ascii=False)
@@ -0,0 +1,334 @@
+"""
+title: 工具结果压缩
+author: Open-WebUI-Extensions
+description: 多步工具调用中只原样保留最近的工具结果，超出 token 预算的较早结果替换为紧凑摘要（标题、链接、关键数字）
+version: 0.1.2
+licence: MIT
+requirements: tiktoken
+"""
+
+import html
+import json
+import logging
+import re
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, Optional
+
+import tiktoken
+from pydantic import BaseModel, Field
+
+try:
+    from owui_runtime import span
+except ImportError:
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
+logger = logging.getLogger(__name__)
+
+# 摘要的首行标记，已压缩的结果不会再次处理
+DIGEST_MARK = "[工具结果摘要]"
+# Open WebUI 保存在助手消息里的工具调用块：<details type="tool_calls" name="..." result="...">
+TOOL_DETAILS_RE = re.compile(r'<details\s+type="tool_calls"[^>]*>')
+ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+# 含数字的短句，作为“关键数字”保留上下文
+# 句点后紧跟非空白字符（如 3.5、example.com）时不视为句子结束
+NUMBER_CLAUSE_RE = re.compile(
+    r"(?:[^。！？；.!?;\n]|\.(?=\S))*\d(?:[^。！？；.!?;\n]|\.(?=\S))*"
+)
+
+
+def message_text(content: Any) -> str:
+    if isinstance(content, list):
+        return "\n".join(
+            str(part.get("text", ""))
+            for part in content
+            if isinstance(part, dict) and part.get("type") == "text"
+        )
+    return str(content or "")
+
+
+def get_encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def shorten(text: str, limit: int) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def key_numbers(text: str, limit: int, clause_chars: int = 80) -> list[str]:
+    """含数字的短句（去重），如“同比增长 3.5%”“2024 年发布”"""
+    clauses = []
+    for match in NUMBER_CLAUSE_RE.finditer(text or ""):
+        clause = shorten(match.group().strip(" ,，、:："), clause_chars)
+        if clause and clause not in clauses:
+            clauses.append(clause)
+            if len(clauses) >= limit:
+                break
+    return clauses
+
+
+def flatten(data: Any, prefix: str = "") -> list[str]:
+    """把 JSON 结果展开为 “键: 值” 行，用于没有专用摘要的工具"""
+    if isinstance(data, dict):
+        return [line for k, v in data.items() for line in flatten(v, f"{prefix}{k}.")]
+    if isinstance(data, list):
+        return [line for v in data for line in flatten(v, prefix)]
+    return [f"{prefix.rstrip('.')}: {data}"] if data not in (None, "") else []
+
+
+class Filter:
+    class Valves(BaseModel):
+        priority: int = Field(
+            default=0,
+            description="Filter priority（与 History-Compaction 同用时应在其之后执行）",
+        )
+        tools: str = Field(
+            default="web_search,fetch_url_content,get_weather,get_weather_batch",
+            description="需要压缩结果的工具名，逗号分隔；留空表示所有工具",
+        )
+        keep_recent: int = Field(
+            default=2, description="始终原样保留的最近工具结果数（当前轮次的结果总是保留）"
+        )
+        token_budget: int = Field(
+            default=4000,
+            description="原样保留的工具结果总 token 数上限，超出后更早的结果替换为摘要",
+        )
+        max_items: int = Field(default=8, description="摘要中最多保留的搜索结果条数")
+        max_numbers: int = Field(default=6, description="摘要中最多保留的含数字短句数")
+        digest_chars: int = Field(
+            default=300, description="无专用摘要的工具，摘要最多保留的字符数"
+        )
+        log_digests: bool = Field(default=True, description="记录每次压缩前后的 token 数")
+
+    def __init__(self):
+        self.valves = self.Valves()
+        # 工具结果 -> 摘要，outlet 中预先生成，inlet 直接复用
+        self._digests: OrderedDict[int, str] = OrderedDict()
+        self._token_counts: dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # 摘要
+    # ------------------------------------------------------------------
+
+    def _digest_web_search(self, data: dict) -> list[str]:
+        results = data.get("results") or []
+        lines = [f"共 {data.get('result_count', len(results))} 条结果"]
+        for item in results[: self.valves.max_items]:
+            line = f"- {shorten(item.get('title') or '无标题', 80)} <{item.get('source', '')}>"
+            numbers = key_numbers(item.get("content", ""), 2)
+            if numbers:
+                line += "：" + "；".join(numbers)
+            lines.append(line)
+        return lines
+
+    def _digest_fetch(self, data: dict) -> list[str]:
+        # passages 模式：[{"index", "score", "content"}]；full 模式：content + documents[].metadata
+        passages = data.get("passages")
+        if isinstance(passages, list):
+            text = "\n".join(
+                str(p.get("content", "") if isinstance(p, dict) else p) for p in passages
+            )
+        else:
+            text = str(data.get("content", ""))
+        title = data.get("title") or next(
+            (
+                d["metadata"]["title"]
+                for d in data.get("documents") or []
+                if isinstance(d, dict) and (d.get("metadata") or {}).get("title")
+            ),
+            "网页",
+        )
+        lines = [f"{shorten(title, 80)} <{data.get('url', '')}>"]
+        if data.get("truncated"):
+            lines[0] += "（原文已截断）"
+        lines.append("开头：" + shorten(text, 150))
+        lines += [f"- {n}" for n in key_numbers(text, self.valves.max_numbers)]
+        return lines
+
+    def _digest_generic(self, data: Any, text: str) -> list[str]:
+        if isinstance(data, (dict, list)):
+            text = "\n".join(flatten(data))
+        lines, used = [], 0
+        for line in text.splitlines():
+            line = shorten(line, 120)
+            if not line:
+                continue
+            if used + len(line) > self.valves.digest_chars:
+                lines.append("…")
+                break
+            lines.append(line)
+            used += len(line)
+        return lines
+
+    def _digest(self, name: str, text: str, tokens: int) -> str:
+        key = hash((name, text))
+        digest = self._digests.get(key)
+        if digest is not None:
+            self._digests.move_to_end(key)
+            return digest
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and data.get("error"):
+            # 错误信息本身很短，原样保留
+            lines = [shorten(text, self.valves.digest_chars)]
+        elif name == "web_search" and isinstance(data, dict) and "results" in data:
+            lines = self._digest_web_search(data)
+        elif name == "fetch_url_content" and isinstance(data, dict) and "url" in data:
+            lines = self._digest_fetch(data)
+        else:
+            lines = self._digest_generic(data, text)
+
+        header = f"{DIGEST_MARK} 较早的 {name or '工具'} 结果已压缩（原文约 {tokens} tokens），如需细节请重新调用工具。"
+        digest = "\n".join([header] + lines)
+        self._digests[key] = digest
+        while len(self._digests) > 2048:
+            self._digests.popitem(last=False)
+        return digest
+
+    # ------------------------------------------------------------------
+    # 工具结果定位
+    # ------------------------------------------------------------------
+
+    def _count(self, text: str, encoding) -> int:
+        key = hash((encoding.name, text))
+        if key not in self._token_counts:
+            if len(self._token_counts) >= 8192:
+                self._token_counts.clear()
+            self._token_counts[key] = len(encoding.encode(text, disallowed_special=()))
+        return self._token_counts[key]
+
+    def _tracked(self, name: str) -> bool:
+        names = [n.strip() for n in self.valves.tools.split(",") if n.strip()]
+        return not names or name in names
+
+    def _results(self, messages: list) -> list[tuple[int, str, str, Callable[[str], None]]]:
+        """
+        按出现顺序列出所有工具结果：(消息下标, 工具名, 结果文本, 替换函数)。
+
+        同时支持两种形式：OpenAI 格式的 role=tool 消息，以及 Open WebUI
+        在助手消息中保存的 <details type="tool_calls" result="..."> 块。
+        """
+        results = []
+        names: dict[str, str] = {}
+        for index, message in enumerate(messages):
+            role = message.get("role")
+            if role == "assistant":
+                for call in message.get("tool_calls") or []:
+                    names[call.get("id", "")] = (call.get("function") or {}).get("name", "")
+                content = message.get("content")
+                if isinstance(content, str) and 'type="tool_calls"' in content:
+                    results += self._details_results(messages, index, content)
+            elif role == "tool":
+                name = message.get("name") or names.get(message.get("tool_call_id", ""), "")
+
+                def replace(digest: str, index: int = index) -> None:
+                    messages[index] = {**messages[index], "content": digest}
+
+                results.append((index, name, message_text(message.get("content")), replace))
+        return results
+
+    def _details_results(self, messages: list, index: int, content: str) -> list:
+        results = []
+        for match in TOOL_DETAILS_RE.finditer(content):
+            attrs = dict(ATTR_RE.findall(match.group()))
+            if "result" not in attrs:
+                continue
+            try:
+                result = json.loads(html.unescape(attrs["result"]))
+            except ValueError:
+                continue
+            if not isinstance(result, str):
+                result = json.dumps(result, ensure_ascii=False)
+
+            def replace(digest: str, tag: str = match.group(), raw: str = attrs["result"]) -> None:
+                escaped = html.escape(json.dumps(digest, ensure_ascii=False))
+                new_tag = tag.replace(f'result="{raw}"', f'result="{escaped}"', 1)
+                text = messages[index]["content"].replace(tag, new_tag, 1)
+                messages[index] = {**messages[index], "content": text}
+
+            results.append((index, attrs.get("name", ""), result, replace))
+        return results
+
+    # ------------------------------------------------------------------
+    # inlet / outlet
+    # ------------------------------------------------------------------
+
+    def inlet(
+        self,
+        body: dict,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+    ) -> dict:
+        with span("tool_result_digest.inlet", __metadata__ or {}):
+            return self._inlet(body, __metadata__)
+
+    def _inlet(self, body: dict, __metadata__: Optional[dict]) -> dict:
+        messages = body.get("messages", [])
+        results = [r for r in self._results(messages) if self._tracked(r[1])]
+        if len(results) <= self.valves.keep_recent:
+            return body
+
+        # 当前轮次（最后一条用户消息之后）的结果是模型正在使用的，总是原样保留
+        last_user = max(
+            (i for i, m in enumerate(messages) if m.get("role") == "user"), default=-1
+        )
+        encoding = get_encoding(body.get("model", ""))
+        kept, before, after = 0, 0, 0
+        exhausted = False
+        # 从新到旧：保留最近的结果直到超出预算，更早的全部替换为摘要
+        # （不跳过较小的旧结果，使替换边界只向后移动，尽量不破坏上游前缀缓存）
+        for position, (index, name, text, replace) in enumerate(reversed(results)):
+            tokens = self._count(text, encoding)
+            before += tokens
+            if text.startswith(DIGEST_MARK):
+                after += tokens
+                continue
+            exhausted = exhausted or kept + tokens > self.valves.token_budget
+            if index > last_user or position < self.valves.keep_recent or not exhausted:
+                kept += tokens
+                after += tokens
+                continue
+            digest = self._digest(name, text, tokens)
+            digest_tokens = self._count(digest, encoding)
+            if digest_tokens >= tokens:
+                after += tokens
+                continue
+            replace(digest)
+            after += digest_tokens
+
+        if self.valves.log_digests and after < before:
+            logger.info(
+                "[ToolResultDigest] chat=%s tool results %d, tokens %d -> %d",
+                (__metadata__ or {}).get("chat_id"),
+                len(results),
+                before,
+                after,
+            )
+        return body
+
+    def outlet(
+        self,
+        body: dict,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+    ) -> dict:
+        # 回复结束后预先生成本轮工具结果的摘要，下一轮 inlet 替换时直接命中缓存
+        with span("tool_result_digest.outlet", __metadata__ or {}):
+            messages = body.get("messages", [])
+            last_user = max(
+                (i for i, m in enumerate(messages) if m.get("role") == "user"), default=-1
+            )
+            encoding = get_encoding(body.get("model", ""))
+            for index, name, text, _ in self._results(list(messages)):
+                if index > last_user and self._tracked(name) and not text.startswith(DIGEST_MARK):
+                    self._digest(name, text, self._count(text, encoding))
+        return body
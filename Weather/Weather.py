@@ -2,15 +2,339 @@
 title: 高德天气查询工具
 author: @WillLiang713
 description: 使用高德开放平台API获取指定城市的实时天气或天气预报
-version: 1.0.0
+version: 1.7.5
 required_open_webui_version: >= 0.6.0
 """
 
+import asyncio
+import atexit
+import base64
 import json
-from typing import Optional
-import aiohttp
+import logging
+import lzma
+import re
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Iterable, Literal, Optional
+import httpx
 from pydantic import BaseModel, Field
 
+try:
+    from owui_runtime import TTLCache, get_http_client, metrics, span
+except ImportError:
+    # 未安装公共运行时：使用本工具自己的连接池与天气缓存，不记录指标
+    TTLCache = get_http_client = metrics = None
+
+    def span(*args, **kwargs):
+        return nullcontext()
+
+logger = logging.getLogger(__name__)
+
+
+# 行政区划后缀，用于把 “深圳市”“朝阳区” 这类输入归一为索引中的简称
+REGION_SUFFIX_RE = re.compile(
+    r"^(.{2,}?)(?:特别行政区|自治区|自治州|自治县|自治旗|地区|林区|新区|省|市|区|县|旗|盟|州)$"
+)
+
+
+def strip_region_suffix(name: str) -> str:
+    match = REGION_SUFFIX_RE.match(name)
+    return match.group(1) if match else name
+
+
+def adcode_level(adcode: str) -> int:
+    """行政级别：0=省级，1=地级，2=区县级"""
+    if adcode.endswith("0000"):
+        return 0
+    if adcode.endswith("00"):
+        return 1
+    return 2
+
+
+def adcode_prefix(adcode: str) -> str:
+    """下级行政区 adcode 共有的前缀"""
+    return adcode[: (2, 4, 6)[adcode_level(adcode)]]
+
+
+class AdcodeIndex:
+    """
+    行政区名称 -> adcode 的内存索引，由 build_adcode_index.py 生成的 adcode_index.tsv 构建。
+    支持全称、去后缀简称、拼音三种键，以及 “北京朝阳” 这类带上级前缀的写法。
+    同名地区按行政级别（省 > 市 > 区县）排序返回全部候选。
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, str, str, str]]):
+        self.names: dict[str, list[tuple[str, str]]] = {}
+        self.aliases: dict[str, list[tuple[str, str]]] = {}
+        self.pinyins: dict[str, list[tuple[str, str]]] = {}
+        for name, adcode, alias, pinyin in rows:
+            entry = (name, adcode)
+            self.names.setdefault(name, []).append(entry)
+            if alias and alias != name:
+                self.aliases.setdefault(alias, []).append(entry)
+            if pinyin:
+                self.pinyins.setdefault(pinyin, []).append(entry)
+        for table in (self.names, self.aliases, self.pinyins):
+            for entries in table.values():
+                entries.sort(key=lambda e: (adcode_level(e[1]), e[1]))
+
+    @classmethod
+    def from_tsv(cls, text: str) -> "AdcodeIndex":
+        rows = []
+        for line in text.splitlines():
+            fields = line.split("\t")
+            if len(fields) == 4:
+                rows.append((fields[0], fields[1], fields[2], fields[3]))
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _lookup_name(self, query: str) -> list[tuple[str, str]]:
+        return (
+            self.names.get(query)
+            or self.aliases.get(query)
+            or self.aliases.get(strip_region_suffix(query))
+            or []
+        )
+
+    def lookup(self, query: str) -> list[tuple[str, str]]:
+        """返回候选 (名称, adcode) 列表，首个为最佳匹配；找不到时返回空列表"""
+        query = query.strip()
+        if not query:
+            return []
+
+        hits = self._lookup_name(query)
+        if hits:
+            return hits
+
+        key = re.sub(r"[\s'’-]", "", query).lower()
+        if key.isascii():
+            return self.pinyins.get(key) or []
+
+        # 带上级前缀的写法，如 “北京朝阳”“广东省深圳市”
+        for i in range(2, len(query) - 1):
+            parents = self._lookup_name(query[:i])
+            if not parents:
+                continue
+            children = self._lookup_name(query[i:])
+            narrowed = [
+                child
+                for child in children
+                if any(
+                    child[1] != parent[1] and child[1].startswith(adcode_prefix(parent[1]))
+                    for parent in parents
+                )
+            ]
+            if narrowed:
+                return narrowed
+        return []
+
+
+AMAP_WEATHER_URL = "https://restapi.amap.com/v3/weather/weatherInfo"
+
+
+class AMapError(Exception):
+    """高德API请求失败，payload 为返回给模型的错误信息"""
+
+    def __init__(self, payload: dict):
+        super().__init__(payload.get("error", ""))
+        self.payload = payload
+
+
+# 高德 reporttime 为北京时间
+CHINA_TZ = timezone(timedelta(hours=8))
+
+
+def report_timestamp(data: dict) -> Optional[float]:
+    """从高德响应中取出 reporttime 对应的时间戳"""
+    items = data.get("lives") or data.get("forecasts") or [{}]
+    try:
+        reported = datetime.strptime(items[0].get("reporttime", ""), "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+    return reported.replace(tzinfo=CHINA_TZ).timestamp()
+
+
+class WeatherCache:
+    """
+    未安装公共运行时时使用的天气缓存，fetch 与 owui_runtime.TTLCache.fetch 用法一致：
+    - 同一 key 的并发请求合并为一次（single-flight）
+    - 过期后 stale 秒内直接返回旧数据并在后台刷新
+    - 刷新失败（fallback_on）时退回旧数据而不是报错
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        # key -> (data, expires_at)
+        self.entries: dict[tuple[str, str], tuple[Any, float]] = {}
+        self.inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+    def _load(
+        self,
+        key: tuple[str, str],
+        loader: Callable[[], Awaitable[Any]],
+        expires_at: Callable[[Any], float],
+    ) -> asyncio.Task:
+        task = self.inflight.get(key)
+        if task is None:
+
+            async def run() -> Any:
+                try:
+                    data = await loader()
+                    self.entries.pop(key, None)
+                    if len(self.entries) >= self.maxsize:
+                        self.entries.pop(next(iter(self.entries)))
+                    self.entries[key] = (data, expires_at(data))
+                    return data
+                finally:
+                    self.inflight.pop(key, None)
+
+            task = self.inflight[key] = asyncio.ensure_future(run())
+            # 后台刷新失败时不产生 “Task exception was never retrieved” 警告
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def fetch(
+        self,
+        key: tuple[str, str],
+        loader: Callable[[], Awaitable[Any]],
+        expires_at: Callable[[Any], float],
+        stale: float,
+        fallback_on: tuple[type[BaseException], ...] = (),
+    ) -> tuple[Any, bool]:
+        """返回 (数据, 是否为刷新失败后退回的旧数据)"""
+        now = time.time()
+        entry = self.entries.get(key)
+        if entry is not None:
+            if now < entry[1]:
+                return entry[0], False
+            if now < entry[1] + stale:
+                self._load(key, loader, expires_at)
+                return entry[0], False
+        try:
+            return await asyncio.shield(self._load(key, loader, expires_at)), False
+        except fallback_on:
+            if entry is None:
+                raise
+            return entry[0], True
+
+
+# 按 (adcode, extensions) 缓存高德原始响应，过期时间由 reporttime + 刷新周期推算；
+# 安装了公共运行时则使用其共享缓存（计入运行时指标）
+_weather_cache = TTLCache(maxsize=4096, name="weather") if TTLCache else WeatherCache()
+
+_client: Optional[tuple[asyncio.AbstractEventLoop, int, httpx.AsyncClient]] = None
+_slots: Optional[tuple[asyncio.AbstractEventLoop, int, asyncio.Semaphore]] = None
+
+
+def amap_client(pool_size: int) -> httpx.AsyncClient:
+    """
+    请求高德使用的客户端：安装了公共运行时则使用其共享连接池；否则使用本工具自己的
+    连接池（最多 pool_size 个连接），事件循环或 POOL_SIZE 变化时关闭旧连接池并重建
+    """
+    global _client
+    if get_http_client is not None:
+        return get_http_client()
+    loop = asyncio.get_running_loop()
+    size = max(1, pool_size)
+    if _client is not None:
+        owner, current, client = _client
+        if owner is loop and current == size and not client.is_closed:
+            return client
+        if owner is loop and not client.is_closed:
+            loop.create_task(client.aclose())
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+        trust_env=True,
+    )
+    _client = (loop, size, client)
+    return client
+
+
+@atexit.register
+def _close_client_at_exit() -> None:
+    # 退出时事件循环通常已停止但尚未关闭，仍可正常断开连接
+    if _client is None:
+        return
+    loop, _, client = _client
+    if not client.is_closed and not loop.is_closed() and not loop.is_running():
+        loop.run_until_complete(client.aclose())
+
+
+def amap_slots(pool_size: int) -> asyncio.Semaphore:
+    """本工具同时发往高德的请求数上限，即最多占用的连接数"""
+    global _slots
+    loop = asyncio.get_running_loop()
+    size = max(1, pool_size)
+    if _slots is None or _slots[0] is not loop or _slots[1] != size:
+        _slots = (loop, size, asyncio.Semaphore(size))
+    return _slots[2]
+
+
+class RateLimiter:
+    """匀速限流：进程内相邻两次请求至少间隔 1/qps 秒，使请求速率不超过 API Key 的 QPS 配额"""
+
+    def __init__(self):
+        self.next_at = 0.0
+
+    async def acquire(self, qps: float) -> None:
+        if qps <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.next_at)
+        self.next_at = slot + 1 / qps
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_rate_limiter = RateLimiter()
+
+
+_adcode_index: Optional[AdcodeIndex] = None
+_adcode_index_lock: Optional[asyncio.Lock] = None
+
+
+async def load_adcode_index(source: str) -> Optional[AdcodeIndex]:
+    """
+    懒加载行政区索引：source（URL 或本地路径）非空时从中读取自定义索引，
+    否则或读取失败时使用文件末尾内置的索引。
+    """
+    global _adcode_index, _adcode_index_lock
+    if _adcode_index is not None:
+        return _adcode_index
+    if _adcode_index_lock is None:
+        _adcode_index_lock = asyncio.Lock()
+
+    async with _adcode_index_lock:
+        if _adcode_index is not None:
+            return _adcode_index
+        if source:
+            try:
+                if source.startswith(("http://", "https://")):
+                    # 只在首次使用时下载一次，不占用请求高德的连接池
+                    async with httpx.AsyncClient(trust_env=True) as client:
+                        response = await client.get(
+                            source, timeout=httpx.Timeout(10, connect=5), follow_redirects=True
+                        )
+                    response.raise_for_status()
+                    text = response.content.decode("utf-8")
+                else:
+                    with open(source, encoding="utf-8") as f:
+                        text = f.read()
+                index = AdcodeIndex.from_tsv(text)
+                if not len(index):
+                    raise ValueError("empty adcode index")
+                _adcode_index = index
+                return _adcode_index
+            except Exception as e:
+                logger.warning("[Weather] 加载自定义行政区索引失败，改用内置索引：%s", e)
+        _adcode_index = AdcodeIndex.from_tsv(
+            lzma.decompress(base64.b64decode(ADCODE_INDEX_DATA)).decode("utf-8")
+        )
+        return _adcode_index
+
 
 class Tools:
     class Valves(BaseModel):
@@ -18,6 +342,42 @@ class Tools:
             default="",
             description="高德开放平台Web服务API Key，请在 https://console.amap.com 申请",
         )
+        ADCODE_INDEX_URL: str = Field(
+            default="",
+            description="自定义 adcode 索引（URL 或本地路径，格式同 adcode_index.tsv），留空则使用内置的全国行政区索引",
+        )
+        CONNECT_TIMEOUT: float = Field(
+            default=5.0, description="连接高德API的超时时间（秒）"
+        )
+        READ_TIMEOUT: float = Field(
+            default=10.0, description="读取高德API响应的超时时间（秒）"
+        )
+        POOL_SIZE: int = Field(
+            default=10, description="与高德API保持的最大并发连接数"
+        )
+        OUTPUT_FORMAT: Literal["compact", "json"] = Field(
+            default="compact",
+            description="compact：表头加每天一行的紧凑文本，节省上下文 token；json：带缩进的完整 JSON",
+        )
+        QPS_LIMIT: float = Field(
+            default=3.0, description="每秒最多请求高德API的次数（与 Key 的 QPS 配额一致），0 表示不限制"
+        )
+        MAX_BATCH_CITIES: int = Field(
+            default=20, description="批量查询单次最多处理的城市数"
+        )
+        CACHE_ENABLED: bool = Field(default=True, description="是否缓存天气数据")
+        LIVE_REFRESH_MINUTES: int = Field(
+            default=60, description="实时天气的更新周期（分钟），缓存在 reporttime 之后该时长过期"
+        )
+        FORECAST_REFRESH_MINUTES: int = Field(
+            default=180, description="天气预报的更新周期（分钟），缓存在 reporttime 之后该时长过期"
+        )
+        CACHE_MIN_TTL: int = Field(
+            default=300, description="每次请求后缓存至少保留的秒数，避免数据发布延迟时频繁请求"
+        )
+        CACHE_STALE_SECONDS: int = Field(
+            default=1800, description="缓存过期后仍可直接返回旧数据（同时后台刷新）的秒数"
+        )
 
     def __init__(self):
         self.valves = self.Valves()
@@ -42,7 +402,29 @@ class Tools:
                         "required": ["city"],
                     },
                 },
-            }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_weather_batch",
+                    "description": "一次性获取多个城市的天气信息，适合对比多个城市的天气。需要查询两个及以上城市时请使用此工具，而不是多次调用 get_weather。",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "cities": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "城市名称或adcode列表，如：[\"北京\", \"上海\", \"广州\"]",
+                            },
+                            "forecast": {
+                                "type": "boolean",
+                                "description": "是否获取天气预报。为true时返回未来几天的天气预报，为false时只返回实时天气。默认为false。",
+                            },
+                        },
+                        "required": ["cities"],
+                    },
+                },
+            },
         ]
 
     # 常用城市 adcode 映射表（可扩展）
@@ -105,22 +487,31 @@ class Tools:
         "澳门": "820000",
     }
 
+    def _lookup_city(self, city: str) -> list[tuple[str, str]]:
+        """返回城市的候选 (名称, adcode) 列表，首个为最佳匹配"""
+        city = city.strip()
+        if city in self.CITY_ADCODE_MAP:
+            return [(city, self.CITY_ADCODE_MAP[city])]
+
+        if _adcode_index is not None:
+            return _adcode_index.lookup(city)
+
+        # 索引不可用时，退回内置常用城市表的简称匹配
+        short = strip_region_suffix(city)
+        if short in self.CITY_ADCODE_MAP:
+            return [(short, self.CITY_ADCODE_MAP[short])]
+        return []
+
     def _get_adcode(self, city: str) -> str:
         """获取城市的adcode编码"""
         # 如果输入的就是数字（adcode），直接返回
-        if city.isdigit():
-            return city
-        
-        # 尝试从映射表中查找
-        # 先尝试完全匹配
-        if city in self.CITY_ADCODE_MAP:
-            return self.CITY_ADCODE_MAP[city]
-        
-        # 尝试模糊匹配（城市名包含输入）
-        for city_name, adcode in self.CITY_ADCODE_MAP.items():
-            if city in city_name or city_name in city:
-                return adcode
-        
+        if city.strip().isdigit():
+            return city.strip()
+
+        candidates = self._lookup_city(city)
+        if candidates:
+            return candidates[0][1]
+
         # 如果都没找到，返回原始输入，让API尝试处理
         return city
 
@@ -136,15 +527,13 @@ class Tools:
             return json.dumps({
                 "error": f"查询失败：{error_info}",
                 "错误码": error_code,
-                "原始响应": data
-            }, ensure_ascii=False, indent=2)
+            }, ensure_ascii=False)
         
         lives = data.get("lives", [])
         if not lives:
             return json.dumps({
-                "error": "未获取到天气数据",
-                "原始响应": data
-            }, ensure_ascii=False, indent=2)
+                "error": "未获取到天气数据"
+            }, ensure_ascii=False)
         
         weather = lives[0]
         return json.dumps({
@@ -171,15 +560,13 @@ class Tools:
             return json.dumps({
                 "error": f"查询失败：{error_info}",
                 "错误码": error_code,
-                "原始响应": data
-            }, ensure_ascii=False, indent=2)
+            }, ensure_ascii=False)
         
         forecasts = data.get("forecasts", [])
         if not forecasts:
             return json.dumps({
-                "error": "未获取到天气预报数据",
-                "原始响应": data
-            }, ensure_ascii=False, indent=2)
+                "error": "未获取到天气预报数据"
+            }, ensure_ascii=False)
         
         forecast = forecasts[0]
         casts = forecast.get("casts", [])
@@ -209,12 +596,119 @@ class Tools:
         
         return json.dumps(result, ensure_ascii=False, indent=2)
 
+    @staticmethod
+    def _wind(direction: str, power: str) -> str:
+        """风向风力合并为 “南风≤3级”"""
+        if direction and all(c in "东南西北" for c in direction):
+            direction += "风"
+        return f"{direction}{power}级" if power else direction
+
+    @staticmethod
+    def _pair(day: str, night: str, unit: str = "") -> str:
+        """白天/夜间相同时只写一次"""
+        return f"{day}{unit}" if day == night else f"{day}/{night}{unit}"
+
+    def _compact_live_row(self, data: dict) -> list[str]:
+        """实时天气的一行：地区|天气|温度|风|湿度|更新时间"""
+        live = (data.get("lives") or [{}])[0]
+        return [
+            f"{live.get('province', '')} {live.get('city', '')}".strip(),
+            live.get("weather", ""),
+            f"{live.get('temperature', '')}°C",
+            self._wind(live.get("winddirection", ""), live.get("windpower", "")),
+            f"湿度{live.get('humidity', '')}%",
+            live.get("reporttime", "")[5:16],
+        ]
+
+    def _compact_forecast_rows(self, data: dict) -> list[list[str]]:
+        """天气预报每天一行：日期|星期|天气|温度|风"""
+        weekdays = dict(zip("1234567", "一二三四五六日"))
+        rows = []
+        for cast in ((data.get("forecasts") or [{}])[0]).get("casts", []):
+            rows.append([
+                cast.get("date", "")[5:],
+                weekdays.get(cast.get("week", ""), cast.get("week", "")),
+                self._pair(cast.get("dayweather", ""), cast.get("nightweather", "")),
+                self._pair(cast.get("daytemp", ""), cast.get("nighttemp", ""), "°C"),
+                self._pair(
+                    self._wind(cast.get("daywind", ""), cast.get("daypower", "")),
+                    self._wind(cast.get("nightwind", ""), cast.get("nightpower", "")),
+                ),
+            ])
+        return rows
+
+    def _compact_weather(self, data: dict, forecast: bool) -> str:
+        """紧凑文本格式：一行表头，实时天气一行数据，预报每天一行"""
+        if not forecast:
+            region, *row = self._compact_live_row(data)
+            return f"实时天气|{region}\n" + "|".join(row)
+
+        info = (data.get("forecasts") or [{}])[0]
+        region = f"{info.get('province', '')} {info.get('city', '')}".strip()
+        lines = [
+            f"天气预报|{region}|更新{info.get('reporttime', '')[5:16]}|天气/温度/风为白天/夜间",
+            "日期|星期|天气|温度|风",
+        ]
+        lines += ["|".join(row) for row in self._compact_forecast_rows(data)]
+        return "\n".join(lines)
+
+    def _render_weather(self, data: dict, forecast: bool, notes: list[str]) -> str:
+        """按 OUTPUT_FORMAT 输出单个城市的天气"""
+        if self.valves.OUTPUT_FORMAT == "compact":
+            return "\n".join([self._compact_weather(data, forecast)] + [f"说明：{n}" for n in notes])
+
+        if forecast:
+            result = self._format_forecast_weather(data)
+        else:
+            result = self._format_live_weather(data)
+        for note in notes:
+            result = self._add_note(result, note)
+        return result
+
+    def _add_note(self, result: str, note: str) -> str:
+        """在格式化结果中追加说明"""
+        data = json.loads(result)
+        data["说明"] = f"{data['说明']}；{note}" if data.get("说明") else note
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+    async def _query_weather(self, city: str, forecast: bool) -> tuple[dict, list[str]]:
+        """解析城市并获取天气，返回 (高德原始响应, 说明列表)；失败时抛出 AMapError"""
+        # 获取城市adcode
+        await load_adcode_index(self.valves.ADCODE_INDEX_URL)
+        adcode = self._get_adcode(city)
+        if not adcode.isdigit() and _adcode_index is not None:
+            # 完整索引中也找不到，无需浪费一次 API 调用
+            raise AMapError({
+                "error": f"未找到城市：{city}",
+                "提示": "请使用标准地名（如：杭州、朝阳区、延边）或直接输入adcode"
+            })
+        candidates = [] if city.strip().isdigit() else self._lookup_city(city)
+
+        try:
+            data, fallback = await self._get_weather_data(adcode, forecast)
+        except httpx.TimeoutException:
+            raise AMapError({"error": "请求高德API超时，请稍后重试"})
+        except httpx.HTTPError as e:
+            raise AMapError({"error": f"网络请求错误：{str(e)}"})
+
+        notes = []
+        if len(candidates) > 1:
+            others = "、".join(f"{name}({code})" for name, code in candidates[1:6])
+            notes.append(
+                f"“{city}”匹配到多个地区，已选择{candidates[0][0]}；"
+                f"其他候选：{others}。如需其他地区，请传入更具体的名称或adcode"
+            )
+        if fallback:
+            notes.append("高德API暂时不可用，以上为缓存数据，请以更新时间为准")
+        return data, notes
+
     async def get_weather(
         self,
         city: str,
         forecast: bool = False,
         __event_emitter__: Optional[object] = None,
         __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
     ) -> str:
         """
         获取指定城市的天气信息
@@ -224,7 +718,7 @@ class Tools:
             forecast: 是否获取天气预报，默认False只获取实时天气
         
         Returns:
-            天气信息的JSON字符串
+            天气信息（紧凑文本或JSON字符串，由 OUTPUT_FORMAT 决定）
         """
         # 检查API Key
         if not self.valves.AMAP_API_KEY:
@@ -232,48 +726,752 @@ class Tools:
                 "error": "请先配置高德开放平台API Key",
                 "说明": "请在工具设置中填入您的高德Web服务API Key，可在 https://console.amap.com 申请"
             }, ensure_ascii=False)
-        
-        # 获取城市adcode
-        adcode = self._get_adcode(city)
-        
-        # 构建请求URL
-        base_url = "https://restapi.amap.com/v3/weather/weatherInfo"
+
+        try:
+            with span("weather.get_weather", __metadata__ or {}, city=city, forecast=forecast):
+                data, notes = await self._query_weather(city, forecast)
+        except AMapError as e:
+            return json.dumps(e.payload, ensure_ascii=False)
+        except Exception as e:
+            return json.dumps({
+                "error": f"发生错误：{str(e)}"
+            }, ensure_ascii=False)
+
+        return self._render_weather(data, forecast, notes)
+
+    async def get_weather_batch(
+        self,
+        cities: list[str],
+        forecast: bool = False,
+        __event_emitter__: Optional[object] = None,
+        __user__: Optional[dict] = None,
+        __metadata__: Optional[dict] = None,
+    ) -> str:
+        """
+        批量获取多个城市的天气信息
+
+        各城市并发查询（共享缓存与 QPS 限流），合并为一个结果返回，
+        避免模型逐个城市调用 get_weather。
+
+        Args:
+            cities: 城市名称或adcode编码列表
+            forecast: 是否获取天气预报，默认False只获取实时天气
+
+        Returns:
+            各城市天气的合并结果（紧凑文本或JSON字符串，由 OUTPUT_FORMAT 决定）
+        """
+        if not self.valves.AMAP_API_KEY:
+            return await self.get_weather("", forecast)
+
+        # 去重并保持顺序
+        names = list(dict.fromkeys(c.strip() for c in cities or [] if c and c.strip()))
+        if not names:
+            return json.dumps({"error": "请至少提供一个城市"}, ensure_ascii=False)
+
+        notes = []
+        if len(names) > self.valves.MAX_BATCH_CITIES:
+            skipped = names[self.valves.MAX_BATCH_CITIES :]
+            names = names[: self.valves.MAX_BATCH_CITIES]
+            notes.append(f"单次最多查询{self.valves.MAX_BATCH_CITIES}个城市，未查询：{'、'.join(skipped)}")
+
+        async def query(city: str) -> tuple[Optional[dict], list[str], Optional[str]]:
+            try:
+                data, city_notes = await self._query_weather(city, forecast)
+                return data, city_notes, None
+            except AMapError as e:
+                return None, [], e.payload.get("error", "")
+            except Exception as e:
+                return None, [], f"发生错误：{str(e)}"
+
+        with span("weather.get_weather_batch", __metadata__ or {}, cities=len(names)):
+            results = await asyncio.gather(*(query(city) for city in names))
+
+        if self.valves.OUTPUT_FORMAT == "compact":
+            if forecast:
+                lines = ["批量天气预报|天气/温度/风为白天/夜间", "查询|日期|星期|天气|温度|风"]
+            else:
+                lines = ["批量实时天气", "查询|地区|天气|温度|风|湿度|更新"]
+            for city, (data, city_notes, error) in zip(names, results):
+                if data is None:
+                    lines.append(f"{city}|错误：{error}")
+                    continue
+                if forecast:
+                    lines += [f"{city}|" + "|".join(row) for row in self._compact_forecast_rows(data)]
+                else:
+                    lines.append(f"{city}|" + "|".join(self._compact_live_row(data)))
+                notes += [f"{city}：{n}" for n in city_notes]
+            return "\n".join(lines + [f"说明：{n}" for n in notes])
+
+        result: dict = {"类型": "批量天气预报" if forecast else "批量实时天气", "结果": []}
+        for city, (data, city_notes, error) in zip(names, results):
+            if data is None:
+                result["结果"].append({"查询": city, "error": error})
+                continue
+            entry = {"查询": city, **json.loads(self._render_weather(data, forecast, city_notes))}
+            result["结果"].append(entry)
+        if notes:
+            result["说明"] = "；".join(notes)
+        return json.dumps(result, ensure_ascii=False)
+
+    async def _fetch_weather(self, adcode: str, forecast: bool) -> dict:
+        """请求高德天气API，返回原始响应；失败时抛出 AMapError"""
         params = {
             "key": self.valves.AMAP_API_KEY,
             "city": adcode,
             "extensions": "all" if forecast else "base",
             "output": "JSON"
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(base_url, params=params) as response:
-                    if response.status != 200:
-                        return json.dumps({
-                            "error": f"请求失败，HTTP状态码：{response.status}"
-                        }, ensure_ascii=False)
-                    
-                    data = await response.json()
-                    
-                    # 检查API返回状态
-                    if data.get("status") != "1":
-                        return json.dumps({
-                            "error": f"API返回错误：{data.get('info', '未知错误')}",
-                            "infocode": data.get("infocode", ""),
-                            "提示": "请检查城市名称是否正确，或者API Key是否有效"
-                        }, ensure_ascii=False)
-                    
-                    # 格式化并返回结果
-                    if forecast:
-                        return self._format_forecast_weather(data)
-                    else:
-                        return self._format_live_weather(data)
-                        
-        except aiohttp.ClientError as e:
-            return json.dumps({
-                "error": f"网络请求错误：{str(e)}"
-            }, ensure_ascii=False)
-        except Exception as e:
-            return json.dumps({
-                "error": f"发生错误：{str(e)}"
-            }, ensure_ascii=False)
+
+        timeout = httpx.Timeout(
+            self.valves.READ_TIMEOUT, connect=self.valves.CONNECT_TIMEOUT
+        )
+        await _rate_limiter.acquire(self.valves.QPS_LIMIT)
+        timer = metrics.timer("weather.amap") if metrics else nullcontext()
+        async with amap_slots(self.valves.POOL_SIZE):
+            with timer, span("weather.amap", adcode=adcode):
+                response = await amap_client(self.valves.POOL_SIZE).get(
+                    AMAP_WEATHER_URL, params=params, timeout=timeout
+                )
+        if response.status_code != 200:
+            raise AMapError({
+                "error": f"请求失败，HTTP状态码：{response.status_code}"
+            })
+
+        data = response.json()
+
+        # 检查API返回状态
+        if data.get("status") != "1":
+            raise AMapError({
+                "error": f"API返回错误：{data.get('info', '未知错误')}",
+                "infocode": data.get("infocode", ""),
+                "提示": "请检查城市名称是否正确，或者API Key是否有效"
+            })
+        # status 为 "1" 时也可能没有数据，此时不渲染、不缓存
+        if forecast:
+            empty = not (data.get("forecasts") or [{}])[0].get("casts")
+        else:
+            empty = not data.get("lives")
+        if empty:
+            raise AMapError({
+                "error": "未获取到天气预报数据" if forecast else "未获取到天气数据",
+                "infocode": data.get("infocode", ""),
+            })
+        return data
+
+    async def _get_weather_data(self, adcode: str, forecast: bool) -> tuple[dict, bool]:
+        """经缓存获取天气数据，返回 (原始响应, 是否为退回的缓存数据)"""
+        if not self.valves.CACHE_ENABLED:
+            return await self._fetch_weather(adcode, forecast), False
+
+        refresh = 60 * (
+            self.valves.FORECAST_REFRESH_MINUTES if forecast else self.valves.LIVE_REFRESH_MINUTES
+        )
+        min_ttl = self.valves.CACHE_MIN_TTL
+
+        def expires_at(data: dict) -> float:
+            now = time.time()
+            reported = report_timestamp(data)
+            expiry = now + refresh if reported is None else min(reported + refresh, now + refresh)
+            return max(expiry, now + min_ttl)
+
+        return await _weather_cache.fetch(
+            (adcode, "all" if forecast else "base"),
+            lambda: self._fetch_weather(adcode, forecast),
+            expires_at=expires_at,
+            stale=self.valves.CACHE_STALE_SECONDS,
+            fallback_on=(AMapError, httpx.HTTPError),
+        )
+
+
+# 全国行政区 adcode 索引（adcode_index.tsv 经 LZMA 压缩后的 base64），由 build_adcode_index.py 生成
+ADCODE_INDEX_DATA = """
+/Td6WFoAAATm1rRGAgAhARwAAAAQz1jM4aWVgrhdAHIuEa5VUns4pVZZS3lZQKnXyrjDFymxPAnB
+MEFlCOaondTkhuadiDai+DFqudA/7MPAwRGCt8oCQmOxJlWr4fLHSzSSv85M8OglvwDQ0FnXiyF9
+lRyAluZ79YqFZzlmhC/ehrNBnZd2/6Ltu0uXI7oQuq+KNFa0/Tv2fNjoUt7XSXG7cz7Nvl1EQ15m
+htA3MkzBtHBjH63kEyXbXsr4FdqbxvT2N3ZbRtkgFifjJQNTIUML2zzfVgTSelqprmpwebakvmLY
+F4kg0PrVPiHDxDk/sPejV0LXSNCb0v5b64BfS7YlHfds+jE4n10KARLX9LRbgWht2MX00bf1oH7t
+UUSUDXeu/gB4zz1pnoF+33wltu+BxZJFtNfkmSqyh81WzmNCH4nH+8zK/HcJvHPBFn/s9LomyFhF
+h7zw7qyjdliFzBxIuQxu5sFhZsPvwcfKVb0PtPHNb8WFEv3dBMSIHc4ciF0jwCWm17/qpPvK8K0N
+DQRRX9MUqpDraEUdaRTLhGSAtXlkGkarwGUGOteV61MxBqNzXHsKY/2w2yIBASEU2wkAmLOLk650
+hlyNN47WeByWrss8SyB0PQzZMPMCTigBvqB1QkF5j6+dJENS3L2wupuWOfRazrIhdmVvsoaGvPoP
+7eopbIz4uLOKLUdGQRQlnt0a32M3nZsWTuConcvlHxg7VIqlId3XJzh/9UaYUK3rTLC0c9g/SAEu
+DGV6XnZUVfFbeqOf1tQTk2ruaZIcKLA5lT4FNHAdkT44m26qJoM5AhC/6kQiFE/vSqTkvdhEwmoM
+BJqgQKJl42MGJD+KTWHZHYmyBsZxMnoeSUz0Mht2jGYN7EP24rKamM7oAPqTeT60BaQRAaPGMb7Q
+FjvcTCc2zvYhVhvv8EqWVqmAXBKgBariJWiGFzDL/XpueNp3NdrPk176dHSQxP9EESbr6E9kYmJT
+BFMM4zwAPTzd9ErDlSVA9O4YIyXlIoWH03c1iymfBjDd0nLynzgn0pTOauK625t8xW2BdBgiASHT
+QwboRsIe0pU0BvHfle0jnI1zvIHUWp9r84UPONtn2Tr32wyJ5LRnN2AzijldPmYLfWaNrV8ne8dI
+Rn6dquO4/ZSHVyOIXBu66kObYxLnK2zB6ML3Kw/3fwAlmlAEGqpBE9EoER+vFAh0dA7USHzg9FWC
+0K5AHPn9wD+3LzRKHoOgZ8sebPWVI4oAVIC/iZ5XcsiVqGdrMeDAJZqh6ZvOzfTsFbrQ61b48yBq
+rulfzDAU6pbvxoTMLVBNifKOQ8nKNkUBHkovRN/2X3Vzgp6occF1riVdtb9K6SrhcvD/4/9YnjE9
+6rlavtyB9wfzEUsWsQzzOz+kfDX/zFlNhCWxx/fidmiBmLGf1P0m8d20IDsTx6OXEG8dNPhAQfYK
+RhzYpExwjQmvClxoh0wdKEcWJViX5b25qhxbjE8tWCqdU1+dJzXf5W7I8Bl0wEvmSpDcpHBuo6Qi
+0eqn2WF21k8sR5IIwUBx7w6WonCq/7vf1wtRj68Il5os6Naxzyly74ouDuHYUp13BSx8m0Mtd7tW
+1H56vCig60g5fa6CLIEliJmfTiciHoFcyD4hiVikBDT2BYEUMiJqSxb7kvd3XBMUKPaG7klvstJe
+pNiZOtPv5C0YFSy+f2ChMv9u9zFefj0QOu2u9dBRH7mGdkKfVIpl/62D0Dhe84Zxe9btls8WFesu
+fyFeXsdxh/vqrDCD0ASckJuxVJ9bzf1DioTGCNUXfrki00k9TGN8Xwccu0LYN71OBPDgNKpbecBN
+It2JYNz4aahkNLPx5qppX+Of7pPWSxrRw6MRCkMqqeMsMTK4iDu7gMmuLN6FawZwFqwUu1NnFehW
+hHBs+wdH95lTBwWEAmphfqahC9iviYQWxojdTpSsybhmN6vyhJmE3rxgPOylhsMFRwlWo2UJ+r8f
+zn5xED6Swt5IrV5D9Ry/LJIZUfPD9hXuz6VPPI8TcUntjcf3WFjeS78rJd73xR9obarEYj7JF8VQ
+wikU03he9e/SE1LNpH5Pf5V7FQQGPaJ/G4M+Gle76mjlplaNgeTM78SIiWrdjf4nX7dVoHndXjrd
+vesPbwmupjU/nPy3CJVBoLbbWbH0rpvZSfFycGIxM7WoypA1MdCVwaBruBlLR38R80wxAPWfYYFV
+b5zHTc8OpgZgUE3Dg/4X0B7hrMtP3JuzDuxykNnH9CVkObQ9L/qjx2RFWZa2Hf/EKVJHeHxRLnNb
+IVo3PUx1Jw5h7zj31sm4HKVzZj3YVBlnS1hDeqONJ33URoUzZ3Q1DPjD5OeN6EBpWXW93CYcvVp6
+2SAJ+4SrQL7qP9bvxxvTUBn4VhtoXnIC8YQcydzaIXMpt5XOeIF6Cl3UqpZQLumhdnSpauov0LM2
+WRHYUHGj/j5mIoi2Yr1fddTx9qN0y8LfuReRPo+PTlKEr45+BJbFKE6PSUoLkXrrXkH4VnOrTc1u
+wEBsi+UlrRLSHnn+4PQR2J1x+OaA18BjnpI0Y0XMRpm+XDw8+z+E9zckDyY2NbvRRlSHau2JKPQL
++yy8zS9R1O2sCJ2WXIBOT35aTBfjrT4MsIdodgq9U1LUI5DNBH07G2n0JPwvMDrb/O4pVGgVjuAR
+ypoBJgHUG3WtXI8dAotUsZJI8t8WVprJ/F7CQ8jntT24xRGLa9YbegtM/8Rp9uioEnS9PY1gpsmO
+haMND2ATTsg2xPqAXXon5/x7p1rPU/Im2jp0YgQASDOlDixy6C8mKG2tL5BP0UeZpZBTI8SqFZPk
+qxr6WIozQiUingQPl+qAaNxDECxv0IviEgS9uydXApoT3thqAGPZas5HNhB3P+ph9WPH/jO46wB3
+j5oc9H9MvlBIpZZWEKpR6A4ayZm3Mdqqbis7KZ+6zRwLgjXMSBrJQlOu1nG70iHXwFe4yUEj4Zdc
+kYnISgSXVtZPeCloPjw2UKr1n2c/r42bWk3AWUROasoj0fxyIeaL/cvsjaOfYIVJikzq8lhpFSjo
+cJ1Jyyz7nFbRsBvHczWFp7L+fk0ZaGik22jqAnP3svizFVdbqsd4RQxtmb3l6duEryUK8CpXudjg
+IEn0sKUuN9L0qAAqQlZFyRXmGAKmteZB/QFow1ATMkh5TaZjn+72UVSV7yTe+jAMLxBOv1jRsqw5
+32KaLma00vsD2xnp0DrcP8mZzsqmUOBcFe5gNIHTt0C2POr49ftDI51aeSsDazIdmCa+Qxp6fTfM
+KboeqFBb5cgaoo5Cpi7jmqZbcFjoVLPvE4/4N5Xb7goD07gFltu+D7C+UuCZNh6BOlnRk9Mcq1bP
+H2CM+Kp3qZAlHIGDQwDualqqCdbpFBedcOWMub6mB12LW45nlBUMUt/nEBR0/qX0yzQxWNnq1UWm
+CyblX5uhuRMLtx2sYgWSLBaQmsnD9gE+RiXPwbBi+2wc9ZgDy+ZzLHDY3q2yjPboMwqLW09wnuBH
+1W6rIRRvu3XR2N0B/nLO+M9mmshROaPyybs+umDVkXXGpz5sYlUbBqlZJPHQRXUgRWJY58vTgxp8
+wBK3UlM+s5/xzS/DVVf5ce7JnM+yKRtzDtw3mYiJPvkqp3hh50g+iabcwXG/gDstnIXkV/6ZU4qo
+f73NtB0ArxG64QUnGm06Z87i4tzBfXQY0MBLSrAagIQl1TkqOqLpTzBVx4ABe/VwvbolY62z2TZc
+/u3G5kuU+nLjGFdPCFQzlaQ6Fwh5C3/RPjiEt0c1DYeEwe3xBZObODQAA6H2HnGALsinkTlYY3tN
+lVf5xhEJvMcp9wQwyMVE7bSo+Q94ThYqGz2ChRUIMOZthFIWxWsc+LX1VUvFVwlFrlH/LQ2A8RXl
+yvOI6yvqn0zUtXBi16SFs/V4RzG+r/ykRwoS1CzuPKPIx5FR6OaU3QECdckOXdrKZbjc3K2uWwaj
+ZbwERxsMq4bEVxdzqoKBC0N61s2n3m7lNwVHqorWe3RirHfiAAb03U7HNfkzX4aP7oxWWQSHGgWh
+7dj+vB2oRCI+fCTIFqUImGYpAr+kW/26hJbpByWjes9YP1lEmau1oICndJult8EMha2KOKgC9P9f
+N05v57/BmsXZT5aiqO5ePZEuHqd0+ql11QYAOmNIrmdBqwoPZGlQLbjfmiZsamRw9tJ/4ZLODL1n
+KomTb63USsllvBTTy9SVVGsMtgKhLcDV/8Z66Jf4jZCcd2hOkXbxnI7oGX96L3FfSu/r6/GdjSw9
+y9FFDO2BiqNucC3zSilUHIbtoOekRUsQv0buFtRU3xy2fS1a6LlNYETm1qX7Fd5itz/+dn7KVOfe
+bkJd8wsDOg1N7M52qUijuO0byuLzoZxVO7M933w1Z830HrrclqLocY2bEYD7giUPqSiOqvTV6X1E
+5rGi6PljoSqIp/ZZOcFzts+oFVTcQgKBw8ZW30bfpQkcDc1CCDUnQ1KvtA/hnzKEjhgOERvAswqt
+tr80fynTB6hTZ590RWtlfBuyrAr23vvNHoec8hO2eYBF7EAuE/QtgNa43xbt3+HDu6OPESxeQMCJ
+BmILIK16DJIKoV2r13lIjDX3O7gd+AJUVIBXc87QdOPsiqhUAjL49mQmac2IYlwk/QAOAXwzBjxR
+bcNsTgl67fvv3rbLfJSMXMUvYVq0EpNFQGMbIDVtlWsLAk/m+PWyB5sSpklm1gute9qCC7hkqFEf
+Daeg+1dL2uXDHLjr2ja8eh0XOGcUTwYNB6e/65YoXIEb2gflcgj5ujNoYPKPK4jT7ybu4ViKbb+r
+KYu5QC75pddlUQCHCRh8IjA2YGssx/6GWucxp4aI2a8jyVhh7i9lTm0hk600frtOX8PMgCDFqp92
+uujyrM+BbhVc+YX9DbNPKPZQxWDddnn+NCY9lMr1grwp9bwsT5s2SrktNmX3G+vgQ+Qh0bXc9IL7
+KWi6q5Cj/LrL7c4XnEMAtk4gkD9BOm9U0PJBq2Egw7UXwY3llBapNL6Fv091iWpt0Cc2rIhUe71s
+TquK6Cdf+1WM45YJwYXIrXnxuUO+0yR7z3bdI1uD76wsKI0CmIfCb/pExOOVPgbFdkzI4YBckbiT
+84r1Sl1X12kZ0Di8OpUTplLFCjKKCkVEbQX5MdV2n+HtF8aBo1ur7R4xf+JJtzcPj9f0BhDX6MgV
+NKZ/CnFaVL8S5WmFOGMPsQ8Urd5fLnzxRs3m73YKbKx6C2f6CdUoNiyc12RkFGwcmwqFtR7XvTFU
+BPgrOTLNMnqvb4P5BWo/TM/RbM7evLOKdEK4b+H0MMaOAAwtrKSw4vEs7W1aiawhnlciPtFUFXmR
+RTqt3yOu2DeWU2mqZNaigcc5SodubMt4jOvbY4YiniVatZYXnM4gZAuxZ0aIt5THSDp//B0oszf+
+sqzBEROEpEkDnWnp+NGHNTPgzJkAKnHz16X2YneKAQfEGOTQvUR9LsweuSkjRadtIbE0jEeooo5B
+qB5MnWoSzTJJ3e5ZtvUo8D4xMZiBiUJ7LwlYwYXmiH0KJskqFIcCWjkJqvpMzvCNc2qZOUsRxu8B
+0i25Oum0S1/fQgFY0777f7fhPhF877HSyEP9OYgkoaeVbjZhQ1vXtRv2z+PmAK+Lro/eP24MYsTg
+G9wxt9mPjEmS0RDN9biLeyerSYN4YATurE8wHVUNqWPfr4yCldWvnMz1kdscfrJB0Rb9PtlbfZGW
+CqMmbSqJm2j+gSMtr2iazWEpncdKye4A5n6zX8XLfzLC6nKdIplmAm2r3veBTk2TrEoUT6da0CBO
+RNXO44Pt+mZEFPjFfPAjOmZPUzHX5Lmipd2PfDMOKtpefbYq7Sv0V/Orw89o7ttT7GuPf0N8821c
+TtaCBht6ZIUCx8MNHPquvoWG4BKxLFCUf3iWhz98LNT3He15rPemNLrJ+z5jlYcgoy7LZMvuY472
+KNs8jp75I3XR2buOPKo1AvwYReOKpwG+yTXXmTTELcj40VavYnTFLteQiRPJnR7FR5RU/R3oTs/C
+KBOgRA5a1nkDTzBff7ez8UDsd6WSZS+TSE1trYBvX9pm/vEfNsw0GpI19tfvGQk7gkUxY2BhrNTF
+6UqAYMSFG9Ne5a0DouoSCM5Pz27cfc8pDt7ELSnPlQdelwA315RK3Vvh1d1DonNqz/mfSuH5fr8r
+h9NY9oNopRQzm7kMltO7o52ylTWz+gd5jwdAcfgs2u3oEum89hdAW5UlxnDe6LX1EDjNQfx1q9sg
+1sQ1wDSj1VLriuEaN0usRLbZ83JGh7VpatTa4iICtuv/VYniobCOV0npuHOcdqEdsUOcehYUmuMA
+qiiyOcbWnGu5d1RovWAxk66F8jsVHy39iu/cpzKQgO+Pkp5SdhDfGhrvG4QJVM/BRMn0cS5VfgYq
+GL/1KZPhIbYkbytt1NX27D4FAGsRaZmfw027csdnKcN+CIsPdW7l8qcmOpYBihOaf0uMJ47BptBJ
+HJgdnW8yEvxAZ26VRqq+BaGx7HZiMwm/kJS/qlIPRZ1V7xjW3eQ0oqXIi9oS5zFaTQMeDtpHtY0g
+3qEmHkz/zbBoRJ4oUpQYwz47lJyjeYE6a8vOK9pDT/Xb6d15RB8tTZHYQjrPKChqLLChhtpc76Tb
+zqyblhefgu1cqAOUBBcqERlxJY5hotdfb0z372D3q+FannXDT3rDvrb7Ws73GJw93e7Uwbz06wzm
+0s8YvpV2dENNMkvhw+jZg9dUZpS4JngaSh/u0T4Jqj9k6dqWWExfrnPb0YYqZucuGpP1FGn4ep8l
+xKGEXCg6VuJVtOHgV2PwD5yLuj+Y5rJ87Ju9LR+J9nTcKJjr4/NLKc0KCbi/hTj2Zml03xPDwpJY
+wHlJyPMxRPhrWAyASgHKUp7NH6cBfDqaii49Mq8ocGa9LR1Na/MvCRr98thu5bQghw+cS9oP51Dl
+zsWszUb4xIl35bkIwma4kOXnduzzLdQlaRGuYE65ZNBfXo5p7EGqs0cM9Rfy5NvNfNiZVnhLu5il
+MCrzvVHDcF6AvJ/T4h009TbSokUR4RJz0SnHvIO1e9Djb+F2QYPJi54dpiXdE1NuVRDVmxIBBQso
+5zUD0f4lt/zmyeDvtRMov+vKHJvx+O2Is80IrbSWVXx713sXZ45/wyMJC7P7h6W0SyoK9nVepmRF
+fLXh9Hx4Gs3I6OVAb4wevgrkzxIO5bS+k/PVB7gpsxIgDnoxc3CpmQRVlh4+qxLDk7LwZrj0aqNq
+W/cyiLdIbcrmK5WJF1wlaD3HXrU8Ndymas11nbgedQ3PxbY33GauqVqU6gWchRrD6Sit4uKr0XMh
+2Tyap8KAXODbGMjNPqkuH3W8COKAzLz1q+ORlazqJTGCXcN3y69g5pOzNyEXWjb8ob8tfCbZe9A6
+xwYZr6OpE9e9LPIU2cTvpl9bc7x2N9l7rVWcpoFT2rOuB1jfUgrpo+yAG9T1xTo/fGNJMpAfmxwv
+DspRNZ/7YvPqPfKLTzJPlsQmgXbOmUKHTb3uC8eGwTqphBoQd6K/BTM6rr1rkp/SFDlB5I4tKXlQ
+KAcIC3Axw2jJByU1lQ05HkKR8R4BFa2OXyAoa51nCOCy4K7cdNC2oVlLt1BqYKmmtIF5aLikE8ol
+40AUxZ9mEqEiK/iRa6HxmMGGNDDPU9zZNMVoXUqLn2iScNZOXeZdDXfUOP6x7sZ2dgCO9vuyJYFh
+uwOU9otcttGwaS/8ZhZFSZh4dw+jr3X5JA43DJ/s6hyWJ9iOThfN3idMAwUzXGp8qhN7ZCrtJy30
+9PkS2W/nBZkqAZpNefkw4zsH7yOO4Ix16nX6FnGKO93/f7z1RzO2BwwyuWH+IdS1nVf5WGoC46ZX
+HiapB2am2ZR+bzLjvnT+QidCi+pJZaks6mbJQj7Wt6/rnbPAvhm4XB27Snq5qW2zDINdcZvgOizb
+Y9QYFYgKEeBZJU2dZnlI/QEoV+cXwAsVZyBGJGWovgdwtlE+yZMFR5yGD6lw8nkc6TotXmwRX9Ia
+2bqTABx1O3NBAFupKwqxkuFjueaHcN7HK/eUoMQVa15v0UCZQtPzCwMXOxEB1eL6vtRfCoUUTiQh
+WSvwsYPgwx4fQzeWbJD0sCoiNtm/Feu9g+rlegytfelbuVsupRCWNezbGceAYRkskCj+u4skApwt
+KSUmyw0HY4Iy1B5+zwbdeuvur+dYNlurOfIUn0jmJtZMpNzpHRb9h98jcNMvOzySx8pkoZRTO2oJ
+Kz7nFfy8f4TjpI6cN3n+vphj2VPzsrdqEGLzXLJToADf384mIrIza5n9uv/hM1KvtQXPs9gQVHmu
+whE95FboPuE0jZASFFVcoxKMY+Zw5MhgrY7ZXd9THEyyv2jEEyMxBhBRmQRNdH8y0TdxdJZereUd
+juOHf/Imj+b9foA/kOail10vmf5BwflQLhCtBaEEyFq4L1CkQtsjbAPN+F5GaLroYaR07sKFmUVd
+e8aeeEPHbQ/yclad8DY0U9HDAH4DyLp9gVSt5lEwEVAvInXtRa32AZIfgNw7jveA4dwleCoLNjaO
+bLPTf0+6PMPN8G9A+xEB2b1+AjvS2jylDr15pMHg8IxSXPwhnoCDz07wiFXa7yG6wNNjnM6H4ifG
+jZUpT/llq8iDKqs8ipuVDMpPIztBt2jh+XpqdIX+OpVp3U4Li8v9WuczoB2aNJjiXPwX84UZGQ9L
+Q9giCxH0zfJu0ZhRyUXj8BajAzoWbLIWwC795xouYZcOUptK6+DvJvMdiNY0T11CsyL6gFzJ9NRj
+5brHS0g6yWc+uiFzJh8nAu69LZzYiFG3+7pucl4g/NU65bZl/qvSOEK1wCa+M6YOn0sukQEI9xiO
+rBG3Vm64RqMqUw4gsgBgjjcQ+KJFxWj/A46FdiKZva2DfKswO8c5sjg0X66UTqVhk09/3XIBFPKS
+A277QnSn+QsBiZAKjCbgV8etApzvzuJHu4nXoPxDTQe6YZfma85K+cKngsG8CD9vs53ONVyAWkMn
+gZopqK6bDBvNRqOeXxVuk/xpCvgFKQoEPgv0hGoh4hcJe+XtUo66COqIwgTeIZmscGKO5v3ZPHsf
+qsf0G6vfdxxty5a/3AlphZ1Wnrh4/3ElSA2dvgXknorEi7+7fNm8Xtutcz8RmvmFtxxjXv4XBKxm
+CFL/wTVmC0U1v4uJVv8NxiViCAAaIovsOss33F1wMx/njoP1+LupUOBr9W08ebnD5XY68AHyOIdP
+9/n+O7n6bOlKerqbCFCzpaDluhbU1l9DZZyXHErjrcecv2rxrTBlm8hckE09/j+w90uxoQZQXPsI
+BvdSkNZ48Dcc09Qo+alirOvGqKZ8jc14KEym2fX5ghR1LPTkvsCLMIXPgyH2n4f6rGhaL2K/rPfR
+sF+iBMKWFtPj9IYVtHP8CdHqXMwtx6KR3beLjNGzgjJ9/5slD01LCIvcwbyoMM2Y+F2wyR18YJvJ
+D/k9qG8E9X/zr35WYAX39TZtuRg1uz++vwq8sezyVHA5efdrg+IB5Kljmy2sxHay1HwTtPi4+Y/c
+CSHbRQhhkqgJVHWwp8Pf/7UI1vlPTj+A6LL2nt654xDTFezpF+Hyq8yx3UsNMXqiQxjd+goQ5ZK9
+nzmgsnRNYFKGSwqxaB4LeNXg7alyR8njk8vawLcMWfkKubdqYZcx1tMrvZPBSP5485BDStby8Be4
+U3qykAuOpeEcciHkRHOY0NCySNNsSMdA2BqcXmFuiY/BTZnX59yb1WnaQUySfhGftx/dtJ8+y0UB
+g6rrB3b0CSTLrbHCRd4NBdBcLzlb2P4Jopgj7EuuM8W1FusR3by0LHsFj/VDUCneWslWd+bMNWwB
+w8J43v/Gwppnq2vladU1FQqgO7huLOTso56guEhVdglJ1JkhQRLQSyrxoCafrAk5lVmTXuKoW4qX
+DigUbvV73twQRNax3F/uUbYrxVRT6iy3QJ7FpJcyMPVe7blMDQS/arz30RNnS9X4OsUpYxoJpRXV
+xpPqGAX2jwjTa/8hGSNMZXF6SXT41tzIN/1bkOdZbgbDQ/2n84SMsLJUu5N+2i/2/5nwwa5J2JOH
+30F0FBrMvfAbgCjOSySiL8QeS1nzLYXLpXMejaeuul3zVBObJ4GarqwZLQjeo3IzldLht+LVSbXo
+/HUWrNfpqPGDhD2Vif/zWLxvUHWlRVDNW1z+rPiWGDZz9UB3udlFTcKIAOlzYbMFZR5hQOo8yg+1
+IkKqQNr+++WrHzcb3bHBb4bV+IvVKiuC4Ye/M4d6ST3RCSdwdJeftkb+HYKb/1KEUVDhqfLatoin
+oiahmJMRiDvgLTRUq6nZiCmKxKeYEao1Z7Om3yB+AyjJXbDBeBPz1glt8G0pvEp9W+F/j2THgYwv
+6j70jy8J0zRnlleC/0c5jtraOI6FdyH3CdX11e8mRWLNUhYjcMod5fu6R3fv21LniN/qmBH8ETF7
+AL2x54GZkMBGb1Es9uIf+VRl8dTpWgDqqh5gw2EFcyMllxz181k/Upfqh2KOeizxaDYgI/veC3sO
+6ZmvnaTfxRuCcLIvnjdk3uTgNWHIxXwYL8RgEZbDBwy1zSOGNSVdNzFWX+QsRUE2EQRqePVWmHQn
+p6QnF62koiGwKIpPkth8WcPx+EhtNoweOC+No9fhs6OwTxdfxjmMKdNQMM4vgqMu30E1BPf9fmde
+kKdjQi371dcNAetsB5qcSf+9RFyLq3/hlIFk7BFXxSSdlN1EHN//G4OQvTY2B1lPdDz8LQZg0/+i
+8tuqFWkJMYjT7bkQOo4GaipEF+rn1ENLVeHKCRYcJeDdnjlpDWzmpIjsz1fU7RoAE1MDj4TlN47N
+vQXD68bEfM5VlRsSUD+tsmPbXf6HZqOgT5fqFHXel2Pxf5qLY+gior7HlWfnxl2lliB3l9HzVSHm
+loVvhfG0CvQhAaED7dCfu5yg1UywHqTGFzI+83ETPh/fu6AStYyMKVzbhm4HJiNPuDsPJkzARZz5
+evmTtGVO6MfalwH9LgpWmTDMIsYasuYURAsEQDUhJMYJvXCMeQoHMB/vqCzXkgNcZ2xTp+fxMx/U
+5ukHD0qvcrz57vzlgcf6W8A+LYGCeGL18ScMM0CuryWCVjiGks4flafX/58nSuDaq+RiZ5zNwZkD
+rA7HnXaipTMseFepeLMXOK9XoZCkH2Zr8Q9g+66dCIfLzm4vpWadz18+ZUQhJ9WfzcNM+AYsTsqT
+h26IzCBtjjttlmqMsPS6oQ6wkRfRnw24mEto7gB7zlHKLcHizNyywXkuT6Jp5BDrm3/5zhzyPMSk
+nvzwUcCwe2YBQjybHVtac7ALdPVqKsvICxXcPoydonIfic1uy+Rlx+Ugi777rCF629PRBhTpSsBv
+VztBRSWt+9Yi2I3N8Tn2nHat7wRISfaCx6jCJVoSUQWUaOns+dWqSQmM6KSGQWBM6LKMgj3vUFkw
+goun2s1MaVOlJOaYBhwnqZ7paWWyaaG8kUNHC6uWyA3ejnR/h94ESMxdAvQdJk/9h1iQBSH09Lmj
+CJLpdsnY+yzA5HHDqJ+YUpS24CxIx4hPhUtcVHSSWABWZK1JpGPliIMLt9Ao3Mit8UikS3lf+gAN
+ieWDOg3mi4q0MchtQFwPwX/ke7aTPal0QoKY8KeH90eDlK/cb3+nJ+S59jVHDtDsjSV12ZtBWhpY
+gzIehY4PcAuCS6AH6JfFcQ4YFQKUeqP0wJVhUskqYPhPgcYT1zSCDmB0c+xHANO7zul+E0nSLtPK
+We1A6JgriGwe0F+gTC5gVCGUWsLPZCIOo6IRKTs5ORjzRw1hPvDWJB61Oxs8QVlFYqDeX7pqdNN3
+uBpzXhNT5xnHsvjEB3/jzYHupejU/uG/7lyCVa0GnzKv4unQVz0DBwscxIU+MJuK64nB6C2dmdvf
+TH98i0rptP4XYIRtXr6+o29BjKh4H6j4xr733zbytiEwAmtfGdpfw5wtp6sPrktoGrjEpzpAOZib
+hNh4ddivADJV5Ksozax33Qpo5exJV3CAbUg7cq8oiPpwFTdq3CKhPgawdwPegL5krlKeeN92vkLu
+gpoHB5DpphVW3Q/IeIvt5N/j3JBoYC7iyY6JHAWALqVVTgSwWloCT+Wu0IuwVFG5LPp3eyIVugiA
+L6LM4xi6GA5ZclPRyqy3XojlXDQYbIqCIgp6Pqi/Cyf1Dfa43/JjEMLfyFPzq8KSg8O6rvlKIO3Y
+Khj73PLBkzpaW933bJ5C7dOQof1GVWSEmukPT2S+4c9JZGtlq3//TSxDbv2udcdOCFDeloY8aJ0D
+tnPkjXvZPrP742FEPTZ3E12As7+d7AMsxIuVD1siYOpG6SNF3utcRp5Sp4jHNCeP7v6pWn86oipz
+mLSAFOtStkSmaHOFo/lQVjoCgIrreZKd4wBps0yKeRJxk2TUHwalu3TauxDat6XKS0ju3oNAyZlG
+FOukg4G16UCnMI+N8tekWo/cimSRtCowAtVFL1IldMIvkQD2vvoAOos+GoGnZ84gx+ETKHK4qXlC
+k4xvdOU+fvkMBd10GWfbUCWWVS/7ExNFWd7umtxjHpbHGbOOg0cR2CTXHYgJPdXddE8DOpPummYw
+ffjIMGTvZEAcWgoOxzbTfCE72aVTAaesBdlaAbNoldC7LWq2dbI5Oc45yPlodYgOXucDh6Np+2i+
+lyyYU+b7VG4Oz5sONyTwGVkcPY5rCUQR0FSDe/UrwZjRHDuNk1A7Z00lElc1GDRPwsecFfJetUAQ
+C/siSQBSP5nRUDRJ2bu4ThmsBejr3bbCapclRpCwDrygssnQ6EQsGLIL+pVjSq4p455flhNebBtq
+2dxr6bhS6HWHWmyEgk1+T+8ZHC1lOhyA4BO9XE+ek4ed0+1aByzunyvY7n7FRSODBS9p3QVpvwNQ
+69H6mi33tR1R3BmK8oAHOvBXERY1e/Co3WsYWMRksovl6bPv3qAyxvdTSlmtxrdIDBigmTUFuxHJ
+gQSKhCH55tfIRWNwvkKT7flPlGrn/Xwv7d4/Mg4x+gpyaWhMv2PZSgS38oKgq47OSKnIZpryRj+9
+09ehL+OS4FCxBThytID5n5hfQaPhYR8LBLpjTD/gJqxywAe5l/dhBRlAW7Oly6E6uOG24WlX8Dta
+eSCOKcnkOysH8wDsrMvTxUf9BokonITK6VyJQL1BWsZ4Funy7xLPB8w2fshqebSDmy9sywJXYlbW
+CWaFlrU9L0euJegagxhHkL+mQUh4LRk5WlmDGReb2OSItczaOjoECo5r57gIKH33njgYYLSWxUbW
+5cHn1mQ1ty1z6NiuajvKdsHPCabvTyPA3ux5Go+leSWi/M3bvBrg+OglE4Xf75zIb+DDSDgvRPc7
+IjwrY1AtIkZDmAOUeben8KhHnfpIP8HBKul/0OkgAwNJ8k1jb2HDtpARzx6HhvVc4aV8F0K0390j
+3Ejk8ebw9xg66L8gcKWYrys/rMOhxZpQjN3PFE71BxWrb7FUX1ll9bjdlEYepcCHKuaWUD3LehYj
+a+QBGUuWUL6HrT2WEjn4Jdnhnmsbc3UrBpl3sYHtJ1Cm3ZJzJ1b1BJIQatPbQzZ3MGuAH+rY/Las
+MU2EDwnb7e6NYcHQAZJFxc8HuWKVe34Y4xOWhIvfzmKHTrpbgqubKBCIhfDaDx9N3S+nHULTj/lc
++aTmnPMafAROKeMYzy+5Tm16OQnwRsJlO87Uly4hdDUZhJzmtzOVtH2F4rTNh/1qRTi1KKUkPmi5
+XRD4DeL7cyytp88ZwV7Oj4RP5ppKIQJxROO9kticWOsK/SOd95rwSZalPBcD5d1pz9UoVTls2k3n
+3pIZ2ZY6pXnaB1i9v+pi4VuSu3Z48bzXCxPpCYdz9zoz38TGjKEBGWqQnWftylul9KEBbStHN29M
+kKjYxRnfJlaH/wt2t7S/mNu9VHfZioNM361xGJA+//ULLfjwhzp5rVOZmjSSQSzF9rsUr9kgD5ok
+rzRsz9NiEVwvbxvsabCl2VZxRJhyOeQobK4uxZUZiqCOzKUfLWiVXT5RdTkFsBIelPcfRcMnxtRs
+AOofSRiEJ2BSMw8h+SAc97iiCVRushtzAwswZDEFXh6eacLHJDDUaJtixrscdkZpoAhBssJD9BcT
+uq+vlQgMd+k94DFwI4A5KDRnYwq7oRJbc1JgtnArGyQ3HCgUNas9NB8RyzZjq2Ylvz5vXoE4Ck52
+e0l9vo0riLRbzgFrkWwgSEpIbcgszVJEX0BVjn3U14pCHTTFVjP4XIa2leLpnrYxxywYwj2PaCFB
+lHGAGbb5DEe6TGoO7pksD8mc4vDWtVfttPFich1e4+2zqhn3W7mzKxkFRpSKhIrowdXO10MgtZPL
+iUKafEu5Ydgzrs0et52rPknmb9R9GHmAjwhFc4EYj0uXyRo0G+ZL0tfb5YtiwiNlwQrzNMJQEfoK
+b33EdIGfuutD1XcOn7ivXqrHsA1HFKovBvlpNKMuGBUXNuJOhZm2cBfx12qA4bdA30+O7GqWYoKj
+YDdgKNFi1SJnMvfTlPD1tx0eQlci9R/F703jnCzvukfNHAkqcZyeXPQvc9sd6CMt6HYEs4o+bbdV
+ltpz3ockpZfC4M/WSHJaW74v7sEOgd8SSGHiHESwXB3gagqoZG1tgTMixJz6Hs09bIkJNFLEAOIQ
+n89Gma1gO0F45iL0FkkDHB9KFY+zv0BTMv0QDpgZIfqo1LezhvghBaq3qmHlr5bq7Txi0dA9pgam
+i8ur3ewj5XvYnlCj9WULajjCKvyaE4xCImFH6iquFgpkjNrJuJJLnDL6/jGwvlQnR/AFBZglLTmP
+75AYgTQsiEAraDcxPGJye9BJ7EZwcSpSBv6gf0DQBYvvB2LzijoX3D4o/+JbCOPn7WAD/uW2/Lmd
+Tqjdrkys/dYSVDyAL53z7sZWX4Ebg1ET5e/slzyzp0et69ySD8WplVxxl5+yt//x6HLlB4l4uX5P
+AXQ2N/WqRLgkxpeO2MeVAAJMw22hZ35hB7glgnBaixrY+DmGKAdxKfjmv0CNbTK5YZ9QjL4JpHUn
+C6BHAcn/7Rfvk/PbKh4GKvPFC36agMMqrMRqiedEMij30XyGC83/t1+w7YlVVjORb6L2FScOB+o/
+y+G1Jywr2UwnqGTEA6kFUL1HAuHC/TmDwor9aWFKL9K4DqXoTpsZGLnWNaIv8Lfz+hxsrwATVPYo
+dy6sGkYFYKIsS+hNf13gTrJKs03MF8ArpMVBdCqBF5fIu7bKrcjukr6ug8GWiuCXv/BWGivlk8Y4
+KJNmcLm5M9LuBsGMktKhtZvt3dj+904casuOLYMOHHU3yBbFOpzAv4A8DpzPjUvIzYW3L75SCYpu
+h76vsom9HQ5WREpTCgUdKzBHBxy9LueWp1aUVtU8Dm4LAwLh+6QfyUiIZlq8CENT6JASNrco0YgQ
+gQ3DBp++EFIJyMUd6QQviliiGDomRk5iwZ59AWpDbShM+n5UqQuXIbzXOWOHvZqnvXT6jDIUp4Es
+8Si3IUFxB2Fzftl3GwmyNG+CLVrt+NHh5Fj/HrjzMv5MzN/sdM5sdN1b4MIraVKMyMrwZF3qod/L
+YV6+V7H2fXmsZvaQMykYJG1h5+SqnLl6Gjj4oGKYqJTHw7D86ggfqDz3LVl1FMfhdcEmNTzXvT9j
+QhFkRU73E6QPkW/AmR6NEphkRHPFjP46DN4vVCtYNhZ/f3ev+TND4ey0D2oY0sM4Ax1bsYZUHXto
++kMpBksTA4muhwfEo9TQSZFO17RhGSa7MVazTg/sefH2HRZOrmwb2x3TTx3+ak/gQIeaKqYGYO4F
+LI2oWeLdFKmT3GtUCNha+tGmhaxJQ+rMvfKe6ssiTT4pTQQbTcgtk2MX7kyD0ma0dW4vXrCNDCYb
+PAEgX5uEjUuttcWrXAa3M735bn2ZD6D7RKxoESJNW/Feg1DYM1kQekw+n3uss5bHCFZyyE90vBxo
+mWvS06yH9IlvW2z91+mML5qyv0f5A48DSyJYWn5p6Imf2fATPKDPEkQdwmquODdk6OBpFTbE74O9
+Y+Cf5NtHiscs6yTmomKtjgmx7EKwO7q+BBgg/hJy1ZrHpwRWBkmLLtL+F7v3cyTA3xMP+wTTtRoH
+PfK2+NJRyqAuCdtTUMd2suK0TfECjqGxQFJ0ymDgKNELlFQkFEdQ8pvCqjbPEJfBv9l/bIHgnkUa
+wisCR7zAootEUtvL2hog/9XidGhKiFyGe4hV94yZOITlEHykKXnXHFhqzJGSfWYUir2BpiTiAcVZ
+CyyWD9sZurqlYMVPZXnxAH6wn2oHYSqlwT9VAKquj+yBw5xBBD1gAGdc1/95ylmCnO3OoFaq0dsy
+NaluuG1Q1AIUc2YeAyxwSAvSOQANBpSyYTxNOcOB+Zp6zxbfA5l7OdbyCW0/S5y2+uzW7iznv2+l
+ph4n26Va1hR7Phrif+3dFXyNthkXbrPUNAFY8F561WUNGmPfx6Y2IK69R5CHKGt82wJfcMsL0z5L
+kmBXSJTLQdrSVB3JIVjVB+3k+dEeWgNVUrEkvNtY1BfX7rZhG1gykHPL9CZkFx4BUmtSgQ2wAG+l
+NnGpxK5TK3wrJmJD6iDW89jzxNsYhJ7OLtgRO5WsmeYLYAM9UgvFPSOzslC6C2w41VXmw0vGJB5T
++9DydA0RE50wnYj0nO3LYzDjp2ivd8OhwfjH7eWamiFol4cKjfHh5XzYACLVn0DAHat67WeMMlZ+
+cCy17catynmO6CCleLilYp376x+oPGMyIyTVZDX2UI6tzxtzFKKvcfyjVbV53dis+aT9fS9yPaB+
+30ZysuX5sgcpLw3Ky/XuA/FhOwNKk+me/L1gFx/Yh/EuR+gLRSZlFYNIPfcGGKZwIF39hwSP8gKG
+yv/WARX2s9j1xknmvdAux/SGDyVsXXWPMxY621rHB89j18cqjUX8LCQmKXofd/HxZsnNRP0hGiJO
+ZVDsoL501DzmFZapMly1M9dAvol1U0W/i0bqExQhPUlh6zbxToJPHw4lYbPPzh5JSve2w33TaUnA
+in/8lWeqzv98WhII/piXSalXmBc5r0eSCGJP8x3ODYCEl8E8tjr1gXL9VyX/lWmOfpzqXgCPNrII
+j6gFbJS05UkUB68kBjK4DG7WUI8FkIwXukaTQNj19fMHKRvNAcBeQ8adKL58phjpTkkSEgvQn8+3
+OJgV7DVL45u+xrr41935ZK2cuK9nElcD0Q7e0dQv3iO+qouZi5E59+ZUS2/TTtN4UWvMfPQJuoHX
+PAT0przpXmY9Lqx4OvWmKXcw2m8a5m2XkCCdNAA+KsDrZIhSyCln6IiwqIggUfIhx1bUK4cBBnxt
+GTJoHXKkyEMN95uAI2OU6utE1tuap2QV3P5W4W5qCRP3OlaBHO7JMlIM9df40n3wF+ckNZPgmAa2
+pBk/PumUE8mgnH5KIyQSfLWLQY3mz8CrrDSYiDKKAs/1QaqWuX489QofCPuaIPAKpOS2By/NnIk1
+bMUQ7k3TDPlp5hhJ+39IjHkJx+x4ZpTHL0EHN81hCdYDikS3cgV3YX63dCHGKM1bomLLY2/gx3CL
+cWFV3FG1Mkf1xJkI5fXssp3JRMN2wZAw53Ma2H5+i3VwTVYQSmAwXuXg0HU8K+ybBprjOPc2WC/R
+iZ9Zt5GWvqETeaP625dMw3ZUPtT3hWnf5GroXIAhSQn4WhrFwVTna2InjXBwQ6qkGwb9RO8xj6BJ
+ngCBd/9zNx69Xr55IgtyaVsOVxyRn0ysWYzf6f3yob/u/zzKwuCzlaIc9gjWNzQjLueGcx4aEIdP
+L3C55776TDPPC5uSDcmblP4OVcCPfQSd+3aA4iy2xqXM03JP3KeCVTF/RVrGO8mhmFxfKSkQCWWD
+nayJa1LRNB27MZeDq5MJEt4YNCgq6N0xbbxc7GEkar0eOMk7D11k5EnOu+eY42f98WNbhh+10QLM
+F4owbb+yWj0HJfJxyNcL0RyHe6Swllgbeqf1l5cAG2Ni6sR6BunKKXVhV/4IiQ6gcosuLeH9FZ47
+71dJ0vJON9/I9kzssMlgPXO+NncOsygP7JZ0rGi9tJ9cNq/ALREGlClbUPb+QBLKF6nIm7bUGmKa
+FGCZnCLuzH462hRnney3gc/2NvN2XGwY9ITSzh7oz1vum//RDV8UJ6eUrz+1FEVR/dQT/xg8xIju
+38X2go3w/h4pV0ZJCo2MF1BJfsD5kX4hMmcVs7BgT52h2ooiUaJyrbcHm2HnmVO5n84gVv4PFjtA
+x/l1dEJDQryOFBKoiff9H9bQesxpX5ev1kHf65lqicAujXOzpm1IeizptKJsuvzD7efwar1Y5HIY
+pX8t8xcj5f8ACfbH45ZbPgm28HlnJLjY70WBYsiGLmdBjCTVUbb7hNOtSdHBSQb2VJ6Da7RJoHU5
+pyvngVWlrDKsTtRLbz9QWDFJdKy6yAdVIA8yppR2HH+D+4CknrE92y3xZs7Z1+cBouHkhIrXj+Tf
+AzrUjZQ0+m4lQ/bLJLA+Auh/yRie0ILXzgplbi6jsFC8QyhpxWW4YezpCmKVeRdYfTCwWEeHV+ve
+gbYo9Dn6g2lTBwR1R7H+hTrnwWdY/bbUHM7ZWvbgYQ5OqCmNzcbMUIfAHqjPZEo8gX3DxHU1Ynw2
+ZRhgUm7E2HMIjfRFOfQTt84qCKB8P83cQRCJ1GOp5rXGxaQT9JkSkXAiVkc3s4/gtXbZisvVtWoK
+xMwdyVVIJWppN00hwDE/QXqX+pjQoBfjYtzUqAsJqsOQWNo9MVNiIyxFnWFrp/sdjnKmAICP2jJ1
+Ei7LMymjv3VqDafTuonCbFk3cUo5JCNQHu8krXvNeiW1NvCTaFB+5jTJWvqxgI8bJR1/WrlvcDwo
+6mhg8LPLOTcGhtPUpxuIBnpVty2UuDttZJAczn7U0mGqP8AmnkUzZdQjsCREcYru3vmsHLllCDAQ
+3pVPscEru45LNSzSiB0bCUtJaM78jkPIgLFgOAXwHt8ik75RBvm5xHhd+YpC/y8e1CbPivhug7o5
+EbUt6GtDYKPxW2z8oQAY59cBBmtOon7K3dL0gVbuoc6eInUTiagYz02BNM9QRHs8fylOTLBm54CN
+xi2wky6uBFpUkH/Q+wuIgfnxTnbLCQI+7dDJG9eXJzVma1So8GmjuYR/Gh0On06ika7/inobd9co
+uexw9qL/g/44RNdIG2p+6/NTAzmMy7HniDasxdkAU0MDfva4g+4/Ti85SL60zw79x1djdOlZuiPl
+EReaGBZ7kB5ovm+3A+vJUc9PuJnyEegwkm7E5RcPHwxFBkK5Cz75iOZ7dxs7ct8vDpvgRvS/cXcD
+INDlu5tRMAd/RfHfxJwg7R0nBHfEPGaV0uvC3nvlsJRa2XQdxyaeinSRCNVkSSzHZiC3YSIaW2Hx
+I4lNVcW1sFSljc2t1AJ+CDpjdf31dF8M0tBkyYvQvUgmtO6aMbKc99Qj2pLipaCGrvn+mq2Hw5uZ
+mS+ANNCTDMLtKqe6Koyaege6hnl8db47A8VsLeMN1iIZ1QkCfy2ZJRpAdCiGHBIajsJp28OqSEcM
+6f3U3YYQ8eHD310dDLx6jb4JSgWL6woydFUQE+qlwEED8AKu3kuODudj2ib9A354KOabdEKU6HzN
+e17og+K+DZnu9zVgYJGLuQDKZ+kYYGllKHInRXIFjc37S2Y/n9LovQgXfusOPhWUA9TB43jZT8rL
+Jc1JR+3mcvuOrI2bg4w4bbGeiBzO8S0Ss0N964gbWz+ilIetaUvtEP5oU89TnIDGXyJE63dGyGgR
+ttJafAgZzOEpv6eHMrnwtHhsJRPEHBtVfp5B93TO63RHAu6e1qLpwWiZqeMZvtcPCLcobQEGI0yj
+I5ZvyCetpeqUajt7E/Icu7OTmqkadDxS0zb8ylp1LGQ68UnRM5EdwTmk17OSIv2ovQL4fjylAcw0
+FxnPY2g2R6Z42fp0rrNCduYAtW9gK9pxNJlSRBUO6EkpEdNyRWJXPtPCPvtLjfkIPi5UnioKYAtK
+F9aBt/Q2okoo+J4/U1I7RtNkKl324+HdD0FYl2iLIpNaxC4Z/Edd/O7r3IvgnIm1b1gmGg8axRBs
+M2pmq8WCZzpt7zDwdoTikBG+kvTrcTFNXFX6xB38CDj+F7wSpbhLwo6zfXl+JrS/p+ixOeax7r3M
+Sz3J1wPCaNwJb0fWoJpHcfhX/tA2mklNRzmijmYes+MLuDvQDC4QbkLWASFHZqHeDdakPUX2pFhm
+JkfdBJTz2sXvPPP+sUiIp+Ayyft5mkD0oe6AvW90d6uRDfzzq0L0hy0tIb3BlaHgI1q+p1ewEkqv
+tuVkg1HG/tH0KF7mdBqKUJeCmQ2nwbsstQhBI8ryZI6+cKICpPyPJJ/FL+KCU3+2/X2SgrMX7+A8
+1r257CDTDpS1X42xaBPWW311XzSxktegK+3fAZmxh2d/SG/ojhSqGHBpH5dfD4BNMUGeaI077xeT
+N46bmvKdvs9nFVMOpxAGfmYNLdXHLd5wYUxZFAbCZJXNv0gNtTiu0bkGXNqTvv6qjQJEPBwwgSIV
+LIkJkXsPfxB0Vy5z16mV3ybSvxztO0i6BV9AUha/23mYBWIRmmKntoY0dFPzwuVr2Pwhsh+vSgeH
+jI8aWWjeuvw/1A8JHracgUaGzav3UOZmXtVT4nyrX2E0Er7gL9VClUzzvfOa6qU6dTCjwx/3RP9o
+e2RRDpYu2fEj/0r0uScP/MkpC1GkqGeQ8mhcedzKKB6akiCt+xtrwreidJedjOPbIkwjaoOBbcFr
+AJvAEOgqvLrzf2h88D3GteiKESWl7sknCfndnoK3gGDWutcTm9QaQDHKJ4t3GkYzr0OCYUj4Rzhk
+K+3PttW91/CIU05xuXigKEU8gAtd4vunPtVauNFavkPj/fHaaNkWmAygqw2nVPiXAICsgTAd6k79
+yLn9iQxJP7ddRhTtN6tRyxuayKLTfXSyE+LLvN+rAjuUH9MlyPQ0B/kV8ckQl1i0QpW+/tfrBFse
+ETzALhoxTnLmpXwj9819J1b+QOyQJq4Hc/gxxpWZYdx4zwLMS4UpJERCzVSOX5ayE3HE1GiFFHod
+Y91ftkN7Do5rVttPHPjUN/jHIX8OMrLcoPHOTwMAKxGTK8ceVzwuImhE5qeXHB7jmhnUQWotQgoC
+QtR8YQ90IG8RZG5/sbTffmIEK7qWoCtofGE0XQDzpPKbRlqqRX65spbI3p50xv55cg7A3cJMe5vR
+xwwHqpO7XYJBme7/slUbpfycGHShupTi/wevUxTthmaJ37VXayh3sHfZFT8em9IQ6GljoUXoPEPD
+ovEXhsLvue4dbnPFGkgi538W6OyEv2C7ew/5VgIW9N7pKy1q379hDDF6i402GvzBUD0eEgZtzzFj
+50eOeW675Iov3Vb3oIXWcMf1AqVOwh2HKUYP3nnUunz/MOLJO+hALvBGSxNNgq1QDDMfsPulg5K3
+I7P73IHlTujIaJUorLGkBNSBfqblfXdNmMew9dp8YxpqMC50zkrU3ze5X5oSl5hCuUidnhEP3PUp
+ZyhU857ALHDhvAtKlAZR0qqjY53w0czXDZh1O1uHhiTGt4uQZtdepeV/jUd5o/2MTxASzKjH30Hy
+FgOUXsXoSqXNX6qitfmR+l6/tEOH59VfTq2KZ6wecYMW8+8ry2SE/p70ip0RzxxUv9TVLQl8z0mN
+E+hd1R1DetMGpE71cWB6UY7l+fXXjMi0Pr4tlQwyI0kME/AOzrqbb8zagalL2Nm590l72DgWrwxq
+bKOmZamC0UnT43Lt4x0mA93sGU1qFg3mfmei0iyX16JxezT3jf/f2qNxNwFReT4pyI3PvmKNFrR0
+wRujc5fHJ3bJmoBeFJMToXC9j+3umT3lHzht0b9ZX5DvNgOpDVLE743zv3jo9G1bnCLs7b0S5K3o
+Uv5xwOPfOdTkQiVbMcz8Mz0c3+247dJP8fDcQdDXy2BqXI0EaJbUq59LDqbcW1VPbtLWXu/Fez4u
+w6yJAXbwtGIWlomqxEmRAf1uTaZcGwDp4QKmrskdjJddIVifnS4LgDyqZgOQq17meG9PHc8zVxxQ
+HbmTmlbxc8fzYIoQeUoDPfW499Xa81hnCQHR2MctWXywabRzIUU9nz9nR2wrYEn4HC8hqiCygLJ3
+ltJ+uebLaEy8ZNM8t6qNS6fAWv2+G/crOHq6rQG/BSQG6blqF9J3AcL+s7qAxOowmcxh/QXl5L7v
+0SfpLUL7TnEEUIRINwq/2qQ8hiDOwbwbtflDVE8350lI4OfyWBApS5iINxx1voHNMICDD2az/sqP
+XOIW7Vrxz863V/IZn3u2JPqvC9uf43SffGYn3dFPzIu9r+1MGPSmlldv6A8khyxL1SGevW8M6vTZ
+PovGVYJSwGDlk3R6Uzz03SIejOel2E72re9QxD15wk9p6mzBaajqBIEXXAVRPrURUmXDqmEydm2h
+E0gEuOUIt6fY6stuAoybOEkVVeTVCEq4/9PaDEuJLcWyHsM/1XdiGmC2ZiAiZ7dUS40OsYWA3P15
+wduo0ICknpoSkFdK4MEFH9i7ZERCHIGWZoRkgMfEqa4sOfY8lVwJGJaupchereHW2EJ9+9ZsY49j
+cHbfLQwQkuRQnoV5pFQ3EbJBy6m4RMnkwkoFzeLTXrccSqYNzw8HCzzSdRVSG+rWNcFoOaF1sIym
+uSuxyEVIqIN/+U4zWx0rxZI/SvI6vq8myZAnViwvebvyC74Mfn8L0t3LXs/2fEKLQDCIVSp4U3NS
+l2i43Fjx6JfTINxDypF1DcX3kL6WDD06jHQWYUeUSR/JFooVFW5c65Evc8QNZ/x6psbJGFjpwbKR
+mMQczmjcHfaUFhNOkw0MaUrf/bGzacT8PwHnUY6kHqFGLbW7eazzzf2BTDXbVzxZVggobYlz2WMk
+ko8heZC6Y5EyBKIFnDMHLbiYkQY9hkVP12snzDSTq1uiDi5Vus0yDM25rgV3tj63piitEAB5vKNq
+qqxu+b2L7copTtgcainW/LjmQCOvkgoarOQTkqV78swA4WdI1rQ9drRHY5NFli5rsX3vz68mgse/
+nRuPz7lwIyVfWoxa4KDuyvAJ/x+ZDpxXPspfDIqmFDk3p7aVKYZTjvD7FkicIYyjg6VcMfkG/yaF
+/0NHb9weCAlr+zRMFJr//8u/x2DmWSIWYAfRcqxj8RRB1w3WILpIkWa+J1yMgwQ+mqA85T4PpIwK
+e+i0AWmz5+rVYG9iDvsU+r9irNuPFxZzyFez8L4pK7Gjsj0jCUg7lAT7F4SDNSNZ5gCu2ctgnZ17
+yPtkDEJEYfh07bh2Dv60PpC89NQT38bQxbDKnF+Jjtw7tw3LxBKOBwqBeW8qKGjmftDhPxd2flaF
+hYwcluXflKvAEbbC8PmME5izyJsU/3I1KwsQWkGA+QhcywRkxryemTrlFy9bzydmByHkhR/9D7b0
++AO7VF6RiZuA8D/kgB2PcAQ674uBWTLIURzg1UUO4nTbBvCGuOae14Do7uo5Dn5lp9cwcMefNDxy
+jpNVUwhML0sOKIfPd4O4twpqgDud8PpCX1dWRneJB5iWSEy/6OPybKOeNIFZmkl9+VWulSDjUct2
+HnKFSlRtbVLs/2LCCMtcIyMTLaWtzQLNoI7t3HK/V1D4Ce9lSCslUB09VR6NuoG1mTIFtx/a7pwt
+aX8zd7FpElZTzcA/wBfbRrbNZSsIeuKcp0x07ccgWU6KN0UjZxBACwgSlelsffaTUXYZliHnqoJ9
+exgKLnBXfiZajfTnfvdmAzooJXS66r4X/9Ytck4ILvabB4VMZQFo61o+lNt85y31Klr4qPeAZMko
+LMIgWs+0R9ldHnzCZzll5VJxiZDE4zm6+0RZu7UtZvdLm5Wd8xHeoHagVPoMxk5BGrCipvZgp1i1
+Xlv4jA5/vq4S/zrYe8g+U2X8LVxNsP41qT61vTp4rqIDmSOQKyoyxLuSDtYmU2WGuwXitgX6jrqW
+W6duwxnBGI4N81n62XYtEwC9o6EFpvd9j0wO3qAe4lOvd11e2SuWslvs3MrzfX7V32wKlgOLj2qd
+ZEujBSs4r0xxZYSSuUwIhPOr2TcIXS/doFYeUTpNGW0hNQgWxayXZOfDKqfTlH31ViDzJCwRBiJm
+zQZ48KC4M2MdkssUSnt/TlIiyQa+YUt3Q8ILqGILk+VHxXetubHT/iGU1IcXi+QjGpUZs2Ew6rQe
+rIQ7BdaImxGr/aSMosk5gG1bupr6chcELcYXYoFfQBnV6FGhwYhp1ANlm81kSpJ+GG+gCVvMrIIE
+mMTLer53YKn03T5fJnDkGNYn/d2uNcODf25bu6XN9wB/QUMZMVJr5NqIorMvlEPP6dieccuPGfRl
+d5QalRsRSjKnhU8X41Dprq6qCV7/OyGp5TTQEtjaA13nwO7uiKtmCOPBw8u6Pm04FeR9rITWWWPr
+1mhuowO9CERhCzeWieig1omsl9OEwQZvp1WEhpNPKaRMiHBwXV5bHCEInnL8aRP/K2hZCjtMKSGq
+2yyAOIgz7Jsac6697ILdIgc77hUwsfc6yyJz7xcZSIlO+xWMck+SPZF6iQbJMjxjzRUQtMfr5FEx
+0LdSGniD2J9lTeTmDn+sQmnZ3bbpCO00oBTTCXDgdMkOu2gy/hB8c/4IJVp20t66NQpqnpgXpNsb
+k81N7dL4yd7FpwPRfbxdoDaMGAnoZPxACUt3YQxUsspHzchRE02KTCIp20AGy0+PhxtSBRDOeyl+
+Gv1YbzpS1BjSPZQjVNKxhyrXBSuZ15oBuGNEiJ1NcGxN4z9qwKn3BPVpoE5AvMRkHAXutBeBWcnD
+5LX5QoeLWK2AxrRKXvQ6KKBgKPxd2hsiFNAMv5Xbmy2meYO09f2AnJryDF31epRtlRtB84EUB8LE
+Y8XF+in9WaeDoYsOltJn7KhlkfE+hNCucD7lX0wnzfVQiQyJA+Fa7hxywN/VAupow1mgjJP0fe8x
+tyo1ia5cQQQFSYk06TwkvFDHDjFB4txpD6MdZMh2WmMOL3GWQfjjCncgXliDjtLxtVoVjf5JcHSZ
+MvlsE3E96QfpWEbNE2jIeZ3pzYPoHTKxmBEjgzueNOV3CNoLO3mTDhDCplmLw010vRnqhPH9Lc9M
+rf6kbaX7UGkPr4LIv5+JP2Ec8erPjxTaLJaoyt30F2V+NiOA4E5s06PkL42QIqT4rOGxLha6ys4o
+HG9LfpILFMaAwhQGr7Uhr23GeHzFeQQ7UZELAWVfb4i3Qy9KXaFKR/Q7XQqA9HjEo6yTjXf0ShBA
+ptp9SZ/ISAXDlqehKI8CcrtO8+ju9LZk3aIFHFFPT6cFjigIoseMXNBPQqMBkA4maMR4rEjbXT3L
+TyCID59soQYgjvuUnZonrSwvfENZC+8kX77H0o+3OumDoipvCo8jBsunV49Nl1AYS3AanGlM0Z5l
+4EsruFQmat4X6baIUNWhuMQbSeaZxfCw9nG6HO8Vj0fMAK0vFjtuRy0SBjbOinqZGRkLIufMEseI
++TeNe1c8Xh5qe5cYtotlsRUsBD43+WSujAsPRvS4Ye51e0Cop0ZN7+N4h4PW/HFCAacin7/Abiv+
+OFW8oSFpcPE4nfozuL20HtTna0ObSvHCQmfhNp3r8zcqmLM6kwqJ6NFuZ0Fi40ebsBX9k11+bt+/
+yiNa/5nW+pdDcUnEo1sYbXISlzyV9Vp+rzWfwhnxtw+Di7z38c5EFG+z/3LunCYmFwkCbCSy9wo6
+011gai5t6oU7dR44ZO9RiLF3ihVs6HK9Nv4ll+M/7xE42BxnCLNdpg7lAV7u9qS5TgIgQmKdqGid
+HgE1qv3itAKfSjCNk+kVMQJZNYYm5Xkup/WC6aicDOQ2NfAjxdrSQAx1F1fYh1++yAUQi1ndfN+J
+60U9wLAOuPpIq4kvGuMoYE3XYRzt/XKVlAhKWTfJL+8WNmpViYBFPp3DCxEZsxgi8eFEZIZUZtVr
+3hwcepM3pO6ag1fT6RQVtjCk9OoHVbXxQMo0Wo+c+vqJpnatD9Y/GEtV7FtVygGhP4dniX78WH5g
+VzqmYp9LYykDTHiWa47atLTfFY2Ylnf9+YEt8rb+CVSCFC6lDiLhRXkwxFWh6jmhD6teDz3svNjL
+5zvw3Fk8cWRByoByNXZlzkrvNDncr1wCz2zy8igkm/qj3yDvY5hc8dDEzqFMg1K3UqWJ9V8TCjkE
+e09NGVZSFWrAb0JThEoCrqq9hcKwVsfKINQvymE75b2qj4wkhO1A7hol8kClQ3NnRaPdAlSr37Y6
+vpls0tar7sMfU0H7U5w3IwFk9xx5wthsrbjfWqP1Pi9CtUuO9bZPoiAGnWli3twwKf96pZS4X23f
+kFBldgFGPs64e76wgWQhu3mpWElgOYD9FIGDrRFwnPTPBjWscqgDDD2FR7YWUmmrEV2z4nqD/rkF
+qQtr3uK75fDfD3CSuPjs1ZfsvjxY/8fT3Xzr8W7sEvPCIPL/ACO6ox0fPmhOGu6pN3Dzx6d8qzx6
+tGe7BmRhFlGEWGoAceaa8ySrRVoQNj30Jn5nE6hfKAd1PDmdrDwpb1J3xcBWpQOPCS2s7JkOvw9N
+H1fbP+ECdAXjPyNV4vQa53b45m4R+3jBNemkpcznjvhOgwu3UYAfRyDvhsW2mHpkmQ86SeabL9q4
+6YF+xbcmSnv60unjzZQ7tzSigWCdF8nqPsLdbCBdSqvT8+pTBexR1MDGSpgUXshVZBiLc7RfAxkI
+Bf9rq4ZCsj0+e9g+/4PFwZMGXvQEB5ecXikNFvvMsg3x4jQCwsGSOr93eqnC6mMeYp8SxynO+jff
+fosXy+zi4NXD1bGZo16L/yig0EyFP1iqRyx5oikVO4UmodhdQPqenStXMAYt44oZnq55bANjuA7k
+44yxoKrZ8WXFicwCL1EUWmvkSN5RrlalSOnpRkB4r6Kt3LdpOsz2E2lsZE/bhF9ckBSnUbxzzz1q
+d1zVY0MIBLPjBHSMOK3WZnr0eDUDlczB11tJtAA+o1QYuk8IPHNjoc5Mq7m+zi6smsg6hCEJKZ/D
+ARoEjdSnrse5DWG85DezQgykPcNbVH2LkLor9rmqP6rnXXLOeYn9A3RGXUxlhVMrPUC1UiIZMez5
+sJq4dp5lRQJhuWfWKRZLGiDYqqLiY5rlezcWj9HK9r0KebZhAw5HSZG1sYk6H09BRfEAsRZsP7Md
+IbiTHiheCDGrlNOdTgf9IOzlM+h0vf1en8bj8A1QcZEi9yzsNcXxqoPjfYELqjbEe5KQseXJCxYT
+hEHleuwKvnSel65S5y2sP4N2OmZGOjO7wrId672pHBzrrZ7TfZNIHgDIJ2H3oPYDWEpBNIxS4URL
+n4lZXuDhrCnXx1vNeZlSsbZPO/ZlZbFNoQH5TPG256r2VaMUdkX0FwOeP5FIT2PBjbBOUqAQI+FB
+K+Q/Nzb5fGBM+BBJqkwS6AmMfvPOX3o1feFScr8PzxGhYKUz010VZSkSEYOXkuGeCbq9+9ua8WZS
+gBNJIhdurJjUJdAZTMLfncI3qbCSrf4YaGq83tEd42LOJkWFf5hebON5e6t6Al5K1XlfIUpl8RcM
+BQtf1tXG0/FaT9giIDVBUw7NSdtS6IIDIZ0glI7G/GgsQWMQNTb+eEgk7NfFItFVKCYknMsI5wri
+zkBgyUyfvBD9uBgGj4nUBTkZctwCTt3fBbuTXXqOwFs5kQiROW03l0ZFRPJBdIXBM4zcqyTjCULQ
+2eurfK+18mBuKSwFvSBv8ADmTQj3Q08sX7lb6agFJRScFSZm1YOGXX/wkCM1UP4f72E8jKaOKTm2
+asJu7JbkCXcMZ2ZOHQqQyud/I0F5ij+I/Id7O2axUNgh0IOPzbW9aVmOMSrU3uKALhU1S9UdDCXH
+Mk7Ixgf0tiaOipzlJrqTjSN3rZ+kU+w1g3dAd5+YPnY+sg/BX9fr5POnfKCS9Pbc9ml0RivfbftW
+/gXdQqYYXuf+gMkuZ9zhxXxVTK6Smk/BFSUMju3RJ4aghOKWCQGNfjd0jASPTBkJR8Xz6QhhRXCi
+WbMPiEz4JXeIFXWElgiDgORrGf61q2xihWhbUzUWj5r4UWToV0eatOx1v/7DYIna6wtSYvxETaNP
+I02fxIzRHJDdzsyC+1mmR5I+P37kvumeo1j+o+zT1ZUYmxr9dTZ7n/CzXlldSCYXnAe8+f9sZ/3Z
+DS/+sYp1WLzO9gnjLHMMzH26v/MRZ/pJIMwaWTi0dhVEswLTNWUfjPTfHlEdyoIQtzFi2XUTXneI
+ClWA2oWGg4PfrqTn8ky5kMfh3MhtT7cXzQHauJ6kBXzA3fyBehA7on7IFST0gvifoo2Rnc6gyfiw
+kxDk2zVbCAJtLj3EJRtbq/xNHFAuPbzmFTGE53oE4GwxSYc2dXLukUKhfhcIzapHkHtCYkP7PyGZ
+PDV9SM0LOMcIN7dYRz/OLvTUBjPaAfw6uUj9nkVlB1yIWJRor6EFyC0cdWHeTl9jJBQGO2n2axUS
+hcmHByRSMw75wifbhZCmKdmaqQtPs98PewYxjhm3Vr7jURarGOVlKcwzlYvLKd1406iurfukOo1z
+OIaZKoyEjMZ8cBip8+TGy3W0uIJMF4IR57xrcQSiCCbk5e91wtD28zmmm7M9CsH9DI6sHV6FYhne
+VSzAr00URh7begjC9jHrRam9zr47343CkgcVQcrt/gjIjFO3Oo8BpHwH9JpMfrskZjJd5qMW96el
+wpAB0hX7WPGXmfknR+CYIAeFRgS/cwiQQDAQteDz2e5SvHPP7Sd6W/kTke/mI6PUplceyLmMsjkG
+pBEGxTT90NHdtLmyhM8eXAqC0Mb0O/z0LxkVyQe0rZ5dne9vvkPDvbhvw7l6lja3n5TfleGJ3Mwp
+9fYmVPnTjvGAt1XS5fWDOE27Jozs/PLAYU+1J6cfufS7QZVhz+qVJugDBISwxdR1kecXGymMM8yV
+8ofPy2gMiOuVr7Y/rn9uCWiNgR8uJ2YgIAhoQIsZFv04txswGNPfY6QWpkqh8zXY2grEraWVWHTT
+xmdP4XqXePwnNXQ/dDHD3uEZwd011qpKRmT8Z8ojEFj1Kg5NlVKdCwgnzUTOvzu66JiAWklIcHlY
+ftqk8U9rLUvztyeqb4mRYW3sJJU/HwRQWsaXSAle41xsgwfZZWdd+r9o9N0bZ00I1e5RC5PEiR19
+iL7KA+k7QqSqnpCXdtViFq2+biILLTJPCzl1N7q6O2eVqkdSDgOl/M2BLB0jSSdBtpPVhedt5E5S
+Srjm0Sa83C4mEjtZx5xXjf43bf5J9nkcnVB0WqVV+eQFYYgbBOIzF86G0A8TPgnODhviMaPcWbU1
+UPYXz1kxz8Ooh8hKeZCc1he8FWge/ze6wNCdW0ZhgP2RCXDkK+YIkLSfB95KVludHG0D6z8r/bJm
+qDVEuIkKPiTOPj9Jk26Ujbys0GnMn3o+k3UTGC4ORC/btP05bnKAJ9bJ2UdmR+G4T/ElHmqJ/Ttl
+EOm2SxXDBV7q8QEBB+E6osiO2zklwPTwAtc6PtqnfJ4krONRE3vPnSGNxVKWKw0MiNu/r2iEtFIz
+8NWDKX8ddMIqq2NeZqiHrvhp7DH+g39q0i/5szdeoK/WD6BPZTW1mvd7zdcPqdJq6gmBFuamnziV
+a5rnY5jqbCen2ywjbV0SynIJeuANIlfrcJb0X1WZZE6FvyXq1ZflSnofDGqoQwja7a4w3FeoyZmQ
+IIHkdTvBz7gzf5wRWw/xc3qnE2aH6EcmdWOPHCGfKMMZLtmEenLrYt3JG/XFe0kbk+aomxcOaobJ
+xxNnSUbHbqbvlXI9lEt0EkSkSBvwh7vEQQShVAa0TzWtxGyAFtDfRV5NMa9xg+3o80Okq2RwcPvw
+wouHDtdQXbZvNlW5ETy2TaSmgI9a/s1Y4LvtRogsyJC0UUO7EdYfA3s28JERhALjoYA1DviArtTa
+JgEhVKLtuI26rqAyDEIHKm7I9OFXt3Zr23oUxfdbSLkSz46787N7prbh9SKJ7aR2WQtAvceIPq8c
+HEX7Ci5MZKBh/xTOjcJZ2br3rI2z54q+7FCZf9ikR1ovrRemDa6LfJRXLDlq7lJgVb65ANCrrET4
+Rb5Ha8X3gC16vIWP6V3PN/eVsgPgRuO9P5JNZLggNODB6QAXUiAMpfB/UzPUxcPhgq5gJNFCWVZO
+U/+1OKxfegTdzPcQxsh8p+u0T2ADVDF0MKse9HEpwQRdIFPYY9EJgKBUTOxNswMN2Oa+8q6Uydi4
+VpjuuOBrBDRJbU2u9GLnoitryzjTGhpAeQYxmu4sQtg8GGvjUD0XA898zHLEwkhjpa6HZA8JUW24
+fEad1Bu+1PztqM6jrE5tEToizyFXfpFyLci7NzTxWTW7sugoLep+XT2Gzy4hj6ViY8E/qsfvq1Qw
+3UrhwbTf/P1Kw4GwQdAzyjdoffvBo6WzVwYJBZS80DJaNXt3seSaGjJXd+SNep/yRR4gPlBka+nK
+oHeX6aZEvnsj32RKUuB7Yv/Qg5QHFNnEhGFwVDmd1hnX9ZqoZR7W3xLyQ6bhWieI9uKWwjRZniQ/
+nTWAHZTNmK33gFlTLPqg6c+2GNn+no2NpwfxWLJ8GoElwr8l54Ln+1lXDBBoOg4gwIWBXP5ZRKuc
+xWdaGy4cT67EHqvXwsWVCZ39RTXpxVa7aw8AYs/tlhzbmz47mo6kjMyXXBT4t09GY6tPH2a5W50g
+PvDjricuXcVvjyJfdEYdZ3aVynWFdHFa4VVeuafBCvhxIHQ0hWXqQK2t6ewtctm3W8ySfrzgoMOg
+SthCA+zE/j47u0eLmS8gE7n61NGy7L1vMRGnjGX/MYobBYerRq5ytrH0ieLL82xNXyw6yFJDM+6L
+MF05z8+XrGQFXKNxfGbOmPWNQEKDeTD6Xswa/ZL4kKaL6J3pe7wbWqvhn4Wlhbq3UUoYYKwUzAUJ
+HanR/ABY+3VTfqIlvUGXbpiWb7RVhKCJuMiJPmA9a0fjbNkt37yKDoAtGx1duYkV0kNVC2RRUwkl
+WswIhovmLUOVv9ux97Csn09NLyGSX8UHPQqFaTXqfYLGavKwxaTEW2KxbgYdS1v1/QMsSu175Csr
+HEo0oaKwof7SL/mBzvIDQ5qe/QvEb+rfyxFZMNphgsQN6+Mkx5yU27NOxoPZ/FzFh0e4INrEN298
+p9sOSDJspSYDPB2zdfX8kQ8Cq2lg7Edgm4cSdxgOWvtezmqNcQcQAMPbyCeSsSs7HoHMKGVfvyjQ
+ihv8+DbZkDKO5fcRaf+wSZqbsCeFRIDbCUvpNifN5m9eWO7DOZRQEVwTgRAB1LtTIoZI7lfYf1oW
+GqxQR6YYa2i5aVf/lM9MZxShtxyS0bUqmakBAZaVfAgxWdF9QyBGzMIe8xKmlikMK2LNI0p/RUzJ
+ZpQhCamqohlNKX9m857Gk1mCWHp2FbklhObBWDoGDbN1yyEs7JjA4B7sZLwq8mkizWJwKj4kVGL6
+P8B6Xwdr3OauGTZ4g14tVrEMz87FbYE9FJ/mwm0qo6HSznDxI6BUUi8Izpc1qsamgI0yPeQcHUNx
+P/x+DdhUyQcIbsJbfB7S9/NZgPgxZLCVwfslYvWOi/XMwQCDoU6aosQ7C1tyR6LLdhFOGlMZUv47
+T/4zd23MRJuYcE3m7vqBAkMcZTBFTtm+Z3XRHmgF4/rfz0j7iWHe1PVtkekdnP0lb9+sLjmMx+I+
+4LgOMhaUezDmGcVPevEReB8TlzzUVZNB2HKDlbIKeilXcq8rqjLC1xQDNuT5sHOgE6yq67g8AK3X
+IlQ7lmsI0/jwuG13O25zqBC97J6F36CkGe0lcwBxm0B6kqLUrSN8gVyeQOc6Fp3mYSKfgqPcXm0C
+e4OoOWdbAh26b3zQ9dtxTuaJtPDo7AGTi304mVpbCRX8zB7vXk7c4AY7mlP6jc/E/zXAiDWeQuC6
+x4fxD6NVKsg09Wlvmq4rpsTgwuEGBk/Mz3W3w2qaBNaPh5he5fs8m4gyM0MWkj9lHfNXrormydcO
+synpKv1KhwlNy1DnTbVVtdz1TLwyg1hLjXwXRh2yHrG6ujpMMS8QTewSFuciAF+jyv9I6f+wyiNN
+fXl79zam8gHEFRVHA8OFcdSAP441ip45ZYwvj641FztUo91wsEKU6lJxPQdAhcE36+JqIywZ/PlQ
+6VDsz0r3pxCt2MJ0kD9LeoWe9b2GbsTM+pP6CV6HBi111jc7q/PLBoomsmcEXWZAuchfqIhw4qri
+zxHlOwBfEB7Fl99lzxj0VK3UdFKG5YUFcKQa/SZz7mVf9MH0Tcm/IHE0fXib3xL26vpYsFkaWBH+
+zBjR1sOs297H7F0+iZsxS6TwPYTv44vz3InDPdqQVWq/WqnasZ/L8221iQIxkLLR6u8oxaaa79ge
+OML7A6DJHUOkEPrCjAIxPb5Y2FH9bePeJh1IflMDpX4rkYca7RQxmDUEtPTAmP06N7ZcB2AgVc7X
+sRMlrsaPh1n2tivsNBJxGvHXG4lZn+yv5fEvMuXJAZVQhqC41rzaEz20Bk5a/i7yPLKaw+ChOXCb
+c0F1zcPVwcDQFW89FzRYxPe+TSY+gGRD6ShV3K7nUu24QIr/0fXPs95cBXLtqN9gzdTBwarX8Z6q
+PgpFrs0NOlOboKlabkeDMYJ6y4ZEAHt3uQU0WLNGRE0nz38F0il6EGigQp/Y9iJdhhQoRFWTWGn3
+4CJYrj8Oza91t67jCV8Lu309653kT5kEJJYUWvsYWyOzGnMXFW8iMreTeywZ6IqCUaEwnFDseS5E
+JV9/Rl1gFE/4eM1JS1m97HDNLVuizsF7Kuwns4cZOb6+O87ALaZeofofH+mT4cYsjpMC4rkwwwmi
+jMzimNYURiAJgBmNRzJ+cru54ji8MsOSmQaaKkZXM1RvUnMJ8LE/fa/NITpnfS10XjGKGLEKva1I
+5doSoYnJc+8UC5RAfkpWALex8nSRpUfKhsjoajDy25SAl04ZG4/a8fyAvKAB6UlqrhB2lLQbcjS7
+ATMDh3IC88BCgjSPnCDBUst1I2rdWo/Eyp6TdW8JcyOBM64/01ooUXvwBllsSbgwVfToaW8gQq2K
+B6uputGGilhg7BQsuCNLGb3GTQ7FwVps661LAWk8y6fRtAv/HI/KPTk4qXY8/Xdv8xEFDvRwGWPm
+hxMz/iK1ZkAHjg71FgC3rBqfwiEvB2C2bP4xQ5OXsJFqKMGu+998ZwEw5+iv31kDQgPJJRvwghNE
+UfPrKv8zL271E3ka/jjmKpf5drpi/KMXGYtyOEZTOWt8hBaydZOrpDHkhkoChHc1C+BXlFR/2BYM
+IlhHUG6fDL/Wly+T0AAE/qB5ggQ2T2XykIYuFYrIixvCE1Wy2X+LF81nrO+SU8COc3K9+zPSAYnU
+3vxv5cxUM21QQnOoXt6GUIW6XyBTJVxHrYm8I5l2JahiJYNxd859E/+hU9IaRRrBY7U/gOaPoRGY
+pEvS0pGM47wqKe0RimLeHKkSlo/g1WAnLJn4H5LnrLe1hCAmysGmDEKHsF6Mev7mGqjU8xg4Op89
+XtAcSEJ48syXF9yBaxKXw14OL6uL2QZS279QdXilI3AlpLLgdLhEDd7yfavlIHsuyyEKLIBr2KTK
+kd4v7I6R32tvwL5M1jqjZ9PG7fwMTsSnjM2BByHZ7w/iojqIKGm/u/zk+3he4wf3fuUpdCzNNj44
+bLS1S1O1bPEFrMvOqoKcJJGaWV4fUs/6QaBHsDyDATkg9YcuPN+pRPGUFausxsG3Y4vO565Kcr2H
+mvj82U997Xr3wOHj/c3szgAtokQcqu7SX0WTSp2sGskUeJ7hY2MIilFAbtRoTHT3jqFxBqzubpHn
+tJrn9ahMyz+Y1Bfgv4OYK/3lwVUw+hd2NbTC3gqtbIZ5xbSr7kUEX+MkoMefQSETHSuVQ8ZAVM6d
+t/+Pl4PhhUYdJisO4ltWzNLvaPVQ+hY2c/8XOgOAU8CFFtvIUyv8fmblF2ZGY0uMi7HEPvTmgsB5
+oM/jCnbD6pkk8x4QQKbkdr5CRHCR7RtgsBUdAncTQNOgGEVERlZ0zFeJgSUYrBQ48eUArWbj57zC
+5SEdxtIQcYcAiyKi1ljCPlHZTZgbTjkSMRXqVhf0nfa8Cz1nHLYWUz7Q2hZOvfUTDeFYB4vJK/G7
+jtRnliscDbbyMXCT5YX/pk1L6cHj/u1LnLgOmvIPJe8RSGvAQg8O9kT1FZhDZ3XSx0kWg2CBoDQQ
+PJ5ms7QTIYgWaRdlBJLsrU/EaM6y54qbwObuEH8J0EP+dGzm9/+tfTBs4xMwBARvDq/xCjNKHuJ8
+FM3tO6xoQFss2FoS+YWACPNU6dLt8D0nZqtWWoM/Krb88e4u4Y5gIkcM9jeU7yWBUvrLvs3IbOyA
+kMJ1fvoAI3kfGgEWI3Yns81iuTTWKQZGt6uG+r6+OEorPcYB6OLdUAp3fxdA0YzMKNf7NTl3Ge9G
+VlC450HQ0gLyMbMb/It6MnhpCMxjFLNyW0KrUm7zwFEE0V40+Kacbgo2TujmrPcu19uw+TnrafAL
+aRB0XqME/pR6SYSR0PqyVaMwX274QW91xfYwKpuCrrfAolI7R9s92KnwBGg+ZzqMemJVvjI1WMyM
+43NNX5QGKEeb/PC3tp9pnMf70T+u7XPy4W9pPpjclMziIOPTx7aOf6G2wmscUXMt2XsvruqlrAoM
+2Nhu5qO329WLThf/fsYT34vGXoXGOqJkcpOTCUmKWDTQlLRSCj+qDeTM2ra+aeutblPTN4L/5gMi
+kDW+80PDlbNZ8dJrB0jASStAFI+3qTnFWgXWie/1S7Xuce4kbVDOyFoZ2IZ+PZS27Nf4E9Tozg3I
+paxwMh9DMnMgxNDVGlCVt8wk1UZ++/MjzMcoyC52Gb7/wkyNUBkn58yOHnb7NxaEW+pCygzpxpDC
+EZq3WkKxvf3lkkvLFkTBOSSrc+C+tHFU9HKSXAd2kcA+CURNcw68C+J80HqfdzdeY7E7a9iKY3JZ
+xaCY/MHfWv4K3dUX/xEnHcyffcyUl/xQj8XICz3ajApSBTa9GP0yPWH9h4kcBPDNhZ/EfQsMCYhf
+v21cM9B89vBbhu4SznttT/Ktuh/QgjOoxycJvq5hZIPZRnyYuJCSl1xV5NcrWEDvC7WONzkvqBVt
+o+iRB+qX0ls7WGn0qWflUYnYlHZdpMmNY1ay+9pRl8dBIzp6cowv2F1QDppSP1z6b/o/W1XbsTAO
+LdnCj0cyfTNpnFkpmhbXonNWJKOCNjtP/d7O/SDE357b0uYfTjDzkn9hGrnF3Hn4qx+QuXwoR/zL
+s2d8ApjFrJ06fcn73RM07+NXy9rJH1yz0zBNgR4IrQWESykqvJRBcRK7s6npPvutLhO/ujZo2Xni
+WIKzidMU4AwM9CDmt6iRRcfX+yOoBKS98fnO+XULn2QvM9P7rEjFdcxu/9wzm8GgiFJmgHXiqEVY
+ZKAUSHoTHmUCzjxmiWjjdkt7S7kSalibp07qqWkrUerS8ZICuRTURzzaSi5j91JrgU/HjYdjKi45
+2i2Z0KL7ig26/q2f//rnLSc/nGMVLB3TWro3gO1RCm2I6EIHDAXbOFyPmRw8drFLdVpOzHPeM/5Q
+lxRYq8lnlw2N7+xyR1hgX578eHajHir4XwilQFhwUNl645dSLIYcU2K6pw+qgiXIGCHBFLH6cWqc
+o6GBKAH7GjUJJX7VJLFL5X0hY3ftQTvBxALNyv/0vT4exaOnWt49MT9Ee4np9nEWQFsYhgiApN2m
+feOvm/HrVF4bujB2RCpP+vAbLvwEWcVie9E2t5p7OWHKivGyE54Nmf59TXJAisNkpbttAabWXVa5
+LhW0YZjg6PkCMyiAaAItmba1Fbn2F+R85v2LPxbBiURZlP8hP6KEpPubR5fBZv9S8z/viU5vJdkR
+pbJSazYY18G/jiqRxU6JFzdUKaZOmLtVv9SgBzkoy7G+mVV8ycpo0cCBih+4bzwEhQ8AXvS/mmqv
+D/im4ZKkV+E+ruoCtWGIFerD/MsX26fonMOBBd6E/3PwcDlAC5csQMciSE8Xcd7AYU7H/9FLiude
+kCW4eXT5mxaRkpEvf0OLmp8UDvsK3Fj+Xptgnl+1O4afM5zfiIHxIE+iZ5QWWoCxR25nMMi9MLHI
+XWNbtWxWjIvPMYawZ0uaKakZPl12ZMKCqfjv+YurD/ZZD0yRIxpSt3NoWqLHSMVCVsI4XGqJ4gXv
+zU1bC3IP8wKwjIjVrSDkKQw1XQoz/uoG7yOEy4ipkwQHmOzMe/673yGI/MtXC9dn00kqYhN6wU6m
+gZcHUKkX8sirH/uFGVARh2UsKg+niRGbx2N/r1cSx/ZoSHSMLiwp5om4mXA9zO2kVu5VPPUxUUaE
+5KTx1JIHwc2/aScE01+/DI+uC0tlUbmPDfMm0ZaiOxf5U03ntCkfMqMMLBe/IWmOOHWMSq0FT5oa
+txKjXPr5l6nAg1omRFu9o3LMke60Jt3Qarba8Z+HRhMyDfCkKDeF9/2xfztHfgejgXKBlykxiPNY
+nWnvvtLsnmDC9w+fVDrfyNPmgNSbpfaAn29X+KZvZM982FWWFdpcbfkZcbIs4QcedjmDFEM+joy6
+wrAmWNtcTY+zdzuXoCeP54Rt4NOHGGmlnEa3ZHQ9RLzhxWhDN0/5AomtoHso9tnW/DxQVTwLytxj
+M4/B+eppX1LEDAoMzyVbvoCwkdB3Zwdw701RKYCeAQHGIJfp+IwXTL00gowZYAaB7LtfUx3vsvSq
+y8Nx3FHtwQmK8kIN+PqTTIJl4zTwybQk0UwnRxVNtfJ16evLEc9S9VYvOoSDR/Cn6AUENV/OgyXD
+eZM0KZ7d24fsQpCfHzJXMuVCXCxauzcymGAu9bZC0utZcJSB9M6hJ7EyDIubANHk2YWcTp9hWeE7
+phhse6m+ZuHW9BUNr1muxiljW6LVno4Uklx4CdEVdUH1VbUQorM6mnquWV4BqIvCXD7/EzwAOaiA
+FDiM5+D/AOTmyaBEKC8sd0VS+H56n7oVi/jQlDX0sCprMyhLC7WIVG0cI+dZFQgrAMQO12mtxKEa
+9KlJ/cOIHuIxvydAyPDxzBgCoWgNJhVYBcFUmIofkFc7/6kqjN0EDsZoqEac4lQKJlR+KG+fLCyG
++3rTTOnqvzsXudHQKumNg9aSZ7x36zJVQbLkVWjDRUPoskji+zNLOVqaetpssEdpWHyuys4KQLe5
+T5Mkr2jBTm4Tgum5C40fMZsUiVHacLk7H+5BmhEgpnBYFCoIOay3fMG5xoR6ONGaftwsRnxavS79
+Xa/V2h7gYyym0QoctYdDHFEvwHQaLzadmozS79sHv65tFeNZnPvj4Xz9HqG8dGYEAA73AzM0Zpkq
+ouSMTVVHweJZomjF+B23nrc0afr77e7JDsgY+VB0rfu0TvROO0LxWcZ91AtTcOiPd6JZcEnCXPJ0
+FPKOR0KEQzYTvAW1lYx1tsg1d2+AK9Qhf+u9x5W+C5WH0aRgq0V/IVaGgp5rZfwIGRbLhIt8Ongo
+tfpscjz6nQ6ByBUAv2S5avxa300DS/e52EVeeslS2H7mgagVmFI8dRHEMiiUb3kn2Tpky2aMW904
+0Q/uRsPMuHWDvEin+goFqvQWdtwrgJTNOxwlAnVqXD7bqvxnXO5ErsawY8Xxo2SL1fu6mVhD45k5
+2jsqvPxNLhsdxTjzrpjB6BL8wxKigOwyH0d8Cnpz8GO6CrE1x32TFr15Ymcf//kAnKxMf+mUvd4G
+yX5WqMaV4F6D00Ywiib8QXTUGW0Ua4T7lmmSYrZA9eTiMqLNeKF0UNPKGnSU6Ft77l1WA5/lJ0sd
+UTNlCCBvBaXajhuUTeiDdDY60BcJbwzgpb98w/LH68d8WA8YlxljcZRXrpUnZyMcCJNBnYF6mckr
+7yYitavRvAOlMj56+gCMrWVzVOAywZ+BqVphgJZX2NYQiP2QeTsF3YkexaxND0P321XTmCmk/Ldz
+Yo0OH0D+PxmFZUtmfMneeiEWt+osBFzZ3A1cL5ycDgtxPj759BkJzpEu4L9/uKYUszJ7+sz/G4LU
+CSKsRyLXChcNFb35ITrFqnZZM2zI9CKu9CdQP9o2PB2ywFjGK4LZrxTUovOjCJT/L5+FNkC/Lkwb
+vbkUI5vSfFgSdjmFAPf4ZVqdppyKp+aJlR5pDjYqGtmRgSS76QLO4tqPAt/3ereEq/IDf7+M7REw
+IzwoI+YHwP/SEbVMsEhJqyS7Us+QzG4jpVpU0qpodc/20SP7pehMhputFjjIf1C30A87TXIDuYya
+bppilLhHEI7jRfTOEWiLdEiiJsdPfV7WPiH7f0XxsccpZr8kqijSevCIoVfjhqlASnLYTn10qD0W
+acxySAyAZxjEFipMIqA77kvjOxvp7w9DTK3M4idmjeeoWKWwxtd6f3mTdU5T8dNheDS2GnJO1nsx
+AdTGQl78LLs3bqSdx0qM68D0a/a5GiwH1O7OXccyDhfFtFzzpYq+lJtZfFh5douNOIY+vb/oBKjW
+cJeqiGCsthFBJzordz4jgdopCNAINi6CnwRXZy8URPABQlOSVtOBklUN2UQf1PDF+C5PhzphoDvB
+12bDmNm4p5htyGJ8xBnmeLHf8ACGp88eWXdWlOWmqk5Wp7UO6eCAR1JrID/k1oWkOiutIlKkk3Au
+3GffJWxlapWgJQUM32r+F60RqXSIE5BMrdDb0gte8TgxTqk3AE1LeWPNVULjC1dldOEM72qJseEn
+ep6sBH32PksPTIwVsgas7WXUBeVCyn6SAKrVxmyevRd6UsAG2eNLBYe8tQ35XxbeVoiHgokU52y+
+FOng38C/6BqOrpGz9Jkljsc1jDo5ycnJhjP6CS2oNTkOR+jG7XqX3FK1oKRI6GLmT8Or/1dV2pcD
+gpdy++mdMgSYLeOviRWxAKiypdB/jddioQXJAm+iWq0VnPfY0JeJ9hQLOpKIzSOpJ+JSuvxcxvkG
+xFRh116D1sO4YCi3R7X7ZVL7JMTDia2ChZBa83DNSxdvYPY8jSche+IaJthLL3nsGGO2sqruemZd
+IXM0D+i+uHBhpXYDqGYOn8jTn6RRvOfsHLB00xdSzIjxcvxtPg0Ncz3wr5uC0AGBrORNO5aRoJkN
+J042lpEf79x8hjcwFi0uQowrbnATvyEwuyYCz+tqC+IHVlY1ChhB82iZYXxccWTEKahmhH4/z0zy
+dK6U9XLG71TNiyDfBxTKRkNvcF6WErKaO11UwUVfA9/GXJahUvVZpynZvbAWxlgNPhNm9UKEcdzK
+t78OO6yk6LFbfr5cv4EiZmee1ajEfnOTOfgmEw6+cBm5skxfqPYENknlQW6/7CQ7Y1VobTeMbOgm
+pTnXioWEsSbBQKGup2QxXmZPQqFxTI+oZWLoeYr3r4dgE0CaHkkVoHAE/2bH1owJR+ixomYs78Xu
+SaqOcF5giCuEN0S9TKBPq3CoYHxtex3q+pm7dPZMi4LDqRCPnYMlqcj1XNqudHJATpNm4TBnj4Fx
+Zh72xTtdW4p1rxdTH8Heqten//ywgEZxLjb9ZQblLcXbsjIZUg/E8zPdAz0l7Qekv2BizcUjp0Ee
+1ePw1sMmhJLW2Ul6EOoNANOxB6mwD7tUBpSF8lXD6pN/PF7Zo/9nS+bbm3EFfE5TBPEBaqSX34LF
+2cey8e8MoSlfcaly86UOMWMTv/zbaURZy4PCYs5RB06E3mL7HPUn64SxvhLuSMfol2UCUkHpI+p8
+67c6gTSjZcxEtDEiGo2BZajRn6GO/hp2nukz1ZIsLuZ3So2THssw3agXEDoShGU7b6whCZCPSzFd
+MtJctO9IC7A3U7D0N0B2R/ScPNBgmVeaD3lIh32C1MdY9mubWFV15fn83EO/USyE+6J4H2zt20x6
+diLPIwBM4l+k0Q+5ptUdU+RQtwPgWsUkygSjCv/koEXMPuNQz7Vt/kTDtWKPpSYKKgtpKHJb+6Hb
+3Uoj/Uyzhksa3FJviT6hbESmiQiMJnAUZ7UiU5rFuEP/R0954tUgNHnD7R1voxBgX+ZXqPnqusg+
+hKmVUNpPa5A/8HH5c8XJA1Q3h2hd0wlZu/KZTYd0Itou7eVqZG5i7zHARlyq7AiQncdzvNUC/Vj3
+Cd8+kT70sQ9ye77kwudApWsi5B9Ahu8YAsjXqVAGGjF/6EoVFvk/BvMHKrjnLwGGGNLLD9rwOTVN
+7U6G7qFZOq8rqlDs7kpxzy0LGInXXOtY40LVztuxsaekT4olbyZ7hm01H75mXmBdKafigihYvTA4
+89Pj4cqP0tnf9y0Lb1eeDsnNFpYK7MAwvif+aq9rmeDPws/Jfzj/S87Jv0D+dw5CW4rncDeffZcK
+CeiFa21YOhx9ntlWrlnQSFjaK3Kau5a8QWD+dy/A6oEgNeLAyy+5SrjnAwUcj4ZEFSC/z7+Pz7h5
+4C5kIHmaSMps7Av/4P6ARn9o7yq6JcGu6ae+hnMshhcd1KW09WfG01E1g/cRx4M6blj8w3c8GVmt
+RurgqF7NIBG2gh5rTFT3BK2uXIjO2kBAz6SkZi+41UB5rrkv1cKPeZDb2bkdYzw07PvFfn9FKuyy
+EbTzOFIMq0rGGo8h9HGIgm2tAt3Qiwv3ZdS5tNm6vMH73+Dn8zpnW66CPkuiCuQYcJd9NXiJ6a+8
+V+YqwD6woqWOxj5GjueUXi42x/FZ0MyTIlDQwgPulptX6BlSAu5JKNsBP70hB/6RurWF990YCHaS
+CHB547arnpTTecRf4c8ajgNYTbDef+ICA2jaDWN3AMgQAiL+WamseDUY7+j5H6RA6hAwhrnbI7u7
+QMQ5jAPNO95SJSleuaMADhdH3SDdvNxefZRy6FPihJTPJkk3YqqHVYgH4jymjhBQFgmvLMGB0250
+Sc2JpRfBKAoKA4BH9CUtLnJ+tbE/cvlPfzUuzGbrdEMf+lEwkuKB/LHTpmuloa4jXd+L3LJfpHS2
+USP5vFhwOkvdP2tG83OmIpIG5ilu1+l8F27NzIpoZPLNjAmRh1d6+gzYKpL/rwWFXgOqfhmnN6Gu
++L2Qt/oooPcoZOTjaPZYLrP0muIRetOZ7n0eZfk70uhHTMykaSvDxCm3SfsNdLejf3CZ+xVXFtiq
+TczY6z1NR4OSIBVHM8l5nbsQVB8CYE3Vy8FQFgzB1eeJTBWWuK0d+9DtXU2aopKul2Nf5RvrEyhw
+BDlvwnMOFzTWKBZUu+d/cpv1cxp2VwQYc3irMvjtfJqB3Nfhz2ZTuVnOTB8rMVg/fCbMUu6+OO16
+4nUh3UiHuSKfqArOZ+WIr3EoKke9Wq6q93W+r5nsnUNWeVLlrJCCx5NpCBHY7KfNiL9CNPL0JTv1
+4O4YLQHUeFzuqW8tGsCFljMOJeoCd38Vv9BHw95CdKzVevvi12qd4HUqEOLaMPGhvHzPwGkwqAVZ
+IW1AZBrVH8ynQrtpoyVc8HLCufBAIPF/yUPdsHOJ1V5uCQiwTjp1bMEZATu9M57oWo6b9BfYjIJC
+olGvFL1+eESpU4I1tizKn6jzU63N1S/nkj2s3wTxq76CQYMad84Bf4xuObIjYtdTt395epnFSJjz
+j4o5NW3jz7F2904tMQY5/4b4HIj6M6UFmioIQ1Et/Seh2o2IlYrS1CZFeGFZT3h24vwimrxEpgau
+mML78k503KPk1FEswKHTHXPuA9aGqJH+FcuJPGtYHTS/I9oTg9gcky2ASzW7ecNXw1ibGeazp8bA
+eIYTPUmyFReqfiVlefoAEnoqqW0iWGgshd7pCf4Yk64UUNzYUg3qfMI3hVJt8o5VvQoLxgDYTDBx
+trPSn20/oc55W3mH/dmGgMF4fKS7r+wm0u5rW/kQXG9FjCZjSGW0fBub5nnovXtYjQo6p79TBKhI
+2bA2RkST+5CxFaxrS1Pk0ClOwP5RvhPPdKVDTurP2s7aMOT9N6aQvF0QR/4pYExF4Q4SrGkZphm0
+5tPyJgOhsP8htuv9OH/uDHM7v2TsGSu1+2/dPv7SNOTfP0aAv67ytXcagtvl5L7cgY0CHcS57gB2
+mxIb+70E3xzEzx+PmZ1kLlObG+UaI4INajEZlmQo0eRKTj3wsHEyxb+mmjpvhSzw/jCpZncW7R9Y
+I1ai9YH4xTDb3nIJ5uhII6Xk48/0RApVBeJxAXur99zdwzRsqBKQepVZa20VoyMG+V0KtU4FcCMz
+SCZNQuiXZ0ymIJ/DDCoKSuaRdhqHeAXHol0b+qlpAQIOnhsyOuEXd61G3y2Q0okNrm6a7ONWpg3A
+Rx2KVGO9YoRQnXhpFhlYd15BgBZVhe4X2PlAsA8eL5EyeljPI/2yTnue2wkAqDAX0NL0b88x3mf7
+1tQ0ssYWdFmXyoy2XhiJ9sabsdup9lYydYXZDmmskzOR8Hz+DDFpnN1AHgUHJCyuRJU+wU3K8vuk
+yc31v9PB+IQhtVXLIP+Z5BOplKb9s7j0GW00lqBj0qYNywqnX1Y/++YDbT6l3RjZBIKAeEuLZzvF
+91NbkQfYkhJ6JEz+wk6Kz/LRE7sDXOy15lw/bcsrxFP9qCCt0PZkHhbTrVMAXKEZPabweQ0ym2mo
+VAXqYQI/9e92NtQhlOcXvqmXXRrfhq9KxO+z+i0AWGLlKd3krpaFkAg9gzXljYS71SlKSBsHFwm0
+tEC5EnLRCSad+77RkCzSGPgpVE5XoKkjfLe7bHiRp63QbnWGiwdon5at99xHE292HS/7oNUg6gc/
+pIXsDNcPQFw3ffmBKfMIKi24Ul53/9YCW203ZCK/aLpluuZfDp9ci3kCGWGMl4TWkuLaPBSgLrO8
+Ium/MgOv8mwIRH50RPkF9f6k098ebLgmxvJRVmxZ6p5Ic2i7eFpvESzzgByONcDCcnuqFc+6CmWJ
+nYKkg9alOoxW2GvLmw4dRNHCSKig9lbdufHqyTpMZ1orKOlb9fwErCxV2rQJZRcLtah136qU/b04
+wOOEi4vP5Go2Pf7fw8+/rcEDBrmZhVFI+dCoIKwcH3sWe19oT2OPmJTgOLutOYDRZOE49zjmDftv
+OedvgNCeeHBG/7qECH53J8cZ2rBHAcAuV4j8PVE4PcINPFNIE2s32bhhjNASbzVvwC5QCiPMzYqt
+vVWadPPZRHkgdcmKM3mRJysFBY5xvPW9pIefzUguhvrApozoul8DKRK1wzn8CooWfZxkXDsYcwBX
+qFP+0StkDO7QZCUFxn9C8aJad7OIFUKOZKwGBKxsmaQnYomyjububOj0bEp03KLQWMprnVBiYaTR
+U+vX4xDM10tkZ2OEn62EKVVhMBk/KnKOHuATRx0rtjb/EZg7YKVFbkHYpiSjgU1mXtoKYxVGN2lS
+DgWwKpwOQM4loj6cqJYILfQno93/3HzzsuV/0YAFmtWa6eZiQ6qCsXIN+laukp29mnc7InEf6zoN
+KRVAvap3jz0qxIF2HrxGRSi5dheEXh6gGMhRRJ743H1yTjuzPuzzk33FTvnTJbzeawjKoPN41VNn
+CjioiIxuPypcXkSfW1OqLN5oqH/3yvMep0d01hZQdosLwB1PxvQlp65Ie77hXQrAoGFbYZK2Fkce
+F1SUAgvOSaHQaFNpc2eXIHF5MwMfn+7+Ba0FYdC9zmDOiDxve+Yo+zLXxeBQPgNPKkbItVMIkUvW
+bpnkZ9ieCH7uJ4XzaEFyFVo+jgXIkl0VYuLjtS1nDyiG2OTfHQxyI3LhdDIUD4OLLViNLJP4oPjd
+pl7FWsyQ4/tuSMqpC7WqSlgLdWSRciOAvJT9wU8eJLCGjbXDC0lG2jcX0BbjB/zyiGjsKLMtH7AR
+JCob/R34hKL6oDT9Yr8qR9ZA1lWLY8d77XnAPHZ5SUtlyOegCYy6/TsL6IqZpk4SnFlRxM0N0G+f
+wRv0TnSQvfUpqwYgBO1D+BQT/96lVvktOBCOoiFKJUx4mCURE0bm5U5pwg0RO2+ZgVRxL3lqnOQO
++vD8agVyaKbRoqJtc2oQOlAzsxwuDdnIyr/5GoMRADxoAtioaA610kKoubKL6qG64mDy7/l7Y6bh
+TE2zeBle85Z9Pb2cGGlkUyQZ2hEcUhxetCSnGpV0jT88iLGP7e90oRqJWNudZ+fyvIPS2FgKcmNo
+cxkS6c0ePDwu9UUr+Db5kFBK0UsgXJ1mu/eIEEdZSQx3bzF1ECcDEMlbA19JJnkt35KEZ4zEzZmA
+yT7HWm0IPEKKvvQIucVjPtXbkhzowcL+33w9RsAj7opmFuYtROXByiH/JsCgVL53HPKCN0hCbqER
+oaO2GjS5sJ9xfJfG0C7XhjkrbBp84lDlUZ5xWuSA3GCJHjiMnFq2kVt3mWfE1BySsylKt5QIlBxV
+VZEzXJKZf/uXW5JIxQMZjxn4VvJm3vqgJ+Vo+5oi2v4D5ZojPPtYnzzHZajjtxvt9oqX/20saoD7
+ENgbqsUEXLMIBPDg3nQ4l4HM12b/R/jbxLF8qjaNHGaSzRiUCF7yiviECi1WiEL2tmbalTAaSHC5
+P4ixsTJ4dXbYajojc6QpXNuOSNUUZ64Vo4LTGQWoWOnajvx7JLAmkzJfm5UdnXhhvzXX5mS2Lt8f
+xngYf23/0i18As8tCME5IigItOl/p+5cYwcbIu2qYkwJqB3FBUJo0YQfSrXHtD2v+35ApAfHu75s
+tv9iPAECmIAYYagGW3e+zAZ/D0aXq4+odx2gNtyZeIbo7sePgo62mdqHUkc4fcotTgStITHEh+9r
+HjkECv1ZU5GUFNbncnraj+3cuCvgeWxTegn/Zp25Vgb+yLHYw6no/Q7wBm/K3NmDfNczeIo+6U3D
+EB0SDKbLhFrLjIkXvZyPFbu2o6PMvlctA76k7P2vmN3QgKPcABbQea4S9LDPi/AKu6N8reNFMzkP
+WyA1gQdXa/N7MzjtlIuKo3kE4YWcasXiEVODvD/DNvaLNrtEAJSOdgzwUYFwAAHUhQKWywZ/Egah
+scRn+wIAAAAABFla
+"""
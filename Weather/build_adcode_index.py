@@ -0,0 +1,107 @@
+"""
+将 AMap_adcode_citycode.xlsx 编译为 Weather.py 运行时使用的紧凑索引 adcode_index.tsv，
+并把压缩后的索引写入 Weather.py 末尾的 ADCODE_INDEX_DATA。
+
+仅在更新表格后需要重新运行（依赖 openpyxl、pypinyin，运行时不需要）：
+    python Weather/build_adcode_index.py
+
+输出每行一个行政区：名称<TAB>adcode<TAB>去后缀简称<TAB>简称拼音
+"""
+
+import base64
+import lzma
+import os
+import re
+
+from openpyxl import load_workbook
+from pypinyin import lazy_pinyin
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(HERE, "AMap_adcode_citycode.xlsx")
+TARGET = os.path.join(HERE, "adcode_index.tsv")
+WEATHER = os.path.join(HERE, "Weather.py")
+
+# pypinyin 按普通词语取音，地名中的多音字常被读错（朝阳 -> zhaoyang、宁都 -> ningdou）。
+# 这些字在地名里的读音固定，逐字覆盖
+CHAR_READINGS = {"朝": "chao", "长": "chang", "都": "du", "什": "shi"}
+# 逐字规则之外的个别地名读音
+NAME_READINGS = {
+    "长子": "zhangzi",
+    "繁峙": "fanshi",
+    "洪洞": "hongtong",
+    "闵行": "minhang",
+    "蚌山": "bengshan",
+    "涡阳": "guoyang",
+    "单县": "shanxian",
+    "浚县": "xunxian",
+    "召陵": "shaoling",
+    "覃塘": "qintang",
+    "筠连": "junlian",
+    "曾都": "zengdu",
+    "龙圩": "longxu",
+    "南乐": "nanle",
+    "民乐": "minle",
+    "阿勒泰": "aletai",
+}
+
+ETHNIC_GROUPS = (
+    "蒙古 回 藏 维吾尔 苗 彝 壮 布依 朝鲜 满 侗 瑶 白 土家 哈尼 哈萨克 傣 黎 傈僳 佤 畲 "
+    "高山 拉祜 水 东乡 纳西 景颇 柯尔克孜 土 达斡尔 仫佬 羌 布朗 撒拉 毛南 仡佬 锡伯 阿昌 "
+    "普米 塔吉克 怒 乌孜别克 俄罗斯 鄂温克 德昂 保安 裕固 京 塔塔尔 独龙 鄂伦春 赫哲 门巴 "
+    "珞巴 基诺 各"
+).split()
+ETHNIC_RE = "(?:" + "|".join(sorted(ETHNIC_GROUPS, key=len, reverse=True)) + ")族?"
+SUFFIX_RE = re.compile(
+    rf"^(.{{2,}}?)族?(?:{ETHNIC_RE})*"
+    r"(?:特别行政区|自治区|自治州|自治县|自治旗|地区|林区|新区|省|市|区|县|旗|盟)$"
+)
+
+
+def strip_region_suffix(name: str) -> str:
+    """去掉行政区划后缀及民族名，例如 延边朝鲜族自治州 -> 延边、北京市 -> 北京。"""
+    match = SUFFIX_RE.match(name)
+    return match.group(1) if match else name
+
+
+def place_pinyin(alias: str) -> str:
+    """地名简称的无声调拼音，修正常见多音字读音"""
+    if alias in NAME_READINGS:
+        return NAME_READINGS[alias]
+    readings = lazy_pinyin(alias)
+    if len(readings) == len(alias):
+        readings = [CHAR_READINGS.get(ch, py) for ch, py in zip(alias, readings)]
+    return "".join(readings)
+
+
+def embed(tsv: str) -> None:
+    """把索引压缩为 base64 写入 Weather.py 的 ADCODE_INDEX_DATA"""
+    data = base64.encodebytes(lzma.compress(tsv.encode("utf-8"), preset=9)).decode("ascii")
+    with open(WEATHER, encoding="utf-8") as f:
+        source = f.read()
+    start = source.index('ADCODE_INDEX_DATA = """') + len('ADCODE_INDEX_DATA = """')
+    end = source.index('"""', start)
+    with open(WEATHER, "w", encoding="utf-8", newline="\n") as f:
+        f.write(source[:start] + "\n" + data + source[end:])
+
+
+def main() -> None:
+    sheet = load_workbook(SOURCE, read_only=True).worksheets[0]
+    rows = []
+    for name, adcode, _citycode in sheet.iter_rows(min_row=2, values_only=True):
+        if not name or not adcode:
+            continue
+        name = str(name).strip()
+        adcode = str(adcode).strip()
+        alias = strip_region_suffix(name)
+        pinyin = place_pinyin(alias)
+        rows.append(f"{name}\t{adcode}\t{alias}\t{pinyin}")
+
+    tsv = "\n".join(rows) + "\n"
+    with open(TARGET, "w", encoding="utf-8", newline="\n") as f:
+        f.write(tsv)
+    embed(tsv)
+    print(f"wrote {len(rows)} entries to {TARGET} and {WEATHER}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure Calculator cold-start cost and per-call latency of each evaluation path.
+
+Cold start loads Calculator.py in a fresh interpreter and reports the load
+time, peak RSS and whether SymPy ended up imported, next to a bare
+`import sympy` for reference (what every load paid before SymPy was lazy).
+
+Per-call latency covers the in-process fast path, memoized hits, SymPy in
+the sandbox pool and SymPy inline, all on plain arithmetic.
+
+Usage:
+    python benchmarks/calculator_latency.py [--calls 200]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TOOL_PATH = ROOT / "Calculator.py"
+
+EXPRESSIONS = ["23.5*1.08+12", "(1+0.05/12)**360", "sqrt(2)*pi/4", "1234*5678-91/3"]
+
+COLD_START = """
+import importlib.util, json, resource, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "sympy": "sympy" in sys.modules,
+}}))
+"""
+
+LOAD_TOOL = f"""
+spec = importlib.util.spec_from_file_location("calculator", {str(TOOL_PATH)!r})
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+tools = mod.Tools()
+"""
+
+
+def cold_start(body: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(body=body)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def load_tool():
+    spec = importlib.util.spec_from_file_location("calculator", TOOL_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+async def measure(tools, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        await tools.calculator(EXPRESSIONS[i % len(EXPRESSIONS)])
+    return (time.perf_counter() - start) / calls * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'cold start':<34}{'ms':>10}{'peak RSS MB':>14}{'sympy':>8}")
+    for label, body in (("import sympy", "import sympy"), ("load Calculator.py", LOAD_TOOL)):
+        result = cold_start(body)
+        print(f"{label:<34}{result['ms']:>10.1f}{result['rss_mb']:>14.1f}{str(result['sympy']):>8}")
+
+    mod = load_tool()
+    cases = (
+        ("fast path", dict(FAST_PATH_ENABLED=True, CACHE_SIZE=0)),
+        ("fast path + memoized", dict(FAST_PATH_ENABLED=True, CACHE_SIZE=256)),
+        ("sympy (sandbox pool)", dict(FAST_PATH_ENABLED=False, CACHE_SIZE=0)),
+        ("sympy (inline)", dict(FAST_PATH_ENABLED=False, CACHE_SIZE=0, SANDBOX_ENABLED=False)),
+    )
+    print()
+    print(f"{'per call':<34}{'ms/call':>10}")
+    for label, valves in cases:
+        tools = mod.Tools()
+        for name, value in valves.items():
+            setattr(tools.valves, name, value)
+        # Warm up: starts the pool and imports SymPy where needed
+        await measure(tools, len(EXPRESSIONS))
+        print(f"{label:<34}{await measure(tools, args.calls):>10.4f}")
+
+    if mod._pool is not None:
+        mod._pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
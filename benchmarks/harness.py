@@ -0,0 +1,249 @@
+"""
+Shared pieces for the benchmarks: loading extensions against the stub
+open_webui package, fake event emitters, local fake backends and the
+latency / throughput / peak-memory measurements.
+"""
+
+import asyncio
+import importlib.util
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+STUBS = Path(__file__).resolve().parent / "stubs"
+RUNTIME = ROOT / "Runtime"
+
+
+def install_stubs() -> None:
+    """Make the stub open_webui package and the shared runtime importable."""
+    for path in (str(RUNTIME), str(STUBS)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def load_extension(relpath: str, name: Optional[str] = None) -> ModuleType:
+    """Load an extension file the way Open WebUI does: as a fresh module."""
+    install_stubs()
+    path = ROOT / relpath
+    name = name or path.stem.replace("-", "_").lower()
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class EventRecorder:
+    """Fake __event_emitter__ / __event_call__ that counts what it receives."""
+
+    def __init__(self, keep: bool = False):
+        self.keep = keep
+        self.count = 0
+        self.events: list[dict] = []
+
+    async def __call__(self, event: dict) -> None:
+        self.count += 1
+        if self.keep:
+            self.events.append(event)
+
+    async def call(self, event: dict) -> bool:
+        await self(event)
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Fake backends
+# ---------------------------------------------------------------------------
+
+AMAP_LIVE = {
+    "province": "北京",
+    "city": "东城区",
+    "weather": "晴",
+    "temperature": "21",
+    "winddirection": "南",
+    "windpower": "≤3",
+    "humidity": "40",
+    "reporttime": "2026-10-18 10:00:00",
+}
+
+
+def amap_forecast(adcode: str) -> dict:
+    return {
+        "city": "北京市",
+        "adcode": adcode,
+        "province": "北京",
+        "reporttime": "2026-10-18 08:00:00",
+        "casts": [
+            {
+                "date": f"2026-10-{18 + i}",
+                "week": str(i + 1),
+                "dayweather": "晴",
+                "nightweather": "多云",
+                "daytemp": "22",
+                "nighttemp": "10",
+                "daywind": "北",
+                "nightwind": "北",
+                "daypower": "1-3",
+                "nightpower": "1-3",
+            }
+            for i in range(4)
+        ],
+    }
+
+
+class FakeBackends:
+    """
+    One local aiohttp server standing in for the remote services:
+
+    - GET  /v3/weather/weatherInfo   AMap weather API
+    - POST /api/v1/chat/completions  OpenAI-style SSE stream
+    - GET  /page                     an HTML article of PAGE_PARAGRAPHS paragraphs,
+                                     with an ETag (304 for a matching If-None-Match)
+
+    `latency` is added before every response.
+    """
+
+    SSE_CHUNKS = 40
+    PAGE_PARAGRAPHS = 400
+    PAGE_ETAG = '"bench-page"'
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.base_url = ""
+        self._runner = None
+        self.page = (
+            "<html><head><title>Bench Page</title></head><body>"
+            + "".join(
+                f"<p>Paragraph {i}: the quick brown fox jumps over the lazy dog.</p>"
+                for i in range(self.PAGE_PARAGRAPHS)
+            )
+            + "</body></html>"
+        )
+
+    async def _amap(self, request):
+        from aiohttp import web
+
+        await asyncio.sleep(self.latency)
+        adcode = request.query.get("city", "")
+        if not adcode.isdigit():
+            return web.json_response(
+                {"status": "0", "info": "INVALID_PARAMS", "infocode": "20000"}
+            )
+        data = {"status": "1", "count": "1", "info": "OK", "infocode": "10000"}
+        if request.query.get("extensions") == "all":
+            data["forecasts"] = [amap_forecast(adcode)]
+        else:
+            data["lives"] = [{**AMAP_LIVE, "adcode": adcode}]
+        return web.json_response(data)
+
+    async def _chat(self, request):
+        from aiohttp import web
+
+        await request.read()
+        await asyncio.sleep(self.latency)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i in range(self.SSE_CHUNKS):
+            delta = {"reasoning": "thinking "} if i < self.SSE_CHUNKS // 4 else {"content": "token "}
+            chunk = {"choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        done = {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        await response.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode())
+        await response.write_eof()
+        return response
+
+    async def _page(self, request):
+        from aiohttp import web
+
+        await asyncio.sleep(self.latency)
+        headers = {"ETag": self.PAGE_ETAG}
+        if request.headers.get("If-None-Match") == self.PAGE_ETAG:
+            return web.Response(status=304, headers=headers)
+        return web.Response(text=self.page, content_type="text/html", headers=headers)
+
+    async def __aenter__(self) -> "FakeBackends":
+        from aiohttp import web
+
+        app = web.Application()
+        app.add_routes(
+            [
+                web.get("/v3/weather/weatherInfo", self._amap),
+                web.post("/api/v1/chat/completions", self._chat),
+                web.get("/page", self._page),
+            ]
+        )
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._runner.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]],
+    calls: int = 200,
+    concurrency: int = 16,
+    memory_calls: int = 50,
+) -> dict[str, float]:
+    """
+    Measure one benchmark case:
+
+    - latency: `calls` sequential calls, in milliseconds
+    - throughput: `calls` calls with at most `concurrency` in flight, per second
+    - peak_kb: peak Python allocations (tracemalloc) over `memory_calls`
+      calls at the same concurrency, above what was allocated before
+    """
+    # Warm up caches, pools and lazy imports so they don't count against latency
+    for _ in range(3):
+        await call()
+
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> None:
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited() for _ in range(calls)))
+    throughput = calls / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    await asyncio.gather(*(limited() for _ in range(memory_calls)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": percentile(samples, 0.5),
+        "p95_ms": percentile(samples, 0.95),
+        "throughput": throughput,
+        "peak_kb": max(0, peak - base) / 1024,
+    }
@@ -0,0 +1,372 @@
+"""
+Benchmark the extensions outside Open WebUI and compare against a baseline.
+
+Each case loads its extension against the stub open_webui package
+(benchmarks/stubs) and the local fake backends in harness.py (AMap, an
+OpenAI-style SSE endpoint and an HTML page), then reports mean/p50/p95
+latency, throughput at the given concurrency and peak Python memory.
+
+Every run also times a fixed pure-Python reference workload. Baselines store
+latency and throughput as ratios to it (peak memory stays in KB), so a
+baseline recorded on one machine can be compared on another.
+
+Cases that count tokens need tiktoken's cl100k_base file. They are skipped
+when it is not cached (set TIKTOKEN_CACHE_DIR to a directory holding it), so
+the suite never downloads anything.
+
+Usage:
+    python benchmarks/run.py [--cases weather,openrouter] [--calls 200] [--concurrency 16]
+    python benchmarks/run.py --save             # write benchmarks/baselines/default.json
+    python benchmarks/run.py --compare          # flag regressions against it
+"""
+
+import argparse
+import asyncio
+import hashlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from harness import EventRecorder, FakeBackends, install_stubs, load_extension, measure
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "default.json"
+
+# Metrics where a larger value is worse; throughput is the opposite
+HIGHER_IS_WORSE = ("mean_ms", "p95_ms", "peak_kb")
+
+REFERENCE = "reference"
+CL100K_URL = "https://openaipublic.blob.core.windows.net/encodings/cl100k_base.tiktoken"
+
+CHAT = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    *(
+        message
+        for i in range(5)
+        for message in (
+            {"role": "user", "content": f"Question {i}: how does connection pooling reduce latency? " * 4},
+            {"role": "assistant", "content": f"Answer {i}: it reuses TCP and TLS sessions. " * 12},
+        )
+    ),
+    {"role": "user", "content": "Summarise the discussion so far."},
+]
+
+
+class Env:
+    """State shared by the cases of one run."""
+
+    def __init__(self, backends: FakeBackends):
+        self.backends = backends
+        self.cleanups: list[Callable[[], Any]] = []
+
+
+Case = Callable[[Env], Awaitable[Callable[[], Awaitable[Any]]]]
+
+
+async def reference(env: Env):
+    """Fixed CPU-bound workload that the other cases are measured against."""
+
+    async def call():
+        for _ in range(20):
+            json.loads(json.dumps(CHAT))
+
+    return call
+
+
+async def live_token_inlet(env: Env):
+    mod = load_extension("Live-Token.py")
+    filt = mod.Filter()
+    emitter = EventRecorder()
+    return lambda: filt.inlet({"model": "gpt-4", "messages": CHAT}, emitter)
+
+
+async def live_token_outlet(env: Env):
+    mod = load_extension("Live-Token.py")
+    filt = mod.Filter()
+    emitter = EventRecorder()
+    await filt.inlet({"model": "gpt-4", "messages": CHAT}, emitter)
+    body = {
+        "model": "gpt-4",
+        "messages": CHAT + [{"role": "assistant", "content": "Pooling keeps connections warm. " * 30}],
+    }
+    return lambda: filt.outlet(body, emitter)
+
+
+async def time_inject_inlet(env: Env):
+    mod = load_extension("Time-Inject-Filter.py")
+    filt = mod.Filter()
+
+    async def call():
+        return filt.inlet({"messages": [dict(m) for m in CHAT]})
+
+    return call
+
+
+async def history_compaction_inlet(env: Env):
+    mod = load_extension("History-Compaction.py")
+    filt = mod.Filter()
+    filt.valves.trigger_tokens = 500
+    filt.valves.keep_turns = 2
+    metadata = {"chat_id": "bench"}
+    # Summarize once up front so the timed inlet takes the compaction path
+    await filt.outlet({"model": "gpt-4", "messages": CHAT}, {"id": "bench"}, metadata)
+    await asyncio.gather(*filt._tasks)
+
+    async def call():
+        return filt.inlet({"model": "gpt-4", "messages": list(CHAT)}, {"id": "bench"}, metadata)
+
+    return call
+
+
+async def tool_result_digest_inlet(env: Env):
+    mod = load_extension("Tool-Result-Digest.py")
+    filt = mod.Filter()
+    search = json.dumps(
+        {
+            "status": "web search completed successfully!",
+            "result_count": 5,
+            "results": [
+                {
+                    "source": f"https://example.com/{i}",
+                    "title": f"Connection pooling {i}",
+                    "content": "Reusing connections cut p95 latency by 38% across 1,200 requests. " * 12,
+                }
+                for i in range(5)
+            ],
+        }
+    )
+    messages = list(CHAT[:-1])
+    for i in range(6):
+        messages += [
+            {"role": "user", "content": f"Search step {i}"},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": f"call_{i}", "function": {"name": "web_search"}}]},
+            {"role": "tool", "tool_call_id": f"call_{i}", "content": search.replace("pooling", f"pooling step {i}")},
+            {"role": "assistant", "content": f"Step {i} done."},
+        ]
+    messages.append(CHAT[-1])
+    filt.outlet({"model": "gpt-4", "messages": messages})
+
+    async def call():
+        return filt.inlet({"model": "gpt-4", "messages": list(messages)})
+
+    return call
+
+
+def _calculator(expression: str) -> Case:
+    async def case(env: Env):
+        mod = load_extension("Calculator.py")
+        tools = mod.Tools()
+        tools.valves.CACHE_SIZE = 0
+        env.cleanups.append(lambda: mod._pool and mod._pool.close())
+        return lambda: tools.calculator(expression)
+
+    return case
+
+
+def _weather(cached: bool) -> Case:
+    async def case(env: Env):
+        mod = load_extension("Weather/Weather.py")
+        mod.AMAP_WEATHER_URL = f"{env.backends.base_url}/v3/weather/weatherInfo"
+        tools = mod.Tools()
+        tools.valves.AMAP_API_KEY = "bench"
+        tools.valves.QPS_LIMIT = 0
+        tools.valves.CACHE_ENABLED = cached
+        emitter = EventRecorder()
+        return lambda: tools.get_weather("杭州", __event_emitter__=emitter)
+
+    return case
+
+
+async def openrouter_pipe(env: Env):
+    mod = load_extension("OpenRouter/OpenRouter-Reasoning.py")
+    pipe = mod.Pipe()
+    pipe.valves.base_url = f"{env.backends.base_url}/api/v1"
+    pipe.valves.api_key = "bench"
+    user = {"id": "bench", "valves": mod.Pipe.UserValves()}
+    body = {"model": "openrouter.openai/gpt-5.2", "messages": CHAT}
+
+    async def call():
+        async for _ in pipe._pipe(body=body, __user__=user, __request__=None):
+            pass
+
+    return call
+
+
+async def web_search(env: Env):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    tools = mod.Tools()
+    emitter = EventRecorder()
+    return lambda: tools.web_search(
+        search_queries=["connection pooling", "http keep-alive", "tls resumption"],
+        __event_emitter__=emitter,
+        __user__={"id": "bench"},
+    )
+
+
+async def fetch_url_content(env: Env):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    tools = mod.Tools()
+    tools.valves.PAGE_CACHE_ENABLED = False
+    tools.valves.FETCH_MODE = "passages"
+    tools.valves.FETCH_LOADER = "streaming"
+    emitter = EventRecorder()
+    return lambda: tools.fetch_url_content(
+        f"{env.backends.base_url}/page",
+        focus="lazy dog",
+        __event_emitter__=emitter,
+        __user__={"id": "bench"},
+    )
+
+
+CASES: dict[str, Case] = {
+    REFERENCE: reference,
+    "live_token.inlet": live_token_inlet,
+    "live_token.outlet": live_token_outlet,
+    "time_inject.inlet": time_inject_inlet,
+    "history_compaction.inlet": history_compaction_inlet,
+    "tool_result_digest.inlet": tool_result_digest_inlet,
+    "calculator.arithmetic": _calculator("(1+0.05/12)**360*2500"),
+    "calculator.symbolic": _calculator("diff(sin(x)*x**2, x)"),
+    "weather.get_weather": _weather(cached=False),
+    "weather.get_weather.cached": _weather(cached=True),
+    "openrouter.pipe": openrouter_pipe,
+    "web_search.web_search": web_search,
+    "web_search.fetch_url_content": fetch_url_content,
+}
+
+# Cases that load a tiktoken encoding
+TIKTOKEN_CASES = ("live_token.", "history_compaction.", "tool_result_digest.")
+
+
+def tiktoken_cached() -> bool:
+    """Whether cl100k_base can be loaded without a download (same lookup as tiktoken)."""
+    if importlib.util.find_spec("tiktoken") is None:
+        return False
+    cache_dir = os.environ.get(
+        "TIKTOKEN_CACHE_DIR",
+        os.environ.get("DATA_GYM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "data-gym-cache")),
+    )
+    if not cache_dir:
+        return False
+    return os.path.exists(os.path.join(cache_dir, hashlib.sha1(CL100K_URL.encode()).hexdigest()))
+
+
+def relative(results: dict) -> dict:
+    """Express latency and throughput as ratios to the reference case."""
+    ref = results[REFERENCE]
+    return {
+        name: {
+            "mean_ms": r["mean_ms"] / ref["mean_ms"],
+            "p95_ms": r["p95_ms"] / ref["mean_ms"],
+            "throughput": r["throughput"] / ref["throughput"],
+            "peak_kb": r["peak_kb"],
+        }
+        for name, r in results.items()
+        if name != REFERENCE
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print the change of the relative results against the baseline; return the regressed cases."""
+    regressions = []
+    print()
+    print(f"{'vs baseline':<32}{'mean':>10}{'p95':>10}{'ops/s':>10}{'peak':>10}")
+    for name, current in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:<32}{'(new)':>10}")
+            continue
+        cells = []
+        regressed = False
+        for key in ("mean_ms", "p95_ms", "throughput", "peak_kb"):
+            change = (current[key] - before[key]) / before[key] if before[key] else 0.0
+            worse = change > tolerance if key in HIGHER_IS_WORSE else change < -tolerance
+            regressed = regressed or worse
+            cells.append(f"{change:+.0%}{'!' if worse else ''}")
+        print(f"{name:<32}" + "".join(f"{c:>10}" for c in cells))
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cases", default="", help="comma-separated case names or prefixes")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added by the fake backends")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare with the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative change")
+    args = parser.parse_args()
+
+    prefixes = [p.strip() for p in args.cases.split(",") if p.strip()]
+    selected = [name for name in CASES if not prefixes or name.startswith(tuple(prefixes))]
+    if not selected:
+        parser.error(f"no case matches {args.cases!r}; available: {', '.join(CASES)}")
+    if not tiktoken_cached():
+        skipped = [name for name in selected if name.startswith(TIKTOKEN_CASES)]
+        if skipped:
+            print(f"cl100k_base is not cached, skipping: {', '.join(skipped)}\n")
+        selected = [name for name in selected if name not in skipped]
+    if REFERENCE in selected:
+        selected.remove(REFERENCE)
+    selected.insert(0, REFERENCE)
+
+    os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="owui-bench-"))
+    install_stubs()
+    import owui_runtime
+
+    results: dict[str, dict] = {}
+    print(f"{'case':<32}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'ops/s':>10}{'peak KB':>10}")
+    async with FakeBackends(latency=args.latency) as backends:
+        env = Env(backends)
+        for name in selected:
+            call = await CASES[name](env)
+            r = results[name] = await measure(call, args.calls, args.concurrency)
+            print(
+                f"{name:<32}{r['mean_ms']:>10.3f}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}"
+                f"{r['throughput']:>10.0f}{r['peak_kb']:>10.0f}"
+            )
+        for cleanup in env.cleanups:
+            cleanup()
+        await owui_runtime.aclose_http_clients()
+
+    status = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"\nno baseline at {args.baseline}; run with --save first")
+            status = 1
+        else:
+            baseline = json.loads(args.baseline.read_text())
+            regressions = compare(relative(results), baseline, args.tolerance)
+            if regressions:
+                print(f"\nregressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+                status = 1
+
+    if args.save:
+        saved = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        saved["meta"] = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calls": args.calls,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "reference": {k: round(v, 4) for k, v in results[REFERENCE].items()},
+        }
+        saved.setdefault("results", {}).update(
+            {name: {k: round(v, 4) for k, v in r.items()} for name, r in relative(results).items()}
+        )
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(saved, indent=2, sort_keys=True) + "\n")
+        print(f"\nsaved {len(results) - 1} cases to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
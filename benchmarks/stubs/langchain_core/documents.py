@@ -0,0 +1,7 @@
+from typing import Any, Optional
+
+
+class Document:
+    def __init__(self, page_content: str, metadata: Optional[dict[str, Any]] = None):
+        self.page_content = page_content
+        self.metadata = metadata or {}
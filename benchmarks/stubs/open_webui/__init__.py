@@ -0,0 +1,8 @@
+"""
+Minimal stand-in for the parts of Open WebUI the extensions import, so they
+can be loaded and benchmarked outside a live install.
+
+Only the names the extensions use exist. Backend calls return canned data
+after an optional LATENCY (seconds) set on each module, which stands in for
+database or search round-trips.
+"""
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+DATA_DIR = os.environ.get("DATA_DIR") or os.path.join(
+    tempfile.gettempdir(), "open_webui_stub"
+)
+GLOBAL_LOG_LEVEL = os.environ.get("GLOBAL_LOG_LEVEL", "WARNING")
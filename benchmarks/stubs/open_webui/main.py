@@ -0,0 +1,10 @@
+from types import SimpleNamespace
+
+
+class Request:
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.app = scope.get("app")
+
+
+app = SimpleNamespace(state=SimpleNamespace(config=SimpleNamespace()))
@@ -0,0 +1,21 @@
+import time
+from types import SimpleNamespace
+from typing import Optional
+
+LATENCY = 0.0
+
+# chat_id -> {"title": ..., "meta": {"tags": [...]}}, filled in by benchmarks as needed
+CHATS: dict[str, dict] = {}
+
+
+class Chats:
+    @staticmethod
+    def get_chat_by_id(id: str) -> Optional[SimpleNamespace]:
+        if LATENCY:
+            time.sleep(LATENCY)
+        chat = CHATS.get(id)
+        if chat is None:
+            return None
+        return SimpleNamespace(
+            id=id, title=chat.get("title", ""), meta=chat.get("meta", {}), chat=chat
+        )
@@ -0,0 +1,21 @@
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+LATENCY = 0.0
+
+
+class UserModel(BaseModel):
+    id: str
+    name: str = "Bench User"
+    email: str = "bench@example.com"
+    role: str = "user"
+
+
+class Users:
+    @staticmethod
+    def get_user_by_id(id: str) -> Optional[UserModel]:
+        if LATENCY:
+            time.sleep(LATENCY)
+        return UserModel(id=id)
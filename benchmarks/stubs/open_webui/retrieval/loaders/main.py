@@ -0,0 +1,12 @@
+from langchain_core.documents import Document
+
+
+class Loader:
+    def __init__(self, engine: str = "", **kwargs):
+        self.engine = engine
+        self.kwargs = kwargs
+
+    def load(self, filename: str, file_content_type: str, file_path: str) -> list[Document]:
+        with open(file_path, "rb") as f:
+            text = f.read().decode("utf-8", errors="replace")
+        return [Document(page_content=text, metadata={"content_type": file_content_type})]
@@ -0,0 +1,19 @@
+import time
+
+from langchain_core.documents import Document
+
+LATENCY = 0.0
+SECTIONS = 8
+
+
+def get_content_from_url(request, url: str) -> tuple[str, list[Document]]:
+    if LATENCY:
+        time.sleep(LATENCY)
+    docs = [
+        Document(
+            page_content=f"Section {i} of {url}. " + "Lorem ipsum dolor sit amet. " * 40,
+            metadata={"source": url, "title": "Stub Page"},
+        )
+        for i in range(SECTIONS)
+    ]
+    return "\n\n".join(doc.page_content for doc in docs), docs
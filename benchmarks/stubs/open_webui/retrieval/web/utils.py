@@ -0,0 +1,17 @@
+import ipaddress
+import socket
+from urllib.parse import urlparse
+
+# The fake backends listen on 127.0.0.1, so local fetches are allowed here
+ENABLE_RAG_LOCAL_WEB_FETCH = True
+
+
+def validate_url(url: str) -> bool:
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("Oops! The URL you provided is invalid. Please double-check and try again.")
+    if not ENABLE_RAG_LOCAL_WEB_FETCH:
+        for info in socket.getaddrinfo(parsed.hostname, None):
+            if not ipaddress.ip_address(info[4][0]).is_global:
+                raise ValueError("Oops! The URL you provided is invalid. Please double-check and try again.")
+    return True
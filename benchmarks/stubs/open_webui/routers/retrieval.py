@@ -0,0 +1,27 @@
+import asyncio
+
+from pydantic import BaseModel
+
+LATENCY = 0.0
+RESULTS_PER_QUERY = 5
+
+
+class SearchForm(BaseModel):
+    queries: list[str]
+
+
+async def process_web_search(request, form_data: SearchForm, user=None) -> dict:
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+    return {
+        "status": True,
+        "items": [
+            {
+                "link": f"https://example.com/{query}/{i}",
+                "title": f"{query} result {i}",
+                "snippet": f"Snippet about {query}. " * 10,
+            }
+            for query in form_data.queries
+            for i in range(RESULTS_PER_QUERY)
+        ],
+    }
@@ -0,0 +1,27 @@
+import asyncio
+import json
+
+LATENCY = 0.0
+
+RESPONSE = {
+    "title": "Stub Title",
+    "tags": ["General"],
+    "follow_ups": ["What else?"],
+}
+
+
+async def generate_chat_completion(request, form_data: dict, user=None, bypass_filter=False) -> dict:
+    if LATENCY:
+        await asyncio.sleep(LATENCY)
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "model": form_data.get("model", ""),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(RESPONSE)},
+                "finish_reason": "stop",
+            }
+        ],
+    }
@@ -0,0 +1,109 @@
+"""
+Compare the token cost of the Weather tool's json and compact output formats.
+
+Sample AMap responses are rendered through Tools._render_weather and the
+batch formatter in both OUTPUT_FORMAT modes, then counted with tiktoken.
+
+Usage:
+    python benchmarks/weather_output_tokens.py [--encoding cl100k_base]
+"""
+
+import argparse
+import asyncio
+
+import tiktoken
+
+from harness import load_extension
+
+LIVE = {
+    "status": "1",
+    "count": "1",
+    "info": "OK",
+    "infocode": "10000",
+    "lives": [
+        {
+            "province": "北京",
+            "city": "东城区",
+            "adcode": "110101",
+            "weather": "晴",
+            "temperature": "21",
+            "winddirection": "南",
+            "windpower": "≤3",
+            "humidity": "40",
+            "reporttime": "2026-10-18 10:00:00",
+        }
+    ],
+}
+
+FORECAST = {
+    "status": "1",
+    "count": "1",
+    "info": "OK",
+    "infocode": "10000",
+    "forecasts": [
+        {
+            "city": "北京市",
+            "adcode": "110000",
+            "province": "北京",
+            "reporttime": "2026-10-18 08:00:00",
+            "casts": [
+                {
+                    "date": f"2026-10-{18 + i}",
+                    "week": str((5 + i) % 7 + 1),
+                    "dayweather": ("晴", "多云", "小雨", "阴")[i],
+                    "nightweather": ("多云", "多云", "阴", "晴")[i],
+                    "daytemp": str(22 - i),
+                    "nighttemp": str(10 - i),
+                    "daywind": "北",
+                    "nightwind": ("北", "东北", "北", "西北")[i],
+                    "daypower": "1-3",
+                    "nightpower": "1-3",
+                }
+                for i in range(4)
+            ],
+        }
+    ],
+}
+
+
+def load_tool():
+    return load_extension("Weather/Weather.py")
+
+
+async def render_batch(tools, forecast: bool) -> str:
+    async def query_weather(city, forecast):
+        return (FORECAST if forecast else LIVE), []
+
+    tools.valves.AMAP_API_KEY = "bench"
+    tools._query_weather = query_weather
+    return await tools.get_weather_batch(["北京", "上海", "广州", "深圳"], forecast)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--encoding", default="cl100k_base")
+    args = parser.parse_args()
+
+    enc = tiktoken.get_encoding(args.encoding)
+    mod = load_tool()
+
+    outputs = {}
+    for fmt in ("json", "compact"):
+        tools = mod.Tools()
+        tools.valves.OUTPUT_FORMAT = fmt
+        outputs[fmt] = {
+            "live": tools._render_weather(LIVE, False, []),
+            "forecast (4 days)": tools._render_weather(FORECAST, True, []),
+            "batch live (4 cities)": await render_batch(tools, False),
+            "batch forecast (4 cities)": await render_batch(tools, True),
+        }
+
+    print(f"{'case':<28}{'json':>8}{'compact':>10}{'saved':>8}")
+    for case in outputs["json"]:
+        before = len(enc.encode(outputs["json"][case]))
+        after = len(enc.encode(outputs["compact"][case]))
+        print(f"{case:<28}{before:>8}{after:>10}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
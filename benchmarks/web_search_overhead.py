@@ -0,0 +1,72 @@
+"""
+Measure the fixed per-call overhead of the Auto-Web-Search tools.
+
+The tool runs against the stub open_webui package (benchmarks/stubs): user
+lookups sleep for DB_LATENCY seconds to stand in for the database
+round-trip, and search/fetch return immediately, so the timings only cover
+what the tool itself does around the backend call.
+
+Usage:
+    python benchmarks/web_search_overhead.py [--calls 200] [--db-latency 0.002]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from harness import install_stubs, load_extension
+
+
+def load_tool(db_latency: float, data_dir: str):
+    os.environ["DATA_DIR"] = data_dir
+    install_stubs()
+    from open_webui.models import users
+
+    users.LATENCY = db_latency
+    return load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+
+
+async def measure(tools, name: str, calls: int, **kwargs) -> tuple[float, float]:
+    events = 0
+
+    async def emitter(event):
+        nonlocal events
+        events += 1
+
+    method = getattr(tools, name)
+    start = time.perf_counter()
+    for _ in range(calls):
+        await method(__event_emitter__=emitter, __user__={"id": "bench"}, **kwargs)
+    elapsed = time.perf_counter() - start
+    return elapsed / calls * 1000, events / calls
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--db-latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        mod = load_tool(args.db_latency, data_dir)
+
+        print(f"{'case':<44}{'ms/call':>10}{'events/call':>14}")
+        for label, ttl in (("uncached user lookup", 0.0), ("cached user lookup", 5.0)):
+            tools = mod.Tools()
+            tools.valves.USER_CACHE_TTL = ttl
+            tools.valves.PAGE_CACHE_ENABLED = False
+            tools.valves.SEARCH_MODE = "batch"
+            tools.valves.FETCH_LOADER = "native"
+            cases = (
+                ("web_search", {"search_queries": ["alpha", "beta", "gamma"]}),
+                ("fetch_url_content", {"url": "https://example.com/page"}),
+            )
+            for name, kwargs in cases:
+                ms, events = await measure(tools, name, args.calls, **kwargs)
+                print(f"{name + ' / ' + label:<44}{ms:>10.3f}{events:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
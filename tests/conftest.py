@@ -0,0 +1,34 @@
+"""
+Behaviour tests for the extensions.
+
+Like the benchmarks, the tests load each extension file against the stub
+open_webui package (benchmarks/stubs) and talk to the local fake backends in
+benchmarks/harness.py, so they run without Open WebUI or network access.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="owui-tests-"))
+
+from harness import install_stubs, load_extension  # noqa: E402
+from run import tiktoken_cached  # noqa: E402
+
+install_stubs()
+
+# Token counting needs tiktoken's cl100k_base file; never download it here
+requires_cl100k = pytest.mark.skipif(
+    not tiktoken_cached(), reason="cl100k_base is not in the tiktoken cache"
+)
+
+
+@pytest.fixture
+def standalone(monkeypatch):
+    """Load extensions as if pasted into Open WebUI without the shared runtime."""
+    monkeypatch.setitem(sys.modules, "owui_runtime", None)
+    return load_extension
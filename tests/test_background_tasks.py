@@ -0,0 +1,155 @@
+"""Background-Tasks: local titles and tags, and one model call shared by all three tasks."""
+
+import asyncio
+import json
+
+import pytest
+from harness import load_extension
+from open_webui.models import chats
+
+mod = load_extension("Background-Tasks/Background-Tasks.py")
+
+
+def user(text):
+    return {"role": "user", "content": text}
+
+
+def assistant(text):
+    return {"role": "assistant", "content": text}
+
+
+@pytest.mark.parametrize(
+    "text, title",
+    [
+        ("你好", "日常问候"),
+        ("hello!", "Greeting"),
+        ("<details>thinking</details>hi", "Greeting"),
+        ("请问如何学习Python编程呢？", "如何学习Python编程"),
+        ("How do I reverse a list in Python?", "Reverse a List in Python"),
+        ("Can you explain transformers?", "Explain Transformers"),
+        # Repeated phrases are used once, and sentence punctuation is dropped
+        (
+            "I am building a Docker image for my Flask app and the Docker build keeps failing "
+            "when pip installs numpy on Alpine Linux. What should I do about the Docker build?",
+            "Docker Build Keeps Alpine Linux",
+        ),
+    ],
+)
+def test_local_title(text, title):
+    assert mod.local_title([user(text)])[0] == title
+
+
+def test_local_title_of_long_chinese_text_needs_jieba():
+    pytest.importorskip("jieba")
+    title, confidence = mod.local_title(
+        [user("我在用Python写一个爬虫，遇到了反爬机制，请求总是被服务器拒绝，返回403错误，应该怎么处理比较好？")]
+    )
+    assert title and "爬虫" in title and confidence >= 0.6
+
+
+def test_local_title_gives_up_on_empty_or_long_text():
+    assert mod.local_title([user("")]) == (None, 0.0)
+    assert mod.local_title([user("word " * 200)])[0] is None
+
+
+def test_local_tags():
+    assert mod.local_tags([user("python报错")]) == (["通用"], 1.0)
+    assert mod.local_tags(
+        [user("My code is in python."), assistant("Which python version? Check the bug."), user("The bug is in git.")]
+    ) == (["技术", "编程"], 1.0)
+    # Two domains of similar weight: low confidence, left to the model
+    tags, confidence = mod.local_tags([user("推荐一部电影"), assistant("可以看这部电影"), user("还有股票呢")])
+    assert tags == ["娱乐", "影视"] and confidence < 0.6
+    assert mod.local_tags([user("hello"), assistant("hi"), user("bye")]) == (None, 0.2)
+
+
+def test_parse_json_object():
+    assert mod.parse_json_object('```json\n{"title": "T", "tags": ["a"]}\n```') == {"title": "T", "tags": ["a"]}
+    assert mod.parse_json_object('Sure: {"title": "T"} Hope this helps') == {"title": "T"}
+    for text in ("no json", "[1, 2]", "{bad}", ""):
+        assert mod.parse_json_object(text) == {}
+
+
+def test_prompt_renders_the_last_messages():
+    pipe = mod.Pipe()
+    pipe.valves.prompt = "<chat>\n{{MESSAGES:END:2}}\n</chat>{{MESSAGES}}"
+    messages = [
+        {"role": "system", "content": "s"},
+        user("q1"),
+        assistant('<details type="reasoning">think</details>a1'),
+        user([{"type": "text", "text": "q2"}]),
+    ]
+    prompt, key = pipe._prompt(messages)
+    assert prompt == "<chat>\nASSISTANT: a1\nUSER: q2\n</chat>USER: q1\nASSISTANT: a1\nUSER: q2"
+    assert key == pipe._prompt([dict(m) for m in messages])[1]
+
+
+@pytest.fixture
+def pipe(monkeypatch):
+    calls = []
+
+    async def generate_chat_completion(request, form_data, user, bypass_filter=False):
+        calls.append(form_data)
+        await asyncio.sleep(0.01)
+        content = '{"title": "Model Title", "tags": ["技术"], "follow_ups": ["Why?"]}'
+        return {"choices": [{"message": {"content": content}}]}
+
+    monkeypatch.setattr(mod, "generate_chat_completion", generate_chat_completion)
+    monkeypatch.setitem(chats.CHATS, "named", {"title": "Existing", "meta": {"tags": ["旧标签"]}})
+    pipe = mod.Pipe()
+    pipe.valves.task_model = "task-model"
+    pipe.calls = calls
+    return pipe
+
+
+def run_tasks(pipe, tasks, messages, chat_id="chat"):
+    async def main():
+        return await asyncio.gather(
+            *(
+                pipe.pipe(
+                    {"model": "background-tasks"},
+                    {"id": "u"},
+                    None,
+                    __task__=task,
+                    __task_body__={"chat_id": chat_id, "messages": messages},
+                )
+                for task in tasks
+            )
+        )
+
+    return [json.loads(result) for result in asyncio.run(main())]
+
+
+def test_tasks_share_one_model_call(pipe):
+    pipe.valves.local_generation = False
+    tasks = ["title_generation", "tags_generation", "follow_up_generation"]
+    messages = [user("hi"), assistant("hello")]
+
+    assert run_tasks(pipe, tasks, messages) == [
+        {"title": "Model Title"},
+        {"tags": ["技术"]},
+        {"follow_ups": ["Why?"]},
+    ]
+    assert len(pipe.calls) == 1
+    assert pipe.calls[0]["model"] == "task-model"
+    # Later tasks for the same history reuse the cached result
+    assert run_tasks(pipe, ["title_generation"], messages) == [{"title": "Model Title"}]
+    assert len(pipe.calls) == 1
+
+
+def test_local_results_skip_the_model(pipe):
+    messages = [user("How do I reverse a list in Python?")]
+    assert run_tasks(pipe, ["title_generation", "tags_generation"], messages) == [
+        {"title": "Reverse a List in Python"},
+        {"tags": ["通用"]},
+    ]
+    assert run_tasks(pipe, ["follow_up_generation"], messages) == [{"follow_ups": ["Why?"]}]
+    assert len(pipe.calls) == 1
+
+
+def test_existing_title_and_tags_are_kept(pipe):
+    assert run_tasks(pipe, ["title_generation", "tags_generation"], [user("hi")], chat_id="named") == [
+        {"title": "Existing"},
+        {"tags": ["旧标签"]},
+    ]
+    assert not pipe.calls
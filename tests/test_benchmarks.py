@@ -0,0 +1,77 @@
+"""The benchmark runner: cases run offline, results are compared relative to the reference case."""
+
+import asyncio
+import hashlib
+
+import pytest
+import run
+from harness import FakeBackends
+
+RESULT = {"mean_ms": 2.0, "p95_ms": 4.0, "throughput": 500.0, "peak_kb": 64.0}
+REFERENCE = {"mean_ms": 1.0, "p95_ms": 1.5, "throughput": 1000.0, "peak_kb": 8.0}
+
+
+def test_relative_results():
+    assert run.relative({"reference": REFERENCE, "case": RESULT}) == {
+        "case": {"mean_ms": 2.0, "p95_ms": 4.0, "throughput": 0.5, "peak_kb": 64.0}
+    }
+
+
+def test_compare_flags_regressions_beyond_tolerance(capsys):
+    baseline = {
+        "results": {
+            "same": dict(RESULT),
+            "slower": dict(RESULT),
+            "less_throughput": dict(RESULT),
+            "faster": dict(RESULT),
+        }
+    }
+    results = {
+        "same": dict(RESULT, mean_ms=2.4),
+        "slower": dict(RESULT, p95_ms=6.0),
+        "less_throughput": dict(RESULT, throughput=300.0),
+        "faster": dict(RESULT, mean_ms=1.0, peak_kb=10.0),
+        "new": dict(RESULT),
+    }
+    assert run.compare(results, baseline, tolerance=0.25) == ["slower", "less_throughput"]
+    output = capsys.readouterr().out
+    assert "+50%!" in output and "-40%!" in output and "(new)" in output
+
+
+def test_tiktoken_cached_follows_tiktoken_lookup(tmp_path, monkeypatch):
+    pytest.importorskip("tiktoken")
+    monkeypatch.delenv("DATA_GYM_CACHE_DIR", raising=False)
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    assert not run.tiktoken_cached()
+
+    (tmp_path / hashlib.sha1(run.CL100K_URL.encode()).hexdigest()).write_bytes(b"")
+    assert run.tiktoken_cached()
+
+    # An empty TIKTOKEN_CACHE_DIR disables tiktoken's cache
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", "")
+    monkeypatch.setenv("DATA_GYM_CACHE_DIR", str(tmp_path))
+    assert not run.tiktoken_cached()
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        name
+        for name in run.CASES
+        if run.tiktoken_cached() or not name.startswith(run.TIKTOKEN_CASES)
+    ],
+)
+def test_case_runs_offline(name, monkeypatch):
+    # Any attempt to reach the network fails the case
+    monkeypatch.setattr("socket.getaddrinfo", lambda *args, **kwargs: pytest.fail("network access"))
+
+    async def main():
+        async with FakeBackends() as backends:
+            env = run.Env(backends)
+            call = await run.CASES[name](env)
+            await call()
+            await call()
+            for cleanup in env.cleanups:
+                cleanup()
+
+    asyncio.run(main())
@@ -0,0 +1,201 @@
+"""Calculator: restricted parsing, worker limits, the fast arithmetic path and batch evaluation."""
+
+import asyncio
+import re
+import sys
+
+import pytest
+import sympy as sp
+from harness import load_extension
+
+mod = load_extension("Calculator.py")
+safe_parse = mod.get_batch_evaluator()["safe_parse"]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os')",
+        "x.__class__",
+        "(1).real",
+        "Integer(1).func",
+        "lambda: 1",
+        "open('/etc/passwd')",
+        '"a" * 3',
+        "sin(x",
+    ],
+)
+def test_safe_parse_rejects(expression):
+    with pytest.raises((ValueError, SyntaxError, sp.SympifyError)):
+        safe_parse(sp, expression)
+
+
+def test_safe_parse_has_no_builtins():
+    # Unknown names become undefined SymPy functions, never Python builtins
+    expr = safe_parse(sp, "exec(1) + eval(2)")
+    assert isinstance(expr, sp.Basic)
+    assert {f.func.__name__ for f in expr.atoms(sp.Function)} == {"exec", "eval"}
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("diff(sin(x)*x**2, x)", "x**2*cos(x) + 2*x*sin(x)"),
+        ("integrate(x, (x, 0, 2))", "2"),
+        ("2^10", "1024"),
+        ("sqrt(-4)", "2*I"),
+    ],
+)
+def test_safe_parse_accepts_math(expression, expected):
+    assert str(safe_parse(sp, expression)) == expected
+
+
+@pytest.fixture
+def sandboxed():
+    tools = mod.Tools()
+    tools.valves.FAST_PATH_ENABLED = False
+    tools.valves.CACHE_SIZE = 0
+    yield tools
+    if mod._pool is not None:
+        mod._pool.close()
+        mod._pool = None
+
+
+def test_worker_evaluates_and_rejects(sandboxed):
+    async def main():
+        assert await sandboxed.calculator("2^10") == "2^10 = 1024.00000000000"
+        assert await sandboxed.calculator("__import__('os')") == "Invalid equation"
+
+    asyncio.run(main())
+
+
+def test_worker_time_limit(sandboxed):
+    sandboxed.valves.TIMEOUT = 1.0
+
+    async def main():
+        assert await sandboxed.calculator("factorial(10**8)") == (
+            "Evaluation exceeded the 1s time limit"
+        )
+        # The killed worker is replaced
+        assert await sandboxed.calculator("1+1") == "1+1 = 2.00000000000000"
+
+    asyncio.run(main())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="RLIMIT_AS is not available on Windows")
+def test_worker_memory_limit(sandboxed):
+    sandboxed.valves.TIMEOUT = 30.0
+    sandboxed.valves.MEMORY_LIMIT_MB = 512
+
+    async def main():
+        result = await sandboxed.calculator("Integer(2)**(2**36)")
+        assert "memory limit" in result.lower()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "2+2",
+        "0",
+        "0.0",
+        "-0.5",
+        "0.1+0.2",
+        "1/3",
+        "100/7",
+        "2**-3",
+        "2^10",
+        "2**64",
+        "10**20",
+        "1e-20",
+        "1.5e300*1e10",
+        "123456789*987654321",
+        "(1+0.05/12)**360*2500",
+        "-7//2",
+        "7.5 % 2",
+        "sqrt(2)",
+        "2**0.5",
+        "exp(1)",
+        "E**2",
+        "log(10)",
+        "log(8, 2)",
+        "sin(pi/6)",
+        "tanh(0.5)",
+        "atan2(1, 2)",
+        "factorial(20)",
+        "floor(2.7)",
+        "ceiling(-2.5)",
+        "Abs(-3)",
+        "Max(1, 2.5)",
+    ],
+)
+def test_fast_path_matches_sympy(expression):
+    fast = mod.fast_evaluate(expression)
+    assert fast is not None
+    assert fast == str(safe_parse(sp, expression).evalf())
+
+
+@pytest.mark.parametrize("expression", ["1/0", "sqrt(-1)", "(-8)**(1/3)", "x+1", "2**(10**6)"])
+def test_fast_path_defers_to_sympy(expression):
+    assert mod.fast_evaluate(expression) is None
+
+
+evaluate_batch = mod.get_batch_evaluator()["evaluate_batch"]
+BatchError = mod.get_batch_evaluator()["BatchError"]
+
+
+@pytest.mark.parametrize(
+    "expression, variables, grid, table",
+    [
+        ("x**2", {"x": "1..3"}, False, "x | x**2\n1 | 1\n2 | 4\n3 | 9"),
+        ("x**2", {"x": "0..1..0.5"}, False, "x | x**2\n0 | 0\n0.5 | 0.25\n1 | 1"),
+        ("x**2", {"x": {"start": 0, "stop": 1, "num": 3}}, False, "x | x**2\n0 | 0\n0.5 | 0.25\n1 | 1"),
+        ("x", {"x": "1, 2, 5"}, False, "x | x\n1 | 1\n2 | 2\n5 | 5"),
+        # Single values are broadcast, lists are paired unless grid is set
+        ("x*y", {"x": [1, 2], "y": 10}, False, "x | y | x*y\n1 | 10 | 10\n2 | 10 | 20"),
+        ("x*y", {"x": [1, 2], "y": [3, 4]}, True, "x | y | x*y\n1 | 3 | 3\n1 | 4 | 4\n2 | 3 | 6\n2 | 4 | 8"),
+        ("sqrt(x)", {"x": [-1, 4]}, False, "x | sqrt(x)\n-1 | nan\n4 | 2"),
+    ],
+)
+def test_batch_table(expression, variables, grid, table):
+    assert evaluate_batch(expression, variables, grid=grid) == table
+
+
+def test_batch_summary():
+    lines = evaluate_batch("1/x", {"x": "1..100"}, table_rows=5).splitlines()
+    assert lines[:4] == [
+        "1/x over 100 points",
+        "min: 0.01 at x=100",
+        "max: 1 at x=1",
+        "mean: 0.05187377518, std: 0.1168715126, sum: 5.187377518",
+    ]
+    # The first and last five rows
+    assert lines[5] == "1 | 1" and lines[10] == "..." and lines[-1] == "100 | 0.01"
+
+
+@pytest.mark.parametrize(
+    "expression, variables, error",
+    [
+        ("x*y", {"x": [1, 2], "y": [3, 4, 5]}, "Value lists must have the same length"),
+        ("x+z", {"x": [1]}, "No values given for: z"),
+        ("x", {"x": "1..1000000"}, "has more than 1000 points"),
+        ("x", {"x": "3..1"}, "Empty range"),
+        ("x", {}, "variables must map"),
+        ("__import__('os')", {"x": [1]}, "Invalid equation"),
+    ],
+)
+def test_batch_errors(expression, variables, error):
+    with pytest.raises(BatchError, match=re.escape(error)):
+        evaluate_batch(expression, variables, max_points=1000)
+
+
+@pytest.mark.parametrize("sandbox", [True, False])
+def test_calculate_batch_tool(sandboxed, sandbox):
+    sandboxed.valves.SANDBOX_ENABLED = sandbox
+
+    async def main():
+        assert await sandboxed.calculate_batch("x**2", {"x": "1..3"}) == "x | x**2\n1 | 1\n2 | 4\n3 | 9"
+        assert await sandboxed.calculate_batch("x+z", {"x": [1]}) == "No values given for: z"
+
+    asyncio.run(main())
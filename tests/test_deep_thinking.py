@@ -0,0 +1,89 @@
+"""Deep-Thinking: adaptive budget classification and /think directives."""
+
+import pytest
+from harness import load_extension
+
+mod = load_extension("Deep-Thinking.py")
+
+
+def make_filter(**valves):
+    filt = mod.Filter()
+    filt.valves.mode = "adaptive"
+    filt.valves.log_decisions = False
+    for name, value in valves.items():
+        setattr(filt.valves, name, value)
+    return filt
+
+
+def user(content):
+    return {"messages": [{"role": "user", "content": content}]}
+
+
+@pytest.mark.parametrize(
+    "text, reasons, level",
+    [
+        ("谢谢！", ["trivial"], "off"),
+        ("ok", ["trivial"], "off"),
+        ("What's the capital of France?", [], "off"),
+        ("Translate this to French: hello", ["transform"], "off"),
+        ("帮我翻译：你好", ["transform"], "off"),
+        ("Format this JSON", ["transform"], "off"),
+        ("2+3=?", ["math"], "low"),
+        ("How do I install python", ["reasoning"], "low"),
+        # A greeting followed by a real question is not trivial
+        ("好的，那为什么会这样？", ["reasoning"], "low"),
+        ("证明根号2是无理数", ["math", "reasoning"], "high"),
+        ("Why does my code fail?\n```py\nprint(1)\n```", ["code", "reasoning"], "high"),
+        ("Please translate and explain why: $a^2+b^2=c^2$", ["math", "reasoning", "transform"], "low"),
+    ],
+)
+def test_classify(text, reasons, level):
+    filt = make_filter()
+    score, found = filt.classify(user(text)["messages"])
+    assert found == reasons
+    assert filt._level(score) == level
+
+
+def test_long_prompts_and_deep_conversations_score_higher():
+    filt = make_filter(long_prompt_chars=90, deep_conversation_turns=2)
+    question = "How do I install python? " * 4
+    assert filt.classify(user(question)["messages"]) == (4, ["long", "reasoning"])
+
+    history = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    assert filt.classify(history + user(question)["messages"]) == (5, ["long", "reasoning", "deep"])
+
+
+def test_always_mode_ignores_the_message():
+    filt = make_filter(mode="always")
+    assert filt.inlet(user("ok"))["thinking"] == {"type": "enabled"}
+
+
+def test_budgets():
+    filt = make_filter(low_budget_tokens=1000, high_budget_tokens=0)
+    assert filt.inlet(user("2+3=?"))["thinking"] == {"type": "enabled", "budget_tokens": 1000}
+    assert filt.inlet(user("证明根号2是无理数"))["thinking"] == {"type": "enabled"}
+    assert filt.inlet(user("ok"))["thinking"] == {"type": "disabled"}
+
+
+def test_directive_is_stripped_and_persists_per_chat():
+    filt = make_filter()
+    chat = {"chat_id": "c1"}
+
+    body = filt.inlet(user("/think high ok"), __metadata__=chat)
+    assert body["messages"][0]["content"] == "ok"
+    assert body["thinking"]["type"] == "enabled"
+    assert filt.inlet(user("ok"), __metadata__=chat)["thinking"]["type"] == "enabled"
+    assert filt.inlet(user("ok"), __metadata__={"chat_id": "c2"})["thinking"]["type"] == "disabled"
+
+    body = filt.inlet(user([{"type": "text", "text": "/THINK auto  ok"}]), __metadata__=chat)
+    assert body["messages"][0]["content"] == [{"type": "text", "text": "ok"}]
+    assert body["thinking"]["type"] == "disabled"
+
+
+def test_directive_without_chat_applies_once():
+    filt = make_filter()
+    assert filt.inlet(user("/think off 证明根号2是无理数"))["thinking"] == {"type": "disabled"}
+    assert filt.inlet(user("证明根号2是无理数"))["thinking"]["type"] == "enabled"
+    # Only a leading directive counts
+    body = filt.inlet(user("what does /think high do?"))
+    assert body["messages"][0]["content"] == "what does /think high do?"
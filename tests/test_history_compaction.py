@@ -0,0 +1,106 @@
+"""History-Compaction: which summaries stay valid and how long histories are summarized."""
+
+import asyncio
+
+from conftest import requires_cl100k
+from harness import load_extension
+
+mod = load_extension("History-Compaction.py")
+
+SYSTEM = {"role": "system", "content": "You are helpful."}
+
+
+def turns(n: int, words: int = 5) -> list[dict]:
+    return [
+        message
+        for i in range(n)
+        for message in (
+            {"role": "user", "content": f"question {i} " + "word " * words},
+            {"role": "assistant", "content": f"answer {i} " + "word " * words},
+        )
+    ]
+
+
+def make_filter(**valves):
+    filt = mod.Filter()
+    for name, value in valves.items():
+        setattr(filt.valves, name, value)
+    return filt
+
+
+def test_split_keeps_recent_turns():
+    filt = make_filter(keep_turns=2)
+    system, older, recent = filt._split([SYSTEM] + turns(5))
+    assert system == [SYSTEM]
+    assert [m["content"].split()[:2] for m in older[::2]] == [["question", str(i)] for i in range(3)]
+    assert recent[0]["content"].startswith("question 3") and len(recent) == 4
+
+    assert filt._split([SYSTEM] + turns(2)) == ([SYSTEM], [], turns(2))
+
+
+def test_fingerprint_tracks_role_and_text():
+    messages = turns(2)
+    assert mod.fingerprint(messages) == mod.fingerprint([dict(m) for m in messages])
+    edited = [dict(m) for m in messages]
+    edited[1]["content"] += "!"
+    assert mod.fingerprint(edited) != mod.fingerprint(messages)
+    swapped = [{**m, "role": "user"} for m in messages]
+    assert mod.fingerprint(swapped) != mod.fingerprint(messages)
+    # Multimodal content is fingerprinted by its text parts
+    multimodal = [{**messages[0], "content": [{"type": "text", "text": messages[0]["content"]}]}]
+    assert mod.fingerprint(multimodal) == mod.fingerprint(messages[:1])
+
+
+def test_cached_summary_survives_appends_but_not_edits():
+    filt = make_filter()
+    older = turns(3)
+    filt._summaries["chat"] = {"covered": 4, "fingerprint": mod.fingerprint(older[:4]), "summary": "S"}
+
+    assert filt._cached("chat", older)["summary"] == "S"
+    assert filt._cached("chat", older + turns(1)) is not None
+    assert filt._cached("chat", older[:3]) is None
+
+    edited = [dict(m) for m in older]
+    edited[0]["content"] = "changed"
+    assert filt._cached("chat", edited) is None
+    assert filt._cached("other", older) is None
+
+
+@requires_cl100k
+def test_rolling_summary_then_compacted_inlet(monkeypatch):
+    prompts = []
+
+    async def generate_chat_completion(request, form_data, user, bypass_filter=False):
+        prompt = form_data["messages"][0]["content"]
+        prompts.append(prompt)
+        return {"choices": [{"message": {"content": f"<details>thinking</details>summary {len(prompts)}"}}]}
+
+    monkeypatch.setattr(mod, "generate_chat_completion", generate_chat_completion)
+    filt = make_filter(keep_turns=1, trigger_tokens=50, summary_input_tokens=60, min_new_tokens=1)
+    messages = [SYSTEM] + turns(4, words=10)
+    metadata = {"chat_id": "chat"}
+
+    # No summary yet: the request is sent unchanged
+    body = {"model": "gpt-4", "messages": list(messages)}
+    assert filt.inlet(body, {"id": "u"}, metadata)["messages"] == messages
+
+    async def summarize():
+        await filt.outlet({"model": "gpt-4", "messages": messages}, {"id": "u"}, metadata)
+        await asyncio.gather(*filt._tasks)
+
+    asyncio.run(summarize())
+
+    # Six older messages of ~13 tokens each, at most 60 tokens per request:
+    # several requests, each folding the previous summary in
+    assert len(prompts) > 1
+    assert "{{" not in prompts[0] and "（无）" in prompts[0]
+    for i, prompt in enumerate(prompts[1:], start=1):
+        assert f"summary {i}" in prompt
+    entry = filt._summaries["chat"]
+    assert entry["covered"] == 6 and entry["summary"] == f"summary {len(prompts)}"
+
+    compacted = filt.inlet({"model": "gpt-4", "messages": list(messages)}, {"id": "u"}, metadata)
+    assert compacted["messages"][0] == SYSTEM
+    assert compacted["messages"][1]["role"] == "system"
+    assert f"summary {len(prompts)}" in compacted["messages"][1]["content"]
+    assert compacted["messages"][2:] == messages[-2:]
@@ -0,0 +1,152 @@
+"""Shared runtime: the TTL cache, metrics, pooled clients and the bounded executor."""
+
+import asyncio
+import contextvars
+import time
+
+import owui_runtime as rt
+import pytest
+
+
+def counting_loader(values, delay=0.0):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        value = values[len(calls) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return load, calls
+
+
+def expire(cache, key, ago=0.0):
+    value, _ = cache._entries[key]
+    cache._entries[key] = (value, time.time() - ago)
+
+
+def test_single_flight_and_hits():
+    cache = rt.TTLCache(ttl=60)
+    load, calls = counting_loader(["v1"], delay=0.02)
+
+    async def main():
+        results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(5)))
+        assert results == ["v1"] * 5
+        assert await cache.get_or_load("k", load) == "v1"
+
+    asyncio.run(main())
+    assert len(calls) == 1
+    assert cache.get("k") == "v1"
+
+
+def test_expired_entries_reload():
+    cache = rt.TTLCache(ttl=60)
+    load, calls = counting_loader(["v1", "v2"])
+
+    async def main():
+        await cache.get_or_load("k", load)
+        expire(cache, "k")
+        assert cache.get("k") is None
+        assert await cache.get_or_load("k", load) == "v2"
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_stale_value_is_served_while_refreshing():
+    cache = rt.TTLCache(ttl=60, stale=30)
+    load, calls = counting_loader(["v1", "v2"], delay=0.01)
+
+    async def main():
+        await cache.get_or_load("k", load)
+        expire(cache, "k", ago=1)
+        assert await cache.fetch("k", load) == ("v1", False)
+        await asyncio.sleep(0.05)
+        assert cache.get("k") == "v2"
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_fallback_to_expired_value():
+    cache = rt.TTLCache(ttl=60)
+    load, _ = counting_loader(["v1", ValueError("down"), ValueError("down")])
+
+    async def main():
+        await cache.fetch("k", load)
+        expire(cache, "k", ago=3600)
+        assert await cache.fetch("k", load, fallback_on=(ValueError,)) == ("v1", True)
+        # Errors not listed in fallback_on, and misses without an old value, propagate
+        with pytest.raises(ValueError):
+            await cache.fetch("k", load)
+        with pytest.raises(ValueError):
+            await cache.fetch("other", counting_loader([ValueError("down")])[0], fallback_on=(ValueError,))
+
+    asyncio.run(main())
+
+
+def test_lru_eviction_and_explicit_expiry():
+    cache = rt.TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.set("d", 4, expires_at=time.time() - 1)
+    assert cache.get("d") is None
+    assert cache.pop("c") == 3 and cache.pop("c", "gone") == "gone"
+
+
+def test_cache_counts_go_to_metrics():
+    rt.metrics.reset()
+    cache = rt.TTLCache(name="test")
+    load, _ = counting_loader(["v"])
+
+    async def main():
+        await cache.fetch("k", load)
+        await cache.fetch("k", load)
+
+    asyncio.run(main())
+    snapshot = rt.metrics.snapshot()
+    assert snapshot["test.cache.miss"] == {"count": 1}
+    assert snapshot["test.cache.hit"] == {"count": 1}
+
+
+def test_metrics_snapshot():
+    metrics = rt.Metrics(window=4)
+    for value in (1.0, 2.0, 3.0, 4.0, 10.0):
+        metrics.observe("latency", value)
+    metrics.incr("requests", 2)
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"] == {"count": 2}
+    # Totals cover every sample, percentiles only the window
+    assert snapshot["latency"] == {"count": 5, "total": 20.0, "avg": 4.0, "max": 10.0, "p50": 4.0, "p95": 10.0}
+
+
+def test_http_client_per_loop_and_proxy():
+    async def main():
+        client = rt.get_http_client()
+        assert rt.get_http_client() is client
+        assert rt.get_http_client("http://proxy:3128") is not client
+        await rt.aclose_http_clients()
+        assert client.is_closed
+        assert rt.get_http_client() is not client
+        await rt.aclose_http_clients()
+        return client
+
+    first = asyncio.run(main())
+    second = asyncio.run(main())
+    assert first is not second
+
+
+def test_run_blocking_keeps_context():
+    var = contextvars.ContextVar("var", default=None)
+
+    async def main():
+        var.set("request")
+        return await rt.run_blocking(var.get)
+
+    assert asyncio.run(main()) == "request"
@@ -0,0 +1,121 @@
+"""Time-Inject-Filter: a prefix-stable system block, and exact stripping so injection is idempotent."""
+
+import copy
+from datetime import datetime
+
+import pytest
+from harness import load_extension
+
+mod = load_extension("Time-Inject-Filter.py")
+
+LEGACY_INFO = (
+    "# 以下是时间信息参考\n当前日期：2025-01-02\n当前时间：09:30:15\n"
+    "当前时区：Asia/Shanghai\n当前星期：星期四"
+)
+LEGACY_PRECISE = "（当前时间：2025-01-02 09:30:15，Asia/Shanghai）"
+
+
+def make_filter():
+    filt = mod.Filter()
+    # A fixed clock, so repeated calls inject identical blocks
+    filt._now = lambda: datetime(2026, 10, 18, 9, 41, 7, tzinfo=mod.resolve_timezone("Asia/Shanghai"))
+    return filt
+
+
+def chat(user_content="What day is it?"):
+    return {
+        "messages": [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+            {"role": "user", "content": user_content},
+        ]
+    }
+
+
+@pytest.mark.parametrize("granularity", ["date", "hour", "minute", "second"])
+@pytest.mark.parametrize("to_system", [True, False])
+@pytest.mark.parametrize(
+    "user_content", ["What day is it?", [{"type": "text", "text": "What day is it?"}]]
+)
+def test_injecting_twice_is_idempotent(granularity, to_system, user_content):
+    filt = make_filter()
+    filt.valves.system_time_granularity = granularity
+    filt.valves.inject_to_system = to_system
+
+    once = filt.inlet(chat(user_content))
+    twice = filt.inlet(copy.deepcopy(once))
+    assert twice == once
+    assert twice["messages"][1]["content"] == "Hi"
+
+
+def test_strips_previous_blocks_and_legacy_formats():
+    filt = make_filter()
+    expected = filt.inlet(chat())
+
+    body = chat()
+    body["messages"][0]["content"] = f"You are helpful.\n\n{LEGACY_INFO}"
+    body["messages"][1]["content"] = f"Hi\n\n{LEGACY_PRECISE}"
+    body["messages"][3]["content"] = (
+        "What day is it?\n\n<current_time>2025-01-02 09:30（Asia/Shanghai）</current_time>"
+    )
+    assert filt.inlet(body) == expected
+
+
+def test_prepended_block_is_stripped_from_user_messages():
+    block = make_filter()._get_time_info()
+    assert mod.strip_user(f"{block}\n\nHi") == "Hi"
+    assert mod.strip_user(f"{LEGACY_INFO}\n\nHi") == "Hi"
+    assert mod.strip_user(block) == ""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "当前时间：09:30 — is that right?",
+        f"Quoted:\n{LEGACY_INFO}\nThanks",
+        f"{LEGACY_PRECISE} is when we met",
+        "<current_time>tomorrow</current_time>",
+        f"Before\n{LEGACY_PRECISE}",
+    ],
+)
+def test_user_text_that_only_looks_like_a_block_is_kept(text):
+    assert mod.strip_user(text) == text
+    assert mod.strip_system(text) == text
+
+
+def at(filt, hour, minute):
+    filt._now = lambda: datetime(2026, 10, 18, hour, minute, 7, tzinfo=mod.resolve_timezone("Asia/Shanghai"))
+    return filt
+
+
+def test_system_block_is_stable_for_the_granularity():
+    filt = make_filter()
+    morning = at(filt, 9, 41).inlet(chat())
+    evening = at(filt, 23, 59).inlet(chat())
+    # date granularity: the system prompt stays byte-identical all day
+    assert morning["messages"][0] == evening["messages"][0]
+    assert "当前时间" not in morning["messages"][0]["content"]
+    # The precise time is appended to the latest user message only
+    assert morning["messages"][1:3] == chat()["messages"][1:3]
+    assert morning["messages"][3]["content"] == (
+        "What day is it?\n\n<current_time>2026-10-18 09:41（Asia/Shanghai）</current_time>"
+    )
+
+    filt.valves.system_time_granularity = "hour"
+    assert "当前时间：09:00" in at(filt, 9, 41).inlet(chat())["messages"][0]["content"]
+    assert at(filt, 9, 59).inlet(chat())["messages"][0] == at(filt, 9, 1).inlet(chat())["messages"][0]
+
+
+@pytest.mark.parametrize("granularity, precise", [("second", True), ("date", False)])
+def test_no_user_block_when_not_needed(granularity, precise):
+    filt = make_filter()
+    filt.valves.system_time_granularity = granularity
+    filt.valves.precise_time_in_user = precise
+    assert filt.inlet(chat())["messages"][3]["content"] == "What day is it?"
+
+
+def test_system_message_is_created_when_missing():
+    body = make_filter().inlet({"messages": [{"role": "user", "content": "Hi"}]})
+    assert body["messages"][0]["role"] == "system"
+    assert body["messages"][0]["content"].startswith("<time_info>\n# 以下是时间信息参考")
@@ -0,0 +1,75 @@
+"""Time-Tool: zone lookup and batch conversion."""
+
+import asyncio
+import json
+
+import pytest
+from harness import load_extension
+
+mod = load_extension("Time-Tool.py")
+
+
+@pytest.mark.parametrize(
+    "name, key",
+    [
+        ("Asia/Tokyo", "Asia/Tokyo"),
+        ("asia/tokyo", "Asia/Tokyo"),
+        ("America/New York", "America/New_York"),
+        ("new_york", "America/New_York"),
+        ("Buenos Aires", "America/Argentina/Buenos_Aires"),
+        ("Kolkata", "Asia/Kolkata"),
+        # Close misspellings of city names
+        ("Tokio", "Asia/Tokyo"),
+        ("Londn", "Europe/London"),
+        # Abbreviations follow ZONE_ALIASES, not tzdata's fixed-offset keys
+        ("CST", "Asia/Shanghai"),
+        ("cst", "Asia/Shanghai"),
+        ("EST", "America/New_York"),
+        ("MST", "America/Denver"),
+        ("GMT", "UTC"),
+        ("悉尼", "Australia/Sydney"),
+        ("UTC+8", "UTC+08:00"),
+        ("utc-05:30", "UTC-05:30"),
+        ("+0530", "UTC+05:30"),
+        ("GMT+14", "UTC+14:00"),
+    ],
+)
+def test_resolve(name, key):
+    resolved = mod.ZoneRegistry().resolve(name)
+    assert resolved is not None and resolved[0] == key
+
+
+@pytest.mark.parametrize("name", ["", "Nowhere", "UTC+15"])
+def test_resolve_unknown(name):
+    assert mod.ZoneRegistry().resolve(name) is None
+
+
+def test_get_times_converts_a_given_time():
+    result = json.loads(
+        asyncio.run(
+            mod.Tools().get_times(
+                ["Asia/Tokyo", "New York", "EST", "Mars"],
+                time="2025-07-01 09:30",
+                source_timezone="Asia/Shanghai",
+            )
+        )
+    )
+    assert result == {
+        "source": "Asia/Shanghai 2025-07-01 09:30 Tue +08:00",
+        "times": {
+            "Asia/Tokyo": "2025-07-01 10:30 Tue +09:00",
+            "New York (America/New_York)": "2025-06-30 21:30 Mon -04:00",
+            "EST (America/New_York)": "2025-06-30 21:30 Mon -04:00",
+        },
+        "unresolved": ["Mars"],
+    }
+
+
+def test_get_times_errors():
+    tools = mod.Tools()
+    assert json.loads(asyncio.run(tools.get_times(["UTC"], source_timezone="Mars"))) == {
+        "error": "Unknown timezone: Mars"
+    }
+    assert json.loads(asyncio.run(tools.get_times(["UTC"], time="noon"))) == {
+        "error": "Unrecognized time: noon"
+    }
@@ -0,0 +1,101 @@
+"""Tool-Result-Digest against the real output of the tools it digests."""
+
+import asyncio
+import json
+
+import pytest
+from harness import EventRecorder, FakeBackends, load_extension
+
+digest_mod = load_extension("Tool-Result-Digest.py")
+search_mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+weather_mod = load_extension("Weather/Weather.py")
+
+
+def run_tool(call):
+    async def main():
+        async with FakeBackends() as backends:
+            return await call(backends)
+
+    return asyncio.run(main())
+
+
+def digest(name: str, text: str) -> list[str]:
+    lines = digest_mod.Filter()._digest(name, text, 1000).splitlines()
+    assert lines[0].startswith(digest_mod.DIGEST_MARK)
+    return lines[1:]
+
+
+def fetch(mode: str) -> str:
+    tools = search_mod.Tools()
+    tools.valves.PAGE_CACHE_ENABLED = False
+    tools.valves.FETCH_LOADER = "streaming"
+    tools.valves.FETCH_MODE = mode
+    return run_tool(
+        lambda b: tools.fetch_url_content(
+            f"{b.base_url}/page",
+            focus="lazy dog",
+            __event_emitter__=EventRecorder(),
+            __user__={"id": "test"},
+        )
+    )
+
+
+def test_web_search_lists_titles_and_sources():
+    tools = search_mod.Tools()
+    result = run_tool(
+        lambda b: tools.web_search(
+            search_queries=["pooling"], __event_emitter__=EventRecorder(), __user__={"id": "test"}
+        )
+    )
+    data = json.loads(result)
+    lines = digest("web_search", result)
+
+    assert lines[0] == f"共 {data['result_count']} 条结果"
+    first = data["results"][0]
+    assert lines[1].startswith(f"- {first['title']} <{first['source']}>")
+
+
+def test_fetch_passages_keeps_passage_text():
+    result = fetch("passages")
+    data = json.loads(result)
+    assert data["passages"]
+    lines = digest("fetch_url_content", result)
+
+    assert lines[0] == f"Bench Page <{data['url']}>"
+    opening = lines[1].removeprefix("开头：")
+    assert opening and opening[:40] in data["passages"][0]["content"]
+    assert any(line.startswith("- Paragraph") for line in lines[2:])
+
+
+def test_fetch_full_uses_document_title():
+    result = fetch("full")
+    data = json.loads(result)
+    lines = digest("fetch_url_content", result)
+
+    assert lines[0] == f"Bench Page <{data['url']}>"
+    assert lines[1].removeprefix("开头：")[:40] in data["content"]
+
+
+def test_fetch_error_is_kept_verbatim():
+    result = json.dumps({"status": "error", "url": "https://x", "error": "timeout"})
+    assert digest("fetch_url_content", result) == [result]
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_weather_keeps_leading_lines(batch):
+    async def call(backends):
+        weather_mod.AMAP_WEATHER_URL = f"{backends.base_url}/v3/weather/weatherInfo"
+        tools = weather_mod.Tools()
+        tools.valves.AMAP_API_KEY = "test"
+        tools.valves.QPS_LIMIT = 0
+        tools.valves.CACHE_ENABLED = False
+        if batch:
+            return await tools.get_weather_batch(["杭州", "北京"], forecast=True)
+        return await tools.get_weather("杭州")
+
+    result = run_tool(call)
+    lines = digest("get_weather_batch" if batch else "get_weather", result)
+
+    source = [line for line in result.splitlines() if line.strip()]
+    assert lines[0] == source[0]
+    assert lines[1] == source[1]
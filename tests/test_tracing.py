@@ -0,0 +1,93 @@
+"""Tracing spans: nesting, shared trace ids per chat turn and the OTLP/JSON export."""
+
+import json
+
+import owui_runtime as rt
+import pytest
+from harness import load_extension
+
+
+@pytest.fixture
+def traced(tmp_path):
+    """The runtime's tracer, writing to a file for the duration of the test."""
+    path = tmp_path / "spans.jsonl"
+    rt.tracer.configure(file=str(path), service_name="tests")
+
+    def spans():
+        rt.tracer.flush()
+        lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+        return [
+            span
+            for line in lines
+            for resource in json.loads(line)["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        ]
+
+    yield spans
+    rt.tracer.configure()
+
+
+def attributes(span):
+    return {a["key"]: next(iter(a["value"].values())) for a in span["attributes"]}
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = rt.Tracer()
+    with tracer.span("noop", {"chat_id": "c"}) as span:
+        span.set_attribute("k", "v")
+    assert span is rt._NOOP_SPAN
+    assert not tracer._buffer
+
+
+def test_nested_spans_and_attributes(traced):
+    metadata = {"chat_id": "c1", "message_id": "m1"}
+    with rt.span("outer", metadata, count=3, ratio=0.5, cached=True, skipped=None):
+        with rt.span("inner") as inner:
+            inner.set_attribute("url", "https://example.com")
+    with pytest.raises(ValueError):
+        with rt.span("failing", metadata):
+            raise ValueError("boom")
+
+    inner, outer, failing = traced()
+    trace_id = rt.trace_id_for("c1", "m1")
+    assert outer["traceId"] == inner["traceId"] == failing["traceId"] == trace_id
+    assert inner["parentSpanId"] == outer["spanId"] and "parentSpanId" not in outer
+    assert attributes(outer) == {
+        "count": "3",
+        "ratio": 0.5,
+        "cached": True,
+        "chat.id": "c1",
+        "message.id": "m1",
+    }
+    assert attributes(inner) == {"url": "https://example.com"}
+    assert outer["status"] == {"code": 1}
+    assert failing["status"] == {"code": 2, "message": "ValueError: boom"}
+    assert int(outer["startTimeUnixNano"]) <= int(inner["startTimeUnixNano"])
+    assert int(inner["endTimeUnixNano"]) <= int(outer["endTimeUnixNano"])
+
+
+def test_spans_from_different_extensions_share_the_turn_trace(traced):
+    deep_thinking = load_extension("Deep-Thinking.py")
+    time_inject = load_extension("Time-Inject-Filter.py")
+    metadata = {"chat_id": "c1", "message_id": "m1"}
+    body = {"messages": [{"role": "user", "content": "hi"}]}
+
+    time_inject.Filter().inlet(body, __metadata__=metadata)
+    deep_thinking.Filter().inlet(body, __metadata__=metadata)
+    deep_thinking.Filter().inlet(body, __metadata__={"chat_id": "c1", "message_id": "m2"})
+
+    spans = traced()
+    assert [s["name"] for s in spans] == ["time_inject.inlet", "deep_thinking.inlet", "deep_thinking.inlet"]
+    assert spans[0]["traceId"] == spans[1]["traceId"] != spans[2]["traceId"]
+
+
+def test_recorded_spans(traced):
+    with rt.span("stream", {"chat_id": "c1"}) as parent:
+        rt.tracer.record("first_token", 1_000, 2_000, parent=parent, tokens=1)
+    rt.tracer.record("detached", 3_000, 4_000, {"chat_id": "c1"})
+
+    first, stream, detached = traced()
+    assert first["parentSpanId"] == stream["spanId"]
+    assert (first["startTimeUnixNano"], first["endTimeUnixNano"]) == ("1000", "2000")
+    assert detached["traceId"] == stream["traceId"] and "parentSpanId" not in detached
@@ -0,0 +1,228 @@
+"""Weather: city lookup, output formats, and caching with and without the shared runtime."""
+
+import asyncio
+import base64
+import json
+import lzma
+import time
+from pathlib import Path
+
+import pytest
+from harness import FakeBackends, load_extension
+
+
+def make_tools(mod, backends):
+    mod.AMAP_WEATHER_URL = f"{backends.base_url}/v3/weather/weatherInfo"
+    tools = mod.Tools()
+    tools.valves.AMAP_API_KEY = "test"
+    tools.valves.QPS_LIMIT = 0
+    fetches = []
+    fetch = tools._fetch_weather
+
+    async def counted(adcode, forecast):
+        fetches.append(adcode)
+        return await fetch(adcode, forecast)
+
+    tools._fetch_weather = counted
+    return tools, fetches
+
+
+def test_uses_runtime_cache_when_installed():
+    mod = load_extension("Weather/Weather.py")
+    assert type(mod._weather_cache).__name__ == "TTLCache"
+
+
+def test_standalone_cache_merges_and_reuses_requests(standalone):
+    mod = standalone("Weather/Weather.py")
+    assert isinstance(mod._weather_cache, mod.WeatherCache)
+
+    async def main():
+        async with FakeBackends(latency=0.05) as backends:
+            tools, fetches = make_tools(mod, backends)
+            results = await asyncio.gather(*(tools.get_weather("杭州") for _ in range(5)))
+            assert len(set(results)) == 1
+            assert len(fetches) == 1
+            await tools.get_weather("杭州")
+            assert len(fetches) == 1
+
+    asyncio.run(main())
+
+
+def test_standalone_cache_falls_back_to_expired_data(standalone):
+    mod = standalone("Weather/Weather.py")
+
+    async def main():
+        async with FakeBackends() as backends:
+            tools, fetches = make_tools(mod, backends)
+            tools.valves.CACHE_STALE_SECONDS = 0
+            data, fell_back = await tools._get_weather_data("330100", False)
+            assert not fell_back
+
+            key = ("330100", "base")
+            mod._weather_cache.entries[key] = (data, time.time() - 1)
+
+            async def failing(adcode, forecast):
+                raise mod.AMapError({"error": "DAILY_QUERY_OVER_LIMIT"})
+
+            tools._fetch_weather = failing
+            assert await tools._get_weather_data("330100", False) == (data, True)
+
+            mod._weather_cache.entries.clear()
+            with pytest.raises(mod.AMapError):
+                await tools._get_weather_data("330100", False)
+
+    asyncio.run(main())
+
+
+def test_standalone_client_follows_pool_size(standalone):
+    mod = standalone("Weather/Weather.py")
+
+    async def main():
+        client = mod.amap_client(10)
+        assert mod.amap_client(10) is client
+        resized = mod.amap_client(4)
+        assert resized is not client
+        await asyncio.sleep(0)
+        assert client.is_closed
+        await resized.aclose()
+
+    asyncio.run(main())
+
+
+def builtin_index(mod) -> str:
+    return lzma.decompress(base64.b64decode(mod.ADCODE_INDEX_DATA)).decode("utf-8")
+
+
+def test_builtin_index_matches_tsv():
+    # build_adcode_index.py writes both; a hand edit to either one breaks this
+    mod = load_extension("Weather/Weather.py")
+    tsv = Path(__file__).resolve().parent.parent / "Weather" / "adcode_index.tsv"
+    assert builtin_index(mod) == tsv.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [("深圳市", "深圳"), ("朝阳区", "朝阳"), ("内蒙古自治区", "内蒙古"), ("市", "市"), ("东区", "东区")],
+)
+def test_strip_region_suffix(name, expected):
+    mod = load_extension("Weather/Weather.py")
+    assert mod.strip_region_suffix(name) == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("杭州", ["330100"]),
+        (" 杭州市 ", ["330100"]),
+        ("Hang Zhou", ["330100"]),
+        ("长子", ["140428"]),
+        ("zhangzi", ["140428"]),
+        # Same-named places: higher administrative level first
+        ("朝阳", ["211300", "110105", "211321", "220104"]),
+        # Pinyin also matches homophones (潮阳区)
+        ("chaoyang", ["211300", "110105", "211321", "220104", "440513"]),
+        # A parent prefix narrows the candidates
+        ("北京朝阳", ["110105"]),
+        ("辽宁朝阳", ["211300", "211321"]),
+        ("浙江西湖", ["330106"]),
+        ("广东省深圳市", ["440300"]),
+        ("香港特别行政区", ["810000"]),
+        ("不存在", []),
+        ("nowhere", []),
+        ("", []),
+    ],
+)
+def test_adcode_lookup(query, expected):
+    mod = load_extension("Weather/Weather.py")
+    index = mod.AdcodeIndex.from_tsv(builtin_index(mod))
+    assert [adcode for _, adcode in index.lookup(query)] == expected
+
+
+def query(call, **valves):
+    mod = load_extension("Weather/Weather.py")
+
+    async def main():
+        async with FakeBackends() as backends:
+            tools, fetches = make_tools(mod, backends)
+            tools.valves.CACHE_ENABLED = False
+            for name, value in valves.items():
+                setattr(tools.valves, name, value)
+            return await call(tools), fetches
+
+    return asyncio.run(main())
+
+
+def test_compact_live_weather():
+    result, _ = query(lambda tools: tools.get_weather("杭州"))
+    assert result == "实时天气|北京 东城区\n晴|21°C|南风≤3级|湿度40%|10-18 10:00"
+
+
+def test_compact_forecast_merges_equal_day_and_night_values():
+    result, _ = query(lambda tools: tools.get_weather("杭州", forecast=True))
+    assert result.splitlines()[:3] == [
+        "天气预报|北京 北京市|更新10-18 08:00|天气/温度/风为白天/夜间",
+        "日期|星期|天气|温度|风",
+        "10-18|一|晴/多云|22/10°C|北风1-3级",
+    ]
+    assert len(result.splitlines()) == 6
+
+
+def test_compact_output_keeps_notes():
+    result, _ = query(lambda tools: tools.get_weather("朝阳"))
+    assert result.splitlines()[2].startswith("说明：“朝阳”匹配到多个地区，已选择朝阳市；其他候选：朝阳区(110105)")
+
+
+def test_json_output():
+    result, _ = query(lambda tools: tools.get_weather("杭州"), OUTPUT_FORMAT="json")
+    assert json.loads(result) == {
+        "类型": "实时天气",
+        "省份": "北京",
+        "城市": "东城区",
+        "天气": "晴",
+        "温度": "21°C",
+        "风向": "南",
+        "风力": "≤3级",
+        "湿度": "40%",
+        "更新时间": "2026-10-18 10:00:00",
+    }
+
+
+def test_batch_dedupes_cities_and_reports_errors_inline():
+    result, fetches = query(lambda tools: tools.get_weather_batch(["杭州", "北京", " 杭州", "火星"]))
+    assert result.splitlines() == [
+        "批量实时天气",
+        "查询|地区|天气|温度|风|湿度|更新",
+        "杭州|北京 东城区|晴|21°C|南风≤3级|湿度40%|10-18 10:00",
+        "北京|北京 东城区|晴|21°C|南风≤3级|湿度40%|10-18 10:00",
+        "火星|错误：未找到城市：火星",
+    ]
+    # An unknown city costs no API call
+    assert sorted(fetches) == ["110000", "330100"]
+
+
+def test_batch_forecast_has_one_row_per_city_and_day():
+    result, _ = query(lambda tools: tools.get_weather_batch(["杭州", "北京"], forecast=True))
+    lines = result.splitlines()
+    assert lines[:3] == [
+        "批量天气预报|天气/温度/风为白天/夜间",
+        "查询|日期|星期|天气|温度|风",
+        "杭州|10-18|一|晴/多云|22/10°C|北风1-3级",
+    ]
+    assert [line.split("|")[0] for line in lines[2:]] == ["杭州"] * 4 + ["北京"] * 4
+
+
+def test_batch_limits():
+    result, fetches = query(lambda tools: tools.get_weather_batch(["杭州", "北京"]), MAX_BATCH_CITIES=1)
+    assert result.splitlines()[-1] == "说明：单次最多查询1个城市，未查询：北京"
+    assert fetches == ["330100"]
+
+    result, _ = query(lambda tools: tools.get_weather_batch([" ", ""]))
+    assert json.loads(result) == {"error": "请至少提供一个城市"}
+
+
+def test_batch_json_output():
+    result, _ = query(lambda tools: tools.get_weather_batch(["杭州", "火星"]), OUTPUT_FORMAT="json")
+    data = json.loads(result)
+    assert data["类型"] == "批量实时天气"
+    assert data["结果"][0]["查询"] == "杭州" and data["结果"][0]["天气"] == "晴"
+    assert data["结果"][1] == {"查询": "火星", "error": "未找到城市：火星"}
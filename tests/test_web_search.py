@@ -0,0 +1,285 @@
+"""Auto-Web-Search helpers."""
+
+import asyncio
+import json
+import os
+from functools import partial
+
+import pytest
+from harness import EventRecorder, FakeBackends, load_extension
+from open_webui.models.users import UserModel, Users
+
+
+def test_standalone_user_cache(standalone, monkeypatch):
+    mod = standalone("Auto-Web-Search/Auto-Web-Search-Native.py")
+    lookups = []
+
+    def get_user_by_id(user_id):
+        lookups.append(user_id)
+        return UserModel(id=user_id) if user_id != "missing" else None
+
+    monkeypatch.setattr(Users, "get_user_by_id", staticmethod(get_user_by_id))
+
+    async def main():
+        for _ in range(3):
+            assert (await mod.get_user("u1", 5.0)).id == "u1"
+        assert lookups == ["u1"]
+
+        # Misses are not cached, and ttl 0 always reads the database
+        assert await mod.get_user("missing", 5.0) is None
+        assert await mod.get_user("missing", 5.0) is None
+        await mod.get_user("u1", 0)
+        assert lookups == ["u1", "missing", "missing", "u1"]
+
+        # Entries expire after ttl
+        mod._users["u1"] = (mod._users["u1"][0], 0.0)
+        await mod.get_user("u1", 5.0)
+        assert lookups[-1] == "u1" and len(lookups) == 5
+
+    asyncio.run(main())
+
+
+def test_standalone_streaming_fetch(standalone):
+    mod = standalone("Auto-Web-Search/Auto-Web-Search-Native.py")
+    tools = mod.Tools()
+    tools.valves.PAGE_CACHE_ENABLED = False
+    tools.valves.FETCH_LOADER = "streaming"
+
+    async def main():
+        async with FakeBackends() as backends:
+            return await tools.fetch_url_content(
+                f"{backends.base_url}/page", __event_emitter__=EventRecorder(), __user__={"id": "u1"}
+            )
+
+    data = json.loads(asyncio.run(main()))
+    assert data["status"] == "success"
+    assert data["content"].startswith("Paragraph 0:")
+
+
+def test_page_cache_revalidates_streaming_pages_only(tmp_path):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    cache = mod.PageCache(os.path.join(tmp_path, "pages.sqlite3"), 1 << 20)
+    loads = []
+
+    def counted(loader):
+        async def load(url):
+            loads.append(url)
+            return await loader(url)
+
+        return load
+
+    async def main():
+        async with FakeBackends() as backends:
+            url = f"{backends.base_url}/page"
+            streaming = counted(
+                partial(mod.load_streaming_page, max_bytes=1 << 20, max_chars=1 << 20, timeout=5)
+            )
+            await mod.load_page(url, cache=cache, max_age=0, loader=streaming)
+            assert cache.get(mod.canonicalize_url(url))["etag"] == backends.PAGE_ETAG
+            # Expired, but the origin answers 304: served from the cache
+            content, _ = await mod.load_page(url, cache=cache, max_age=0, loader=streaming)
+            assert content.startswith("Paragraph 0:") and len(loads) == 1
+
+            native_url = "https://example.com/native"
+            native = counted(partial(mod.load_native_page, max_chars=1 << 20))
+            await mod.load_page(native_url, cache=cache, max_age=0, loader=native)
+            entry = cache.get(mod.canonicalize_url(native_url))
+            assert entry["etag"] is None and entry["last_modified"] is None
+            # No validators: an expired native page is simply fetched again
+            await mod.load_page(native_url, cache=cache, max_age=0, loader=native)
+            assert loads.count(native_url) == 2
+
+    asyncio.run(main())
+
+
+def test_truncate_docs_flags_only_the_cut_document():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    docs = [mod.Document(page_content=c * 10, metadata={"i": i}) for i, c in enumerate("abc")]
+    content = "".join(d.page_content for d in docs)
+
+    text, kept = mod.truncate_docs(content, docs, 15)
+    assert text == "a" * 10 + "b" * 5
+    assert [d.page_content for d in kept] == ["a" * 10, "b" * 5]
+    assert [d.metadata for d in kept] == [{"i": 0}, {"i": 1, "truncated": True}]
+
+    assert mod.truncate_docs(content, docs, 30) == (content, docs)
+
+
+def test_tokenize_words_and_cjk_bigrams():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    assert mod.tokenize("Connection Pooling 连接池复用 café x_y") == [
+        "connection", "pooling", "连接", "接池", "池复", "复用", "café", "x", "y",
+    ]
+
+
+def test_split_passages_respects_size_and_boundaries():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    text = "Para one.\n\nPara two is here.\n" + "Long sentence. " * 10 + "\n" + "x" * 95
+    passages = mod.split_passages(text, 40)
+    assert passages[0] == "Para one.\nPara two is here."
+    assert passages[1] == "Long sentence.\nLong sentence."
+    assert all(len(p) <= 40 for p in passages)
+    assert "".join(passages).count("x") == 95
+
+
+def test_select_passages_ranks_and_budgets():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    text = "Intro text.\n\nConnection pooling cuts latency.\n\nUnrelated cooking tips.\n\nMore pooling notes."
+
+    passages, total = mod.select_passages(text, "connection pooling", 5, 1000, 40)
+    assert total == 4
+    # Only matching passages, best first by score but returned in page order
+    assert [p["index"] for p in passages] == [1, 3]
+    assert passages[0]["score"] > passages[1]["score"] > 0
+    assert passages[0]["content"] == "Connection pooling cuts latency."
+
+    assert [p["index"] for p in mod.select_passages(text, "connection pooling", 1, 1000, 40)[0]] == [1]
+    # No match or no query: the leading passages
+    assert [p["index"] for p in mod.select_passages(text, "zzz", 2, 1000, 40)[0]] == [0, 1]
+    assert [p["index"] for p in mod.select_passages(text, None, 2, 1000, 40)[0]] == [0, 1]
+    # The token budget skips passages that do not fit, but always keeps one
+    long = "a " * 100 + "\n\n" + "b " * 100
+    assert [p["index"] for p in mod.select_passages(long, None, 5, 30, 250)[0]] == [0]
+    assert mod.select_passages("", "q", 5, 1000, 40) == ([], 0)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTP://Example.COM:80/a/?utm_source=x&b=2&a=1#frag", "http://example.com/a?a=1&b=2"),
+        ("https://example.com:443", "https://example.com/"),
+        ("https://example.com:8443/x/", "https://example.com:8443/x"),
+        ("https://example.com/p?fbclid=1&gclid=2&q=", "https://example.com/p?q="),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    assert mod.canonicalize_url(url) == expected
+
+
+def test_result_key_folds_scheme_and_alias_hosts():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    key = mod.result_key("https://example.com/a?b=1")
+    assert mod.result_key("http://www.example.com/a?b=1") == key
+    assert mod.result_key("https://m.example.com/a/?b=1&utm_medium=y") == key
+    # A two-label host keeps its prefix
+    assert mod.result_key("https://www.co/a") == "https://www.co/a"
+
+
+def test_merge_search_results():
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    merged = mod.merge_search_results(
+        [
+            {"source": "http://m.example.com/a", "title": "", "content": "short", "queries": ["q1"]},
+            {"source": "https://www.example.com/a/", "title": "T", "content": "longer snippet", "queries": ["q2"]},
+            {"source": "https://other.com", "title": "O", "content": "x" * 50},
+        ],
+        ["q1", "q2"],
+        max_snippet_chars=10,
+        max_total_chars=15,
+    )
+    assert merged == [
+        # https and the desktop host win; the longest snippet and all queries are kept
+        {"source": "https://www.example.com/a/", "title": "T", "content": "longer sni…", "queries": ["q1", "q2"]},
+        # The first snippet and its ellipsis leave 4 characters of the overall budget
+        {"source": "https://other.com", "title": "O", "content": "xxxx…"},
+    ]
+
+
+def extract(page: str, max_chars: int = 1000, chunk: int = 0, **kwargs):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    extractor = mod.TextExtractor(max_chars, **kwargs)
+    step = chunk or len(page)
+    for start in range(0, len(page), step):
+        extractor.feed(page[start : start + step])
+    if extractor.html:
+        extractor.close()
+    return extractor
+
+
+PAGE = (
+    "<html><head><title>T &amp; U</title><style>p { color: red }</style></head>"
+    "<body><p>Hello   <b>world</b></p><script>bad()</script>"
+    "<ul><li>one</li><li>two</li></ul>&lt;ok&gt;</body></html>"
+)
+
+
+@pytest.mark.parametrize("chunk", [0, 1, 7])
+def test_text_extractor(chunk):
+    # Feeding the page in small pieces, as the streaming loader does, changes nothing
+    extractor = extract(PAGE, chunk=chunk)
+    assert extractor.title == "T & U"
+    assert extractor.text() == "Hello world\none\ntwo\n<ok>"
+    assert not extractor.full
+
+
+def test_text_extractor_stops_at_max_chars():
+    extractor = extract("<p>Hello world</p><p>never read</p>", max_chars=8)
+    assert extractor.full
+    assert extractor.text() == "Hello w"
+
+
+def test_text_extractor_plain_text():
+    extractor = extract("a <b> c", max_chars=100, html=False)
+    assert extractor.text() == "a <b> c"
+    assert not extractor.full
+
+
+def fake_search(mod, monkeypatch, delays):
+    """Replace the search engine: each query answers after its delay, or fails if the delay is None."""
+
+    async def search(request, queries, user):
+        results = []
+        for query in queries:
+            if delays[query] is None:
+                raise RuntimeError(f"engine error for {query}")
+            await asyncio.sleep(delays[query])
+            results.append({"link": f"https://example.com/{query}", "title": query, "snippet": f"about {query}"})
+        return {"items": results}
+
+    monkeypatch.setattr(mod, "search", search)
+
+
+def run_search(mod, queries, **kwargs):
+    emitter = EventRecorder(keep=True)
+    result = asyncio.run(
+        mod.native_web_search(queries, emitter=emitter, user=UserModel(id="u1"), **kwargs)
+    )
+    citations = [e["data"]["metadata"] for e in emitter.events if e["type"] == "citation"]
+    return json.loads(result), citations
+
+
+def test_per_query_search_streams_and_reports_partial_results(monkeypatch):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    fake_search(mod, monkeypatch, {"fast": 0, "slower": 0.05, "broken": None, "stuck": 5})
+
+    data, citations = run_search(mod, ["fast", "slower", "broken", "stuck"], per_query=True, deadline=0.5)
+    assert [r["source"] for r in data["results"]] == ["https://example.com/fast", "https://example.com/slower"]
+    assert data["failed_queries"] == ["broken"]
+    assert data["timed_out_queries"] == ["stuck"]
+    # One citation event per finished query, in completion order
+    assert [[m["source"] for m in c] for c in citations] == [
+        ["https://example.com/fast"],
+        ["https://example.com/slower"],
+    ]
+
+
+def test_search_deadline_without_results(monkeypatch):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    fake_search(mod, monkeypatch, {"a": 5, "b": 5})
+
+    for per_query in (True, False):
+        data, _ = run_search(mod, ["a", "b"], per_query=per_query, deadline=0.05)
+        assert data == {
+            "status": "web search timed out",
+            "error": "no results within 0.05 seconds",
+            "timed_out_queries": ["a", "b"],
+        }
+
+
+def test_per_query_search_fails_when_every_query_fails(monkeypatch):
+    mod = load_extension("Auto-Web-Search/Auto-Web-Search-Native.py")
+    fake_search(mod, monkeypatch, {"a": None, "b": None})
+
+    data, _ = run_search(mod, ["a", "b"], per_query=True)
+    assert data == {"status": "web search failed", "error": "all search queries failed"}